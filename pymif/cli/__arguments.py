@@ -1,6 +1,7 @@
 __all__ = ['_parse_arguments']
 
 import argparse
+import glob
 import os
 import re
 import textwrap
@@ -24,6 +25,8 @@ def valid_input_path(x):
     if x is not None:
         if os.path.isdir(x) or os.path.isfile(x):
             return os.path.abspath(x)
+        if glob.has_magic(x) and glob.glob(x):
+            return os.path.abspath(x)
         raise argparse.ArgumentTypeError(f'Input path {x} is not a valid directory')
     return None
 
@@ -206,7 +209,7 @@ def _parse_arguments():
     subparsers = parser.add_subparsers(
         title='Runmodes',
         description= """\
-            PyMIF has TWO main runmodes, each with different and specific arguments.
+            PyMIF has FIVE main runmodes, each with different and specific arguments.
             Please consult each runmode's help manual before running any of them.
             Enjoy PyMIF!
         """,
@@ -233,7 +236,7 @@ def _parse_arguments():
         required=False,
         default=None,
         help='Microscope used for imaging. Leave empty to auto-detect from the input path.',
-        choices=['luxendo', 'opera', 'viventis', 'opera', 'zeiss', 'zarrv04', 'zarr', 'scape'],
+        choices=['luxendo', 'opera', 'viventis', 'opera', 'zeiss', 'zarrv04', 'zarr', 'scape', 'tiff'],
         type=str,
     )
     single_convert_parser.add_argument(
@@ -296,13 +299,63 @@ def _parse_arguments():
         type=str,
         help='Subset the input before pyramid generation. Format: axis=selection pairs separated by semicolons, e.g. "y=10:100:2;x=20:80". Use integers, comma-separated indices, or slices like 0:10:2.',
     )
+    single_convert_parser.add_argument(
+        '-rp', '--read_processes',
+        required=False,
+        type=int,
+        help='Number of processes decoding HDF5 blocks (luxendo only). By default blocks are decoded by the writer threads.',
+    )
+    single_convert_parser.add_argument(
+        '-as', '--all_scenes',
+        action='store_true',
+        help='Convert every scene of a .czi file in one pass. --scene_index is ignored.',
+    )
+    single_convert_parser.add_argument(
+        '-sl', '--scenes_layout',
+        required=False,
+        default='stores',
+        choices=['stores', 'groups'],
+        type=str,
+        help='With --all_scenes: "stores" writes one <scene>.zarr per scene into the --zarr_path folder, "groups" writes the first scene at the root of --zarr_path and the other scenes as image subgroups.',
+    )
+    single_convert_parser.add_argument(
+        '-sw', '--scene_workers',
+        required=False,
+        type=int,
+        help='With --all_scenes: maximum number of scenes written concurrently. Defaults to the number of CPUs.',
+    )
+    single_convert_parser.add_argument(
+        '-mb', '--memory_budget',
+        required=False,
+        type=float,
+        help='With --all_scenes: memory in MB shared by the scenes being written concurrently.',
+    )
+    single_convert_parser.add_argument(
+        '-ap', '--access_pattern',
+        required=False,
+        choices=['napari-2D', '3D-analysis', 'time-series'],
+        type=str,
+        help='Pick chunk and shard shapes for how the output will be read, aligned to the source blocks: YX tiles one plane deep ("napari-2D"), physically cubic chunks ("3D-analysis") or chunks spanning many timepoints ("time-series"). Ignored if --chunk_size is provided; --max_size caps the chunk size.',
+    )
+    single_convert_parser.add_argument(
+        '-st', '--storage',
+        required=False,
+        choices=['local', 'network', 'object'],
+        type=str,
+        help='Storage the output is written to, used with --access_pattern (default "3D-analysis" when only --storage is given): sets the chunk size budget and, for zarr v3, groups small or numerous chunks into shards.',
+    )
+    single_convert_parser.add_argument(
+        '-p', '--plan',
+        action='store_true',
+        help='Dry run: print the chunk shape, pyramid, chunks per level, estimated output size, peak memory and runtime (from a few sampled chunks) without writing the output.',
+    )
 
     # Required args
     requiredNamed = single_convert_parser.add_argument_group('Required Named arguments.')
     requiredNamed.add_argument(
         '-i', '--input_path',
         required= True,
-        help= 'Path to input file.',
+        help= 'Path to input file. A quoted glob pattern (e.g. "stack_t*.tif") reads a sequence of TIFF stacks.',
         type= valid_input_path
     )
     requiredNamed.add_argument(
@@ -323,6 +376,12 @@ def _parse_arguments():
         ...
         /path/to/input_n   | viventis    | /path/to/zarr_n  | 1 1 2 512 512 |              | 0           | 3           | 2                |                                |                |               | 2
         channel_colors can be hex code or valid matplotlib colors.
+        Optional access_pattern (napari-2D, 3D-analysis, time-series) and storage
+        (local, network, object) columns select chunks and shards with the chunk
+        planner for rows without chunk_size, as --access_pattern/--storage in 2zarr.
+        Rows are converted concurrently, largest first: each conversion gets a
+        share of the CPUs and of the memory budget according to its estimated
+        size, writes its own log, and a failed row does not stop the others.
     """
     batch_convert_parser = subparsers.add_parser(
         'batch2zarr',
@@ -336,6 +395,29 @@ def _parse_arguments():
         default= 1,
         type= int
     )
+    batch_convert_parser.add_argument(
+        '-w', '--workers',
+        required=False,
+        type=int,
+        help='Maximum number of rows converted concurrently, each in its own process. Defaults to a quarter of the CPUs.',
+    )
+    batch_convert_parser.add_argument(
+        '-mb', '--memory_budget',
+        required=False,
+        type=float,
+        help='Memory in MB shared by the conversions running concurrently. Defaults to 80%% of the physical memory.',
+    )
+    batch_convert_parser.add_argument(
+        '-ld', '--log_dir',
+        required=False,
+        type=str,
+        help='Folder receiving one log per row and status.csv. Defaults to <input_file>_logs next to the batch file.',
+    )
+    batch_convert_parser.add_argument(
+        '-p', '--plan',
+        action='store_true',
+        help='Dry run: estimate every row one after the other without writing any output, print the batch totals and write plan.csv to the log folder.',
+    )
     
     # Required args
     requiredNamed = batch_convert_parser.add_argument_group('Required Named arguments.')
@@ -346,6 +428,297 @@ def _parse_arguments():
         type= valid_input_path
     )
 
+    #####################################################################################
+    # Migrate NGFF v0.4 to v0.5 parser
+    migrate_parser = subparsers.add_parser(
+        'migrate',
+        help= 'Migrate an NGFF v0.4 (Zarr v2) store to NGFF v0.5 (Zarr v3). Interrupted migrations resume where they stopped.',
+        formatter_class= argparse.ArgumentDefaultsHelpFormatter
+    )
+    migrate_parser.add_argument(
+        '--runmode',
+        help= argparse.SUPPRESS,
+        default= 2,
+        type= int
+    )
+
+    # Optional args
+    migrate_parser.add_argument(
+        '-c', '--compressor',
+        required=False,
+        default='keep',
+        choices=['keep', 'blosc', 'gzip', 'none'],
+        type=str,
+        help='Output compression. "keep" copies compatible chunks without decoding them.',
+    )
+    migrate_parser.add_argument(
+        '-cl', '--compressor_level',
+        required=False,
+        default=3,
+        type=int,
+        help='Compression level used when recompressing.',
+    )
+    migrate_parser.add_argument(
+        '-ss', '--shard_shape',
+        required=False,
+        nargs='+',
+        type=int,
+        help='Shard shape in TCZYX format, or whatever axes are present in the dataset. Sharded arrays are recompressed.',
+    )
+    migrate_parser.add_argument(
+        '-w', '--workers',
+        required=False,
+        type=int,
+        help='Number of parallel chunk workers.',
+    )
+    migrate_parser.add_argument(
+        '--move',
+        action='store_true',
+        help='Move chunk files instead of copying them. The input store is left without data.',
+    )
+    migrate_parser.add_argument(
+        '--no_resume',
+        action='store_true',
+        help='Restart from scratch instead of resuming an interrupted migration.',
+    )
+    migrate_parser.add_argument(
+        '--overwrite',
+        action='store_true',
+        help='Replace an existing output store.',
+    )
+
+    # Required args
+    requiredNamed = migrate_parser.add_argument_group('Required Named arguments.')
+    requiredNamed.add_argument(
+        '-i', '--input_path',
+        required= True,
+        help= 'Path to the NGFF v0.4 zarr store.',
+        type= valid_input_path
+    )
+    requiredNamed.add_argument(
+        '-z', '--zarr_path',
+        required= True,
+        help= 'Path to the output NGFF v0.5 zarr store.',
+        type= os.path.abspath
+    )
+
+    #####################################################################################
+    # Watch an acquisition folder parser
+    watch_parser = subparsers.add_parser(
+        'watch',
+        help= 'Append every completed timepoint of a running Viventis or Luxendo acquisition to a growing zarr. Restarting resumes where it stopped.',
+        formatter_class= argparse.ArgumentDefaultsHelpFormatter
+    )
+    watch_parser.add_argument(
+        '--runmode',
+        help= argparse.SUPPRESS,
+        default= 3,
+        type= int
+    )
+
+    # Optional args
+    watch_parser.add_argument(
+        '-m', '--microscope',
+        required=False,
+        default=None,
+        help='Microscope writing the acquisition. Leave empty to auto-detect from the input path.',
+        choices=['luxendo', 'viventis'],
+        type=str,
+    )
+    watch_parser.add_argument(
+        '-cs', '--chunk_size',
+        required= False,
+        nargs= '+',
+        help= 'Chunk size in TCZYX format.',
+        type= int
+    )
+    watch_parser.add_argument(
+        '-ms', '--max_size',
+        required= False,
+        default= 100,
+        help= 'Max chunk size in MB. Ignored if --chunk_size is provided.',
+        type= int
+    )
+    watch_parser.add_argument(
+        '-zf', '--zarr_format',
+        required=False,
+        default=3,
+        choices=[2, 3],
+        type=int,
+        help='Output zarr format. Zarr v2 maps to NGFF 0.4 and Zarr v3 maps to NGFF 0.5.',
+    )
+    watch_parser.add_argument(
+        '-df', '--downscale_factor',
+        required=False,
+        nargs='+',
+        type=int,
+        metavar='FACTOR',
+        help='Pyramid downsampling factor. Use one value for isotropic downsampling or three values for anisotropic Z Y X factors, e.g. -df 1 2 2.',
+    )
+    watch_parser.add_argument(
+        '-nl', '--num_levels',
+        required=False,
+        type=int,
+        help='Number of pyramidal levels. By default the lowest level has dims<2048.',
+    )
+    watch_parser.add_argument(
+        '-pi', '--poll_interval',
+        required=False,
+        default=5.0,
+        type=float,
+        help='Seconds between two scans of the input folder.',
+    )
+    watch_parser.add_argument(
+        '-st', '--settle',
+        required=False,
+        default=10.0,
+        type=float,
+        help='Seconds the files of a timepoint must stay unchanged before it is considered complete.',
+    )
+    watch_parser.add_argument(
+        '-it', '--idle_timeout',
+        required=False,
+        default=600.0,
+        type=float,
+        help='Stop after this many seconds without a new timepoint. Use 0 to wait until every planned timepoint is written.',
+    )
+
+    # Required args
+    requiredNamed = watch_parser.add_argument_group('Required Named arguments.')
+    requiredNamed.add_argument(
+        '-i', '--input_path',
+        required= True,
+        help= 'Path to the acquisition folder.',
+        type= valid_input_path
+    )
+    requiredNamed.add_argument(
+        '-z', '--zarr_path',
+        required= True,
+        help= 'Path to the output zarr. An existing store written by a previous watch is resumed.',
+        type= os.path.abspath
+    )
+
+    #####################################################################################
+    # Benchmark parser
+    bench_parser = subparsers.add_parser(
+        'bench',
+        help= 'Time pyramid building, zarr writes and region reads/writes on a synthetic dataset, to size hardware and compare PyMIF releases.',
+        formatter_class= argparse.ArgumentDefaultsHelpFormatter
+    )
+    bench_parser.add_argument(
+        '--runmode',
+        help= argparse.SUPPRESS,
+        default= 4,
+        type= int
+    )
+
+    # Optional args
+    bench_parser.add_argument(
+        '-s', '--shape',
+        required=False,
+        nargs='+',
+        default=[1, 2, 64, 1024, 1024],
+        type=int,
+        help='Shape of the synthetic dataset, in the order of --axes.',
+    )
+    bench_parser.add_argument(
+        '-a', '--axes',
+        required=False,
+        default='tczyx',
+        type=str,
+        help='Axes of the synthetic dataset, any subset of tczyx.',
+    )
+    bench_parser.add_argument(
+        '-dt', '--dtype',
+        required=False,
+        default='uint16',
+        choices=['uint8', 'uint16', 'uint32', 'float32'],
+        type=str,
+        help='Data type of the synthetic dataset.',
+    )
+    bench_parser.add_argument(
+        '-cs', '--chunk_size',
+        required= False,
+        nargs= '+',
+        help= 'Chunk size in the order of --axes.',
+        type= int
+    )
+    bench_parser.add_argument(
+        '-ms', '--max_size',
+        required= False,
+        default= 100,
+        help= 'Max chunk size in MB. Ignored if --chunk_size is provided.',
+        type= int
+    )
+    bench_parser.add_argument(
+        '-nl', '--num_levels',
+        required=False,
+        default=3,
+        type=int,
+        help='Number of pyramidal levels.',
+    )
+    bench_parser.add_argument(
+        '-zf', '--zarr_formats',
+        required=False,
+        nargs='+',
+        default=[2, 3],
+        choices=[2, 3],
+        type=int,
+        help='Zarr formats to write. Zarr v2 maps to NGFF 0.4 and Zarr v3 maps to NGFF 0.5.',
+    )
+    bench_parser.add_argument(
+        '-c', '--compressors',
+        required=False,
+        nargs='+',
+        default=['none', 'blosc', 'gzip'],
+        choices=['none', 'blosc', 'gzip'],
+        type=str,
+        help='Compressors to write with.',
+    )
+    bench_parser.add_argument(
+        '-rs', '--region_size',
+        required=False,
+        nargs='+',
+        default=[32, 256, 256],
+        type=int,
+        help='Size of the random regions read and written at each level, in ZYX format.',
+    )
+    bench_parser.add_argument(
+        '-r', '--repeats',
+        required=False,
+        default=5,
+        type=int,
+        help='Random regions read and written per level.',
+    )
+    bench_parser.add_argument(
+        '--seed',
+        required=False,
+        default=0,
+        type=int,
+        help='Seed of the synthetic data and of the region positions.',
+    )
+    bench_parser.add_argument(
+        '-rp', '--report',
+        required=False,
+        default=None,
+        type=os.path.abspath,
+        help='CSV file to write the results to, e.g. to compare two PyMIF releases.',
+    )
+    bench_parser.add_argument(
+        '-k', '--keep',
+        action='store_true',
+        help='Keep the written zarr stores instead of deleting them.',
+    )
+
+    # Required args
+    requiredNamed = bench_parser.add_argument_group('Required Named arguments.')
+    requiredNamed.add_argument(
+        '-o', '--output_dir',
+        required= True,
+        help= 'Folder on the storage to benchmark. The zarr stores are written to a temporary folder inside it.',
+        type= os.path.abspath
+    )
+
     #####################################################################################
     # Possible other runmodes
 
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import multiprocessing
+import os
+import re
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pymif.microscope_manager.utils.scenes import MemoryBudget
+
+STATUS_FIELDS = ("row", "input", "output", "status", "size_mb", "threads", "memory_mb", "seconds", "log", "error")
+PLAN_FIELDS = (
+    "row", "input", "output", "chunks", "shapes", "n_chunks", "raw_mb", "stored_mb", "blosc_mb",
+    "peak_memory_mb", "read_mb_s", "write_mb_s", "runtime_s", "runtime_serial_s", "error",
+)
+
+
+@dataclass
+class BatchJob:
+    """One row of a batch file and its scheduling state.
+
+    ``size_mb`` and ``chunk_mb`` are estimated from the probed metadata
+    before the batch starts; ``None`` when the dataset could not be probed.
+    """
+
+    row: int
+    kwargs: Dict[str, Any]
+    size_mb: Optional[float] = None
+    chunk_mb: Optional[float] = None
+    threads: int = 1
+    memory_mb: float = 0.0
+    log_path: str = ""
+    status: str = "pending"
+    seconds: float = 0.0
+    error: str = ""
+
+
+def physical_memory_mb() -> Optional[float]:
+    """Total physical memory of the node in MB, or ``None`` if it cannot be queried."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1024 / 1024
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def assign_shares(
+    jobs: Sequence[BatchJob],
+    cpus: int,
+    workers: int,
+    memory_budget_mb: Optional[float],
+) -> None:
+    """Give every job a number of dask threads and a memory reservation.
+
+    Threads are the fair share ``cpus / workers`` scaled by the dataset size
+    relative to the mean size of the batch, so large acquisitions convert
+    with more threads than small ones. Jobs of unknown size get the fair
+    share. The memory reservation is the peak of a conversion with that many
+    threads: one decoded and one encoded chunk per thread (as for scenes,
+    see :func:`~pymif.microscope_manager.utils.scenes.scene_footprint_mb`),
+    clamped to the budget so that every job can run.
+    """
+    known = [job.size_mb for job in jobs if job.size_mb]
+    mean_size = sum(known) / len(known) if known else 1.0
+    fair = cpus / max(1, workers)
+    for job in jobs:
+        ratio = job.size_mb / mean_size if job.size_mb else 1.0
+        job.threads = int(max(1, min(cpus, round(fair * ratio))))
+        chunk_mb = job.chunk_mb if job.chunk_mb else 0.0
+        job.memory_mb = 2 * chunk_mb * job.threads
+        if memory_budget_mb is not None:
+            job.memory_mb = min(job.memory_mb, float(memory_budget_mb))
+
+
+def _log_name(job: BatchJob) -> str:
+    stem = Path(str(job.kwargs.get("zarr_path", ""))).name
+    stem = re.sub(r"[^0-9A-Za-z_.-]+", "_", stem).strip("_.")
+    return f"row{job.row:04d}_{stem}.log" if stem else f"row{job.row:04d}.log"
+
+
+def _run_job(convert: Callable[..., Any], kwargs: Dict[str, Any], log_path: str, threads: int):
+    """Run one conversion in a worker process, with its output going to ``log_path``."""
+    import dask
+
+    start = time.monotonic()
+    with open(log_path, "w", buffering=1) as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        print(f"Converting {kwargs.get('input_path')} -> {kwargs.get('zarr_path')} with {threads} threads.")
+        try:
+            with dask.config.set(scheduler="threads", num_workers=threads):
+                convert(**kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            return "failed", time.monotonic() - start, f"{type(e).__name__}: {e}"
+    return "done", time.monotonic() - start, ""
+
+
+def _write_status(path: Path, jobs: Sequence[BatchJob]) -> None:
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=STATUS_FIELDS)
+        writer.writeheader()
+        for job in sorted(jobs, key=lambda j: j.row):
+            writer.writerow({
+                "row": job.row,
+                "input": job.kwargs.get("input_path"),
+                "output": job.kwargs.get("zarr_path"),
+                "status": job.status,
+                "size_mb": "" if job.size_mb is None else f"{job.size_mb:.1f}",
+                "threads": job.threads,
+                "memory_mb": f"{job.memory_mb:.1f}",
+                "seconds": f"{job.seconds:.1f}",
+                "log": job.log_path,
+                "error": job.error,
+            })
+    os.replace(tmp, path)
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    convert: Callable[..., Any],
+    log_dir: str | os.PathLike,
+    workers: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    cpus: Optional[int] = None,
+) -> List[BatchJob]:
+    """Run conversion jobs concurrently, each in its own process.
+
+    Jobs start largest first. A job waits until its memory reservation fits
+    in ``memory_budget_mb`` next to the running ones, so the number of
+    conversions in flight adapts to their sizes. Every job writes its
+    output to its own log file and runs in a fresh process, so a failure,
+    or a worker killed for running out of memory, only fails that row.
+    ``status.csv`` in ``log_dir`` is rewritten whenever a job starts or ends.
+
+    Parameters
+    ----------
+    jobs : list of BatchJob
+        Jobs with their estimated sizes, see :func:`assign_shares`.
+    convert : callable
+        Called as ``convert(**job.kwargs)`` in the worker process; must be
+        importable, e.g. :func:`pymif.cli.pymif.zarr_convert`.
+    log_dir : str | PathLike
+        Folder receiving the per-row logs and ``status.csv``.
+    workers : int | None
+        Maximum number of concurrent conversions. Default: a quarter of the
+        CPUs, capped by the number of jobs.
+    memory_budget_mb : float | None
+        Memory shared by the running conversions. ``None`` disables the budget.
+    cpus : int | None
+        CPUs split between the running conversions. Default: all of them.
+
+    Returns
+    -------
+    list of BatchJob
+        The jobs, in row order, with their final status.
+    """
+    cpus = int(cpus or os.cpu_count() or 1)
+    workers = max(1, min(int(workers or max(1, cpus // 4)), len(jobs) or 1))
+    assign_shares(jobs, cpus, workers, memory_budget_mb)
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    status_path = log_dir / "status.csv"
+    for job in jobs:
+        job.log_path = str(log_dir / _log_name(job))
+
+    lock = threading.Lock()
+    finished = []
+    budget = MemoryBudget(memory_budget_mb)
+    context = multiprocessing.get_context("spawn")
+    _write_status(status_path, jobs)
+
+    def _dispatch(job: BatchJob) -> None:
+        reserved = budget.acquire(job.memory_mb)
+        try:
+            with lock:
+                job.status = "running"
+                _write_status(status_path, jobs)
+            print(f"Row {job.row}: converting {job.kwargs.get('input_path')} "
+                  f"({job.threads} threads, {job.memory_mb:.0f} MB reserved).")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as process:
+                try:
+                    job.status, job.seconds, job.error = process.submit(
+                        _run_job, convert, job.kwargs, job.log_path, job.threads
+                    ).result()
+                except Exception as e:
+                    # The worker died (e.g. killed by the OOM killer) before reporting.
+                    job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            budget.release(reserved)
+        with lock:
+            finished.append(job)
+            _write_status(status_path, jobs)
+            print(f"[{len(finished)}/{len(jobs)}] Row {job.row} {job.status} in {job.seconds:.1f} s"
+                  + (f": {job.error} (see {job.log_path})" if job.error else "."))
+
+    order = sorted(jobs, key=lambda j: -(j.size_mb or 0.0))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_dispatch, job) for job in order]:
+            future.result()
+
+    return sorted(jobs, key=lambda j: j.row)
+
+
+def print_summary(jobs: Sequence[BatchJob], log_dir: str | os.PathLike) -> None:
+    """Print how many rows were converted and where the logs of failed rows are."""
+    failed = [job for job in jobs if job.status != "done"]
+    total = sum(job.seconds for job in jobs)
+    print("\n--->Batch summary")
+    print(f"{len(jobs) - len(failed)}/{len(jobs)} rows converted, {total:.1f} s of conversion time.")
+    for job in failed:
+        print(f"Row {job.row} ({job.kwargs.get('input_path')}) {job.status}: {job.error}\n\tlog: {job.log_path}")
+    print(f"Status of every row: {Path(log_dir) / 'status.csv'}")
+
+
+def plan_batch(
+    jobs: Sequence[BatchJob],
+    convert: Callable[..., Any],
+    log_dir: str | os.PathLike,
+) -> List[Dict[str, Any]]:
+    """Estimate every conversion of a batch, one after the other, without writing any output.
+
+    Each row is planned with ``convert(**job.kwargs, plan=True)``, which
+    returns a :class:`~pymif.microscope_manager.utils.plan.WritePlan` (or a
+    list of them for multi-scene rows). The estimates are written to
+    ``plan.csv`` in ``log_dir`` and the batch totals are printed.
+
+    Returns
+    -------
+    list of dict
+        One ``plan.csv`` row per planned dataset.
+    """
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    rows = []
+    for job in jobs:
+        base = {"row": job.row, "input": job.kwargs.get("input_path"), "output": job.kwargs.get("zarr_path")}
+        try:
+            plans = convert(**job.kwargs, plan=True)
+        except Exception as e:
+            print(f"Row {job.row}: could not plan {base['input']}: {type(e).__name__}: {e}")
+            rows.append({**base, "error": f"{type(e).__name__}: {e}"})
+            continue
+        for plan in plans if isinstance(plans, list) else [plans]:
+            rows.append({
+                **base,
+                "chunks": " ".join(str(c) for c in plan.chunks),
+                "shapes": ";".join(" ".join(str(s) for s in shape) for shape in plan.shapes),
+                "n_chunks": " ".join(str(n) for n in plan.n_chunks),
+                **{key: f"{getattr(plan, key):.1f}" for key in PLAN_FIELDS[6:-1]},
+                "error": "",
+            })
+
+    with open(log_dir / "plan.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=PLAN_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    planned = [row for row in rows if not row["error"]]
+    total = {key: sum(float(row[key]) for row in planned) for key in ("raw_mb", "stored_mb", "runtime_s", "runtime_serial_s")}
+    peak = max((float(row["peak_memory_mb"]) for row in planned), default=0.0)
+    print("\n--->Batch plan")
+    print(f"{len(planned)} datasets planned, {len(rows) - len(planned)} failed.")
+    print(f"Uncompressed size: {total['raw_mb']:.1f} MB, estimated output size: {total['stored_mb']:.1f} MB.")
+    print(f"Largest peak memory of one conversion: {peak:.1f} MB.")
+    print(f"Estimated conversion time: {total['runtime_s']:.1f} s "
+          f"({total['runtime_serial_s']:.1f} s if the storage does not scale with threads), before running rows concurrently.")
+    print(f"Plan of every row: {log_dir / 'plan.csv'}")
+    return rows
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from pymif.microscope_manager.utils.chunk_copy import stored_bytes
+
+RESULT_FIELDS = ("step", "zarr_format", "compressor", "level", "mb", "seconds", "mb_s", "peak_rss_mb", "stored_mb")
+
+
+@dataclass
+class BenchResult:
+    """Timing of one benchmark step.
+
+    ``mb`` counts decoded data and ``peak_rss_mb`` is the resident set high
+    water mark while the step ran. ``stored_mb`` is the size on disk of the
+    store written by a ``to_zarr`` step.
+    """
+
+    step: str
+    zarr_format: Optional[int] = None
+    compressor: Optional[str] = None
+    level: Optional[int] = None
+    mb: float = 0.0
+    seconds: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    stored_mb: Optional[float] = None
+
+    @property
+    def mb_s(self) -> Optional[float]:
+        if not self.mb:
+            return None
+        return self.mb / max(self.seconds, 1e-9)
+
+
+class _Discard:
+    """``da.store`` target that drops every block, to time computing without writing."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the resident set high water mark of this process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Resident set high water mark of this process in MB, or ``None`` if unknown.
+
+    Reads ``VmHWM`` from ``/proc/self/status``; elsewhere falls back to
+    ``ru_maxrss``, which is never reset and so is the peak since start-up.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        import sys
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024 / 1024 if sys.platform == "darwin" else maxrss / 1024
+
+
+@contextlib.contextmanager
+def _measure(result: BenchResult) -> Iterator[BenchResult]:
+    _reset_peak_rss()
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+        result.peak_rss_mb = peak_rss_mb()
+
+
+def synthetic_array(shape: Sequence[int], dtype="uint16", chunks=None, seed: int = 0):
+    """Lazy noise image of ``shape`` for benchmarks.
+
+    One block of noise is drawn up front and every chunk is a copy of it
+    shifted by the chunk index, so generating data costs a memory copy and
+    no chunk compresses against another. Integers use 12 bits (or the full
+    range of narrower types), like most camera data; floats lie in [0, 1).
+    """
+    import dask.array as da
+
+    dtype = np.dtype(dtype)
+    chunks = da.core.normalize_chunks("auto" if chunks is None else tuple(chunks), tuple(shape), dtype=dtype)
+    block_shape = tuple(max(c) for c in chunks)
+    rng = np.random.default_rng(seed)
+    if dtype.kind in "iu":
+        high = min(4096, int(np.iinfo(dtype).max) + 1)
+        base = rng.integers(0, high, block_shape).astype(dtype)
+    else:
+        base = rng.random(block_shape).astype(dtype)
+
+    def _block(block, block_info=None):
+        info = block_info[0]
+        offset = np.ravel_multi_index(info["chunk-location"], info["num-chunks"])
+        out = base[tuple(slice(0, s) for s in block.shape)].copy()
+        if dtype.kind in "iu":
+            out //= 2
+            out += dtype.type(offset % 16)
+        return out
+
+    return da.zeros(tuple(shape), chunks=chunks, dtype=dtype).map_blocks(_block, dtype=dtype)
+
+
+def _region(shape: Sequence[int], axes: str, region_size: Sequence[int], rng) -> dict:
+    """Random region of at most ``region_size`` (ZYX) voxels, one index along T and C."""
+    sizes = dict(zip(axes, (int(s) for s in shape)))
+    spatial = [ax for ax in axes if ax in "zyx"]
+    extents = dict(zip(spatial[::-1], tuple(region_size)[::-1]))
+    region = {}
+    for ax in axes:
+        extent = min(sizes[ax], int(extents.get(ax, 1)))
+        start = int(rng.integers(0, sizes[ax] - extent + 1))
+        region[ax] = slice(start, start + extent)
+    return region
+
+
+def run_bench(
+    output_dir: str | os.PathLike,
+    *,
+    shape: Sequence[int] = (1, 2, 64, 1024, 1024),
+    axes: str = "tczyx",
+    dtype="uint16",
+    chunks: Sequence[int] | None = None,
+    num_levels: int = 3,
+    zarr_formats: Sequence[int] = (2, 3),
+    compressors: Sequence[str | None] = (None, "blosc", "gzip"),
+    region_size: Sequence[int] = (32, 256, 256),
+    repeats: int = 5,
+    seed: int = 0,
+    keep: bool = False,
+) -> List[BenchResult]:
+    """Time the PyMIF write and read paths on a synthetic dataset.
+
+    The steps are
+
+    - ``generate``: compute the full-resolution level, as a baseline;
+    - ``build_pyramid``: compute every level of the pyramid;
+    - ``to_zarr``: write the pyramid, for each zarr format and compressor;
+    - ``open``: open the written store with :class:`ZarrManager`;
+    - ``read_level``: stream a whole level from the store;
+    - ``read_region`` and ``write_region``: ``repeats`` random regions of
+      ``region_size`` per level, the writes including the refresh of the
+      coarser levels done by :meth:`ZarrManager.write_image_region`.
+
+    Computed data is discarded, so memory stays within the dask working set
+    and the peak RSS is the one of the step itself.
+
+    Parameters
+    ----------
+    output_dir : str | PathLike
+        Folder on the storage to benchmark. The stores are written to a
+        temporary folder inside it, deleted afterwards unless ``keep``.
+    shape, axes, dtype, chunks
+        Synthetic dataset, see :func:`synthetic_array`.
+    num_levels : int
+        Pyramid levels to build and write.
+    zarr_formats : sequence of int
+        Zarr formats to write, 2 (NGFF 0.4) and/or 3 (NGFF 0.5).
+    compressors : sequence of str | None
+        Compressors to write with, ``None`` for uncompressed chunks.
+    region_size : sequence of int
+        Extent of the random regions along the spatial axes, in ZYX order.
+    repeats : int
+        Random regions read and written per level.
+    seed : int
+        Seed of the noise and of the region positions.
+    keep : bool
+        Keep the written stores.
+
+    Returns
+    -------
+    list of BenchResult
+        One result per step; region steps are summed over the repeats.
+    """
+    import dask.array as da
+
+    import pymif.microscope_manager as mm
+
+    axes = str(axes).lower()
+    rng = np.random.default_rng(seed)
+    data = synthetic_array(shape, dtype=dtype, chunks=chunks, seed=seed)
+    n_spatial = sum(ax in "zyx" for ax in axes)
+    metadata = {"axes": axes, "scales": [tuple(1.0 for _ in range(n_spatial))], "name": "pymif-bench"}
+    manager = mm.ArrayManager(data, metadata)
+    results = []
+
+    result = BenchResult("generate", level=0, mb=data.nbytes / 1024 / 1024)
+    with _measure(result):
+        da.store(data, _Discard(), lock=False)
+    results.append(result)
+
+    result = BenchResult("build_pyramid")
+    with _measure(result):
+        manager.build_pyramid(num_levels=num_levels)
+        da.store(manager.data, [_Discard() for _ in manager.data], lock=False)
+    result.mb = sum(level.nbytes for level in manager.data) / 1024 / 1024
+    results.append(result)
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".pymif-bench-", dir=output_dir)
+    try:
+        for zarr_format in zarr_formats:
+            for compressor in compressors:
+                codec = compressor or "none"
+                path = Path(tmp) / f"v{zarr_format}-{codec}.zarr"
+                tags = {"zarr_format": int(zarr_format), "compressor": codec}
+
+                result = BenchResult("to_zarr", mb=sum(level.nbytes for level in manager.data) / 1024 / 1024, **tags)
+                with _measure(result):
+                    manager.to_zarr(
+                        str(path),
+                        zarr_format=int(zarr_format),
+                        ngff_version="0.4" if int(zarr_format) == 2 else "0.5",
+                        compressor=compressor,
+                    )
+                result.stored_mb = stored_bytes(path) / 1024 / 1024
+                results.append(result)
+
+                result = BenchResult("open", **tags)
+                # ZarrManager prints the store tree on open; keep it out of the table and the timing.
+                with _measure(result), contextlib.redirect_stdout(io.StringIO()):
+                    store = mm.ZarrManager(str(path))
+                results.append(result)
+
+                for level, array in enumerate(store.data):
+                    result = BenchResult("read_level", level=level, mb=array.nbytes / 1024 / 1024, **tags)
+                    with _measure(result):
+                        da.store(array, _Discard(), lock=False)
+                    results.append(result)
+
+                    regions = [_region(array.shape, axes, region_size, rng) for _ in range(repeats)]
+                    result = BenchResult("read_region", level=level, **tags)
+                    with _measure(result):
+                        for region in regions:
+                            block = np.asarray(array[tuple(region[ax] for ax in axes)])
+                            result.mb += block.nbytes / 1024 / 1024
+                    results.append(result)
+
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        writer = mm.ZarrManager(str(path), mode="a")
+                    result = BenchResult("write_region", level=level, **tags)
+                    blocks = [np.asarray(array[tuple(region[ax] for ax in axes)]) for region in regions]
+                    with _measure(result):
+                        for region, block in zip(regions, blocks):
+                            writer.write_image_region(block, level=level, **region)
+                            result.mb += block.nbytes / 1024 / 1024
+                    results.append(result)
+                    writer.close()
+                store.close()
+    finally:
+        if not keep:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def _format(value, digits: int = 1) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.{digits}f}"
+    return str(value)
+
+
+def describe_bench(results: Sequence[BenchResult]) -> str:
+    """Format benchmark results as the table printed by ``pymif bench``."""
+    header = ("STEP", "FORMAT", "CODEC", "LEVEL", "MB", "SECONDS", "MB/S", "PEAK RSS (MB)", "STORED (MB)")
+    rows = [
+        (r.step, _format(r.zarr_format), _format(r.compressor), _format(r.level), _format(r.mb),
+         _format(r.seconds, 3), _format(r.mb_s), _format(r.peak_rss_mb), _format(r.stored_mb))
+        for r in results
+    ]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    return "\n".join("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in (header, *rows))
+
+
+def write_bench_csv(results: Sequence[BenchResult], path: str | os.PathLike) -> None:
+    """Write benchmark results to ``path``, one row per step."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            row = {**asdict(result), "mb_s": result.mb_s}
+            writer.writerow({key: "" if row[key] is None else row[key] for key in RESULT_FIELDS})
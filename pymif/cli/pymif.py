@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import glob
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -102,6 +103,7 @@ def _manager_name_map() -> Dict[str, Any]:
         'zarrv04': mm.ZarrV04Manager,
         'zarr': mm.ZarrManager,
         'scape': mm.ScapeManager,
+        'tiff': mm.TiffManager,
     }
 
 def _resolve_zarr_manager(input_path: str, microscope: Optional[str] = None):
@@ -113,10 +115,14 @@ def _resolve_zarr_manager(input_path: str, microscope: Optional[str] = None):
         if manager is None:
             raise TypeError(
                 f'Microscope {microscope} not recognized. Should be one of '
-                f'"luxendo", "opera", "viventis", "zeiss", "zarrv04", "zarr", "scape".'
+                f'"luxendo", "opera", "viventis", "zeiss", "zarrv04", "zarr", "scape", "tiff".'
             )
         return manager, key
 
+    # Glob patterns address a sequence of plain TIFF stacks.
+    if glob.has_magic(str(input_path)):
+        return mm.TiffManager, 'tiff'
+
     path = Path(input_path)
 
     # Zarr stores: prefer explicit v3/v0.5 when zarr.json exists, otherwise legacy v0.4.
@@ -145,79 +151,29 @@ def _resolve_zarr_manager(input_path: str, microscope: Optional[str] = None):
 
     raise TypeError(
         'Could not auto-detect the microscope from the input path. '
-        'Pass --microscope explicitly with one of "luxendo", "opera", "viventis", "zeiss", "zarrv04", "zarr", "scape".'
+        'Pass --microscope explicitly with one of "luxendo", "opera", "viventis", "zeiss", "zarrv04", "zarr", "scape", "tiff".'
     )
 
-def zarr_convert(
-    input_path, 
-    zarr_path, 
-    microscope: Optional[str] = None, 
-    max_size : Optional[int] = 100, 
-    chunk_size : Optional[List[int]] = None,
-    scene_index : Optional[int] = 1,
-    channel_names : Optional[List[str]] = None,
-    channel_colors : Optional[List[str]] = None,
-    zarr_format : Optional[int] = 3,
-    downscale_factor: Optional[int] = 2,
-    num_levels: Optional[int] = None,
-    subset: Optional[dict] = None,
+def _prepare_dataset(
+    dataset,
+    max_size,
+    chunk_size,
+    channel_names,
+    channel_colors,
+    downscale_factor,
+    num_levels,
+    subset,
+    access_pattern=None,
+    storage=None,
+    zarr_format=3,
 ):
-    """Helper function for CLI to convert a dataset to zarr given some parameters.
+    """Subset, rechunk, build the pyramid and set channel metadata of a dataset before writing.
 
-    Parameters
-    ----------
-        input_path : str
-            Input path for the data to be converted.
-        zarr_path : str
-            Output .zarr path.
-        microscope : str
-            Microscope used to acquire input data.
-            One of \"luxendo\", \"opera\", \"viventis\", \"zeiss\", \"zarrv04\", \"zarr\".
-        max_size : Optional[int]
-            Max chunk size in MB. \n
-            Default: 100
-        chunk_size : Optional[List[int]]
-            Chunk size in TCZYX format, or whatever axes are present in the dataset.
-            Default: None
-        scene_index : Optional[int]
-            Scene index for .czi files. \n
-            Default: -1
-        channel_names : Optional[List[str]]
-            Name of channels.\n
-            Example: \"-cn bf gfp rfp\"\n
-            Default: None
-        channel_colors : Optional[List[str]]
-            Colors of channels (hex or matplotlib color name)\n
-            Example: \"-cc 0000FF cyan 00ff00\")\n
-            Default: None
-        zarr_format : Optional[int]
-            Output zarr format. Zarr v2 maps to NGFF 0.4 and Zarr v3 maps to NGFF 0.5.\n
-            Default: 3
-        downscale_factor : Optional[int]
-            Pyramid downsampling factor.\n
-            Example: \"-df 1 2 2\")\n
-            Default: 2
-        num_levels : Optional[int]
-            Number of pyramid levels.\n
-            Example: \"-nl 3\")\n
-            Default: None
-        subset : Optional[dict]
-            Axis subset to apply before chunk selection and pyramid generation.\n
-            Example: "--subset y=10:100:2;x=20:80"\n
-            Default: None
+    Returns
+    -------
+        Tuple with the chunk size in MB, the number of chunks per axis, the number of pyramid levels
+        and the shard shape (None unless the chunk planner asks for shards).
     """
-
-    manager, resolved_microscope = _resolve_zarr_manager(input_path, microscope)
-    print(f'\n--->Using manager: {manager.__name__} ({resolved_microscope})')
-
-    downscale_factor = _normalize_downscale_factor(downscale_factor)
-    
-    # --- Figure out chunks dimensions ---
-    if resolved_microscope.lower() == "zeiss":
-        dataset = manager(path=input_path, scene_index=scene_index)
-    else:
-        dataset = manager(path=input_path)
-        
     # --- Show metadata summary ---
     print("\n--->Input dataset")
     for i in dataset.metadata:
@@ -236,8 +192,18 @@ def zarr_convert(
         
     # --- Select chunk size ---
     print(f"\n--->Select chunks.")
-    if chunk_size is not None:
+    shards = None
+    if chunk_size is None and (access_pattern or storage):
+        layout = _plan_layout(dataset, max_size, access_pattern, storage, zarr_format)
+        print(f"\tUsing the {layout.access} access pattern on {layout.storage} storage to select chunk size.")
+        print(f"\tFiles per level 0: {layout.n_files}, source read amplification: {layout.read_amplification:.2f}x.")
+        if layout.shards is not None:
+            print(f"\tShard size: {layout.shards}, {layout.shard_mb} MB.")
+        chunk_size, shards = layout.chunks, layout.shards
+    elif chunk_size is not None:
         print(f"\tUsing user-provided chunk size: {chunk_size}")
+
+    if chunk_size is not None:
         size_mb = _dataset_size_mb(dataset.metadata) * np.prod(chunk_size) / np.prod(dataset.metadata["size"][0])
         n_chunks = {ax: int(np.ceil(size / chunk)) for ax, size, chunk in zip(_axes(dataset.metadata), dataset.metadata["size"][0], chunk_size)}
     else:
@@ -262,7 +228,8 @@ def zarr_convert(
 
     dataset.build_pyramid(
         num_levels=num_levels, 
-        downscale_factor=downscale_factor
+        downscale_factor=downscale_factor,
+        reuse_levels=True,
     )
 
     # --- Modify metadata according to optional parameters ---
@@ -295,6 +262,187 @@ def zarr_convert(
             metadata["channel_colors"] = channel_colors
     dataset.update_metadata(metadata)
 
+    return size_mb, n_chunks, num_levels, shards
+
+def _plan_layout(dataset, max_size, access_pattern, storage, zarr_format):
+    """Run the storage-aware chunk planner on a dataset's full-resolution level."""
+    from pymif.microscope_manager.utils.chunk_plan import plan_chunks
+
+    metadata = dataset.metadata
+    return plan_chunks(
+        metadata["size"][0],
+        _axes(metadata),
+        metadata.get("dtype", "uint16"),
+        source_chunks=dataset.data[0].chunksize,
+        scales=metadata["scales"][0] if metadata.get("scales") else None,
+        access=access_pattern or "3D-analysis",
+        storage=storage or "local",
+        max_chunk_mb=max_size,
+        zarr_format=int(zarr_format),
+    )
+
+def zarr_convert(
+    input_path, 
+    zarr_path, 
+    microscope: Optional[str] = None, 
+    max_size : Optional[int] = 100, 
+    chunk_size : Optional[List[int]] = None,
+    scene_index : Optional[int] = 1,
+    channel_names : Optional[List[str]] = None,
+    channel_colors : Optional[List[str]] = None,
+    zarr_format : Optional[int] = 3,
+    downscale_factor: Optional[int] = 2,
+    num_levels: Optional[int] = None,
+    subset: Optional[dict] = None,
+    read_processes: Optional[int] = None,
+    all_scenes: bool = False,
+    scenes_layout: str = "stores",
+    scene_workers: Optional[int] = None,
+    memory_budget: Optional[float] = None,
+    plan: bool = False,
+    access_pattern: Optional[str] = None,
+    storage: Optional[str] = None,
+):
+    """Helper function for CLI to convert a dataset to zarr given some parameters.
+
+    Parameters
+    ----------
+        input_path : str
+            Input path for the data to be converted.
+        zarr_path : str
+            Output .zarr path.
+        microscope : str
+            Microscope used to acquire input data.
+            One of \"luxendo\", \"opera\", \"viventis\", \"zeiss\", \"zarrv04\", \"zarr\", \"scape\", \"tiff\".
+        max_size : Optional[int]
+            Max chunk size in MB. \n
+            Default: 100
+        chunk_size : Optional[List[int]]
+            Chunk size in TCZYX format, or whatever axes are present in the dataset.
+            Default: None
+        scene_index : Optional[int]
+            Scene index for .czi files. \n
+            Default: -1
+        channel_names : Optional[List[str]]
+            Name of channels.\n
+            Example: \"-cn bf gfp rfp\"\n
+            Default: None
+        channel_colors : Optional[List[str]]
+            Colors of channels (hex or matplotlib color name)\n
+            Example: \"-cc 0000FF cyan 00ff00\")\n
+            Default: None
+        zarr_format : Optional[int]
+            Output zarr format. Zarr v2 maps to NGFF 0.4 and Zarr v3 maps to NGFF 0.5.\n
+            Default: 3
+        downscale_factor : Optional[int]
+            Pyramid downsampling factor.\n
+            Example: \"-df 1 2 2\")\n
+            Default: 2
+        num_levels : Optional[int]
+            Number of pyramid levels.\n
+            Example: \"-nl 3\")\n
+            Default: None
+        subset : Optional[dict]
+            Axis subset to apply before chunk selection and pyramid generation.\n
+            Example: "--subset y=10:100:2;x=20:80"\n
+            Default: None
+        read_processes : Optional[int]
+            Number of processes decoding Luxendo HDF5 blocks. Ignored for other microscopes.\n
+            Default: None
+        all_scenes : bool
+            Convert every scene of a .czi file, opening the file once. scene_index is ignored.\n
+            Default: False
+        scenes_layout : str
+            With all_scenes, "stores" writes one <scene>.zarr per scene into the zarr_path folder,
+            "groups" writes the first scene at the root of zarr_path and the others as image subgroups.\n
+            Default: "stores"
+        scene_workers : Optional[int]
+            With all_scenes, maximum number of scenes written concurrently.\n
+            Default: None (number of CPUs)
+        memory_budget : Optional[float]
+            With all_scenes, memory in MB shared by the scenes being written.\n
+            Default: None (no budget)
+        plan : bool
+            Only estimate the chunking, pyramid, output size, peak memory and runtime
+            of the conversion from a few sampled chunks, without writing to zarr_path.\n
+            Default: False
+        access_pattern : Optional[str]
+            Pick chunks (and shards) with the chunk planner for this access pattern:
+            "napari-2D", "3D-analysis" or "time-series". Ignored if chunk_size is provided.\n
+            Default: None ("3D-analysis" if storage is set, else chunks are selected from max_size only)
+        storage : Optional[str]
+            Storage the output is written to, for the chunk planner: "local", "network" or "object".\n
+            Default: None ("local" if access_pattern is set)
+
+    Returns
+    -------
+        None, or with plan the WritePlan (a list of them with all_scenes).
+    """
+
+    manager, resolved_microscope = _resolve_zarr_manager(input_path, microscope)
+    print(f'\n--->Using manager: {manager.__name__} ({resolved_microscope})')
+
+    downscale_factor = _normalize_downscale_factor(downscale_factor)
+    if all_scenes and resolved_microscope.lower() != "zeiss":
+        raise TypeError(f"all_scenes is only supported for multi-scene .czi files, not {resolved_microscope}.")
+    
+    # --- Figure out chunks dimensions ---
+    if resolved_microscope.lower() == "zeiss":
+        dataset = manager(path=input_path, scene_index=0 if all_scenes else scene_index)
+    elif resolved_microscope.lower() == "luxendo":
+        dataset = manager(path=input_path, read_processes=read_processes)
+    else:
+        dataset = manager(path=input_path)
+        
+    if all_scenes and plan:
+        plans = []
+        for i, scene_name in enumerate(dataset.scenes):
+            print(f"\n--->Planning scene {scene_name}")
+            scene_dataset = dataset.scene(i)
+            *_, shards = _prepare_dataset(
+                scene_dataset, max_size=max_size, chunk_size=chunk_size, channel_names=channel_names,
+                channel_colors=channel_colors, downscale_factor=downscale_factor, num_levels=num_levels, subset=subset,
+                access_pattern=access_pattern, storage=storage, zarr_format=zarr_format,
+            )
+            plans.append(_plan_conversion(scene_dataset, zarr_path, zarr_format, shards))
+        return plans
+
+    if all_scenes:
+        ngff_version = '0.4' if int(zarr_format) == 2 else '0.5'
+
+        def prepare(scene_dataset):
+            print(f"\n--->Preparing scene {scene_dataset.scene_name}")
+            _prepare_dataset(
+                scene_dataset, max_size=max_size, chunk_size=chunk_size, channel_names=channel_names,
+                channel_colors=channel_colors, downscale_factor=downscale_factor, num_levels=num_levels, subset=subset,
+                access_pattern=access_pattern, storage=storage, zarr_format=zarr_format,
+            )
+            return scene_dataset
+
+        # Scenes share one shard shape, planned on the first scene and clipped to every level.
+        shards = None
+        if chunk_size is None and (access_pattern or storage):
+            shards = _plan_layout(dataset, max_size, access_pattern, storage, zarr_format).shards
+
+        print(f"\n--->Writing {len(dataset.scenes)} scenes to zarr ({scenes_layout})")
+        dataset.scenes_to_zarr(
+            zarr_path,
+            layout=scenes_layout,
+            prepare=prepare,
+            max_workers=scene_workers,
+            memory_budget_mb=memory_budget,
+            zarr_format=int(zarr_format),
+            ngff_version=ngff_version,
+            shards=shards,
+        )
+        return
+
+    size_mb, n_chunks, num_levels, shards = _prepare_dataset(
+        dataset, max_size=max_size, chunk_size=chunk_size, channel_names=channel_names,
+        channel_colors=channel_colors, downscale_factor=downscale_factor, num_levels=num_levels, subset=subset,
+        access_pattern=access_pattern, storage=storage, zarr_format=zarr_format,
+    )
+
     print("\n--->Updating metadata to selected zarr_format and downscale_factor")
     ngff_version = '0.4' if int(zarr_format) == 2 else '0.5'
 
@@ -305,30 +453,38 @@ def zarr_convert(
     print(f"CHUNK SIZE: {dataset.chunks} , {size_mb} MB.")
     print(f"N CHUNKS: {n_chunks}.")
     print(f"PYRAMID LEVELS: {num_levels}.")
+    if shards is not None:
+        print(f"SHARDS: {shards}.")
     print(f"ZARR FORMAT: {zarr_format}, NGFF VERSION: {ngff_version}.")
 
+    if plan:
+        return _plan_conversion(dataset, zarr_path, zarr_format, shards)
+
     # --- Write to OME-Zarr format ---
     print("\n--->Writing to zarr")
-    dataset.to_zarr(zarr_path, zarr_format=int(zarr_format), ngff_version=ngff_version)
+    dataset.to_zarr(zarr_path, zarr_format=int(zarr_format), ngff_version=ngff_version, shards=shards)
 
     # --- Show metadata summary for updated dataset ---
     dataset = mm.ZarrManager(path=zarr_path)
 
-def convert_batch(args):
-    """Runmode to convert batch of imaged to zarr
+def _plan_conversion(dataset, zarr_path, zarr_format, shards=None):
+    """Print the resource estimate of writing a prepared dataset, without writing it."""
+    from pymif.microscope_manager.utils.plan import describe_plan, plan_write
 
-    Args:
-        args (args): parsed arguments
-    """
-    cli = f"pymif batch2zarr --input {args.input_file}"
-    print(f"Converting batch.\nRunning through: {cli}")
+    # Sample writes go next to the output, to measure the storage it will be written to.
+    scratch_dir = Path(zarr_path).resolve().parent
+    while not scratch_dir.is_dir():
+        scratch_dir = scratch_dir.parent
 
-    database = pd.read_csv(args.input_file)
-    print(database)
+    print("\n--->Conversion plan (nothing is written to the output)")
+    plan = plan_write(dataset.data, zarr_format=int(zarr_format), scratch_dir=scratch_dir, shards=shards)
+    print(describe_plan(plan))
+    return plan
 
+def _batch_jobs(database: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Turn the rows of a batch file into ``zarr_convert`` keyword arguments."""
+    jobs = []
     for i, v in database.iterrows():
-        print("-" * 20)
-
         input_f = v["input"]
         output = v["output"]
         microscope = v["microscope"]
@@ -373,7 +529,88 @@ def convert_batch(args):
         if "subset" in database.columns and _present(v.get("subset")):
             conv_kwargs["subset"] = v["subset"]
 
-        zarr_convert(**conv_kwargs)
+        if "access_pattern" in database.columns and _present(v.get("access_pattern")):
+            conv_kwargs["access_pattern"] = str(v["access_pattern"]).strip()
+
+        if "storage" in database.columns and _present(v.get("storage")):
+            conv_kwargs["storage"] = str(v["storage"]).strip()
+
+        jobs.append(conv_kwargs)
+    return jobs
+
+def _estimate_job(conv_kwargs: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Estimate the dataset and chunk size in MB of a conversion from the probed metadata.
+
+    Returns ``(None, None)`` if the dataset cannot be probed; the conversion
+    itself then reports the problem.
+    """
+    try:
+        manager, resolved_microscope = _resolve_zarr_manager(conv_kwargs["input_path"], conv_kwargs.get("microscope"))
+        if resolved_microscope == "zeiss":
+            metadata = manager.probe(conv_kwargs["input_path"], scene_index=conv_kwargs.get("scene_index", 1))
+        else:
+            metadata = manager.probe(conv_kwargs["input_path"])
+    except Exception as e:
+        print(f"Could not probe {conv_kwargs['input_path']}: {e}")
+        return None, None
+
+    size_mb = _dataset_size_mb(metadata)
+    chunk_size = conv_kwargs.get("chunk_size")
+    if chunk_size is not None:
+        chunk_mb = size_mb * np.prod(chunk_size) / np.prod(metadata["size"][0])
+    elif conv_kwargs.get("access_pattern") or conv_kwargs.get("storage"):
+        from pymif.microscope_manager.utils.chunk_plan import plan_chunks
+
+        # Shards are written whole, so they set the memory held per thread.
+        layout = plan_chunks(
+            metadata["size"][0], _axes(metadata), metadata.get("dtype", "uint16"),
+            access=conv_kwargs.get("access_pattern") or "3D-analysis", storage=conv_kwargs.get("storage") or "local",
+            max_chunk_mb=conv_kwargs.get("max_size", 100), zarr_format=int(conv_kwargs.get("zarr_format", 3)),
+        )
+        chunk_mb = layout.shard_mb or layout.chunk_mb
+    else:
+        _, chunk_mb, _ = _select_chunk_size(metadata, conv_kwargs.get("max_size", 100))
+    return size_mb, float(chunk_mb)
+
+def convert_batch(args):
+    """Runmode to convert batch of imaged to zarr
+
+    Rows are converted concurrently, each in its own process with its own
+    log, and a failed row does not stop the batch.
+
+    Args:
+        args (args): parsed arguments
+    """
+    from pymif.cli.batch import BatchJob, physical_memory_mb, plan_batch, print_summary, run_batch
+
+    workers = getattr(args, "workers", None)
+    memory_budget = getattr(args, "memory_budget", None)
+    log_dir = getattr(args, "log_dir", None) or str(Path(args.input_file).with_suffix("")) + "_logs"
+    if memory_budget is None:
+        total = physical_memory_mb()
+        memory_budget = None if total is None else 0.8 * total
+
+    cli = f"pymif batch2zarr --input {args.input_file} --workers {workers} --memory_budget {memory_budget} --log_dir {log_dir}"
+    print(f"Converting batch.\nRunning through: {cli}")
+
+    database = pd.read_csv(args.input_file)
+    print(database)
+
+    if getattr(args, "plan", False):
+        jobs = [BatchJob(row=int(row), kwargs=kw) for row, kw in zip(database.index, _batch_jobs(database))]
+        plan_batch(jobs, zarr_convert, log_dir)
+        return
+
+    jobs = []
+    for row, conv_kwargs in zip(database.index, _batch_jobs(database)):
+        size_mb, chunk_mb = _estimate_job(conv_kwargs)
+        jobs.append(BatchJob(row=int(row), kwargs=conv_kwargs, size_mb=size_mb, chunk_mb=chunk_mb))
+
+    jobs = run_batch(jobs, zarr_convert, log_dir, workers=workers, memory_budget_mb=memory_budget)
+    print_summary(jobs, log_dir)
+    n_failed = sum(job.status != "done" for job in jobs)
+    if n_failed:
+        raise SystemExit(f"{n_failed} of {len(jobs)} conversions failed.")
 
 def convert_single(args):
     """Runmode to convert a single image to zarr
@@ -387,7 +624,11 @@ def convert_single(args):
         f'--scene_index {args.scene_index} --channel_names {args.channel_names} '
         f'--channel_colors {args.channel_colors} --zarr_format {args.zarr_format} '
         f'--num_levels {args.num_levels} --downscale_factor {args.downscale_factor} '
-        f'--chunk_size {args.chunk_size} --subset {args.subset}'
+        f'--chunk_size {args.chunk_size} --subset {args.subset} '
+        f'--read_processes {args.read_processes} --all_scenes {args.all_scenes} '
+        f'--scenes_layout {args.scenes_layout} --scene_workers {args.scene_workers} '
+        f'--memory_budget {args.memory_budget} --plan {args.plan} '
+        f'--access_pattern {args.access_pattern} --storage {args.storage}'
     )
     print(f'Converting single file.\nRunning through: {cli}')
     exclude = {"runmode"}
@@ -402,6 +643,101 @@ def convert_single(args):
     # Convert 2 zarr
     zarr_convert(**conv_kwargs)
 
+def migrate(args):
+    """Runmode to migrate an NGFF v0.4 zarr store to NGFF v0.5
+
+    Args:
+        args (args): parsed arguments
+    """
+    from pymif.microscope_manager.utils.migrate import migrate_to_v05
+
+    print(f'Migrating {args.input_path} to NGFF v0.5 at {args.zarr_path}.')
+    migrate_to_v05(
+        args.input_path,
+        args.zarr_path,
+        compressor=None if args.compressor == "none" else args.compressor,
+        compressor_level=args.compressor_level,
+        shard_shape=args.shard_shape,
+        move=args.move,
+        max_workers=args.workers,
+        resume=not args.no_resume,
+        overwrite=args.overwrite,
+    )
+
+def watch(args):
+    """Runmode to stream a running acquisition into a zarr
+
+    Args:
+        args (args): parsed arguments
+    """
+    from pymif.microscope_manager.utils.watch import watch_to_zarr
+
+    manager, resolved_microscope = _resolve_zarr_manager(args.input_path, args.microscope)
+    if resolved_microscope not in ("viventis", "luxendo"):
+        raise TypeError(f"watch only supports viventis and luxendo acquisitions, not {resolved_microscope}.")
+
+    metadata = manager.probe(args.input_path)
+    downscale_factor = _normalize_downscale_factor(args.downscale_factor)
+    if args.chunk_size is not None:
+        chunk_size = tuple(args.chunk_size)
+    else:
+        chunk_size, _, _ = _select_chunk_size(metadata, args.max_size)
+    num_levels = args.num_levels or _estimate_levels(metadata, downscale_factor)
+
+    print(f'Watching {args.input_path} ({resolved_microscope}) into {args.zarr_path}.')
+    try:
+        watch_to_zarr(
+            manager,
+            args.input_path,
+            args.zarr_path,
+            chunks=chunk_size,
+            num_levels=num_levels,
+            downscale_factor=downscale_factor,
+            poll_interval=args.poll_interval,
+            settle_seconds=args.settle,
+            idle_timeout=args.idle_timeout or None,
+            zarr_format=int(args.zarr_format),
+        )
+    except KeyboardInterrupt:
+        print('Watch interrupted; rerun the same command to resume.')
+
+def bench(args):
+    """Runmode to benchmark PyMIF on a synthetic dataset
+
+    Args:
+        args (args): parsed arguments
+    """
+    from pymif.cli.bench import describe_bench, run_bench, write_bench_csv
+
+    axes = args.axes.lower()
+    if len(args.shape) != len(axes):
+        raise ValueError(f"--shape has {len(args.shape)} values but --axes {axes!r} has {len(axes)}.")
+    if args.chunk_size is not None:
+        chunk_size = tuple(args.chunk_size)
+    else:
+        metadata = {"axes": axes, "size": [tuple(args.shape)], "dtype": args.dtype}
+        chunk_size, _, _ = _select_chunk_size(metadata, args.max_size)
+
+    print(f'Benchmarking {tuple(args.shape)} {axes} {args.dtype}, chunks {chunk_size}, in {args.output_dir}.')
+    results = run_bench(
+        args.output_dir,
+        shape=tuple(args.shape),
+        axes=axes,
+        dtype=args.dtype,
+        chunks=chunk_size,
+        num_levels=args.num_levels,
+        zarr_formats=args.zarr_formats,
+        compressors=[None if c == "none" else c for c in args.compressors],
+        region_size=tuple(args.region_size),
+        repeats=args.repeats,
+        seed=args.seed,
+        keep=args.keep,
+    )
+    print(describe_bench(results))
+    if args.report:
+        write_bench_csv(results, args.report)
+        print(f'Results written to {args.report}.')
+
 def main():
     """Main fxn
 
@@ -412,6 +748,12 @@ def main():
         convert_single(args)
     elif args.runmode == 1:
         convert_batch(args)
+    elif args.runmode == 2:
+        migrate(args)
+    elif args.runmode == 3:
+        watch(args)
+    elif args.runmode == 4:
+        bench(args)
     # TODO There is room for more runmodes possibly in the future
 
 if __name__ == "__main__":
@@ -5,4 +5,5 @@ from .zarr_v04_manager import ZarrV04Manager
 from .array_manager import ArrayManager
 from .opera_manager import OperaManager
 from .zeiss_manager import ZeissManager
-from .scape_manager import ScapeManager
\ No newline at end of file
+from .scape_manager import ScapeManager
+from .tiff_manager import TiffManager
\ No newline at end of file
@@ -8,6 +8,7 @@ import numpy as np
 
 from .microscope_manager import MicroscopeManager
 from .utils.axes import normalize_axes, infer_axes_from_ndim, spatial_axes_in_order, normalize_data_type
+from .utils.shared_buffers import attach_shared_memory, is_zero_copy_buffer, zero_copy_dask
 
 
 class ArrayManager(MicroscopeManager):
@@ -15,6 +16,9 @@ class ArrayManager(MicroscopeManager):
     Create a MicroscopeManager instance from in-memory NumPy or Dask array(s)
     with user-defined metadata. Supports single resolution or multiscale pyramid.
 
+    ``np.memmap`` and shared-memory inputs are never copied: each dask block
+    is a view of the buffer, with block boundaries on page boundaries.
+
     The default remains legacy TCZYX for 5D arrays, but ``metadata['axes']`` may
     be any unique combination of ``t``, ``c``, ``z``, ``y`` and ``x`` whose length
     matches the input arrays.
@@ -25,6 +29,7 @@ class ArrayManager(MicroscopeManager):
         array: Union[np.ndarray, da.Array, List[Union[np.ndarray, da.Array]]],
         metadata: Dict[str, Any],
         chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096),
+        probe: bool = False,
     ):
         """Initialize ArrayManager with a single array or pyramid.
 
@@ -38,14 +43,73 @@ class ArrayManager(MicroscopeManager):
             ``data_type`` may be ``"intensity"`` or ``"label"``.
         chunks
             Dask chunk shape for NumPy inputs.  When omitted or incompatible with
-            the dimensionality, automatic chunking is used.
+            the dimensionality, automatic chunking is used.  For memory-mapped
+            and shared-memory inputs, sizes are rounded down to whole pages.
+        probe
+            Only normalize the metadata; ``data`` stays empty.
+            See :meth:`MicroscopeManager.probe`.
         """
         super().__init__()
         self.data = array
         self.metadata = dict(metadata)
         self.chunks = chunks
+        if probe:
+            self.metadata = self._probe_metadata()
+            self.data = []
+            return
         self.read()
 
+    @classmethod
+    def from_shared_memory(
+        cls,
+        name: str,
+        shape: Tuple[int, ...],
+        dtype,
+        metadata: Dict[str, Any],
+        chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096),
+        order: str = "C",
+        offset: int = 0,
+    ) -> "ArrayManager":
+        """Attach to an existing shared-memory block by name, without copying it.
+
+        Parameters
+        ----------
+        name
+            Name of the :class:`multiprocessing.shared_memory.SharedMemory` block,
+            as created by the acquisition software.
+        shape, dtype, order, offset
+            Layout of the image inside the block.
+        metadata, chunks
+            As for :class:`ArrayManager`.
+
+        Returns
+        -------
+        ArrayManager
+            Manager whose blocks are views of the shared memory. The block is
+            detached by :meth:`close`; it is never unlinked, which remains the
+            job of its creator.
+        """
+        shm = attach_shared_memory(name)
+        try:
+            array = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset, order=order)
+            manager = cls(array, metadata, chunks=chunks)
+        except Exception:
+            shm.close()
+            raise
+        manager._open_files.append(shm)
+        return manager
+
+    def close(self) -> None:
+        """Drop the arrays, then detach shared memory and close open files."""
+        if self._open_files:
+            # A shared-memory block cannot be unmapped while views of it exist.
+            self.data = []
+        super().close()
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Normalize the in-memory metadata; wrapping the arrays in dask costs no I/O."""
+        return self.read()[1]
+
     @staticmethod
     def _normalize_chunks(chunks, shape: tuple[int, ...]):
         if chunks is None:
@@ -86,7 +150,14 @@ class ArrayManager(MicroscopeManager):
                 raise ValueError(
                     f"Each level ndim must match metadata['axes']={''.join(axes)!r}."
                 )
-            if isinstance(level, np.ndarray):
+            if isinstance(level, np.ndarray) and is_zero_copy_buffer(level):
+                level_chunks = self._normalize_chunks(chunks, level.shape)
+                if level_chunks == "auto":
+                    level_chunks = tuple(
+                        c[0] for c in da.core.normalize_chunks("auto", level.shape, dtype=level.dtype)
+                    )
+                level = zero_copy_dask(level, level_chunks)
+            elif isinstance(level, np.ndarray):
                 level = da.from_array(level, chunks=self._normalize_chunks(chunks, level.shape))
             elif isinstance(level, da.Array):
                 if not level.chunks:
@@ -1,23 +1,77 @@
 import os, re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Union
+import warnings
 import dask.array as da
 import h5py
 import numpy as np
+from dask.base import tokenize
 from .microscope_manager import MicroscopeManager
+from .utils.blockwise import block_reader_array
+from .utils.chunk_align import align_to_storage, read_amplification
+from .utils.h5_chunks import h5_layout
+from .utils.h5_pool import H5PoolLease, get_h5_pool
+from .utils.metadata_cache import cached_metadata
 import itertools
 
+
+def _read_lux_block(*, 
+                    files: List[str], 
+                    dataset_name: str, 
+                    size_c: int, 
+                    block_dtype: np.dtype, 
+                    read_processes: Optional[int] = None,
+                    block_info=None) -> np.ndarray:
+    """Read one TCZYX block from the (t, c) HDF5 files through the handle pool.
+
+    With ``read_processes`` the HDF5 regions are decoded in the shared process
+    pool of :mod:`pymif.microscope_manager.utils.h5_process` instead.
+    """
+    location = block_info[None]["array-location"]
+    (t0, t1), (c0, c1) = location[:2]
+    region = tuple(slice(start, stop) for start, stop in location[2:])
+    block_shape = tuple(stop - start for start, stop in location)
+
+    if read_processes:
+        from .utils.h5_process import decode_block
+        parts = [
+            ((ti - t0, ci - c0), files[ti * size_c + ci], dataset_name, region)
+            for ti in range(t0, t1)
+            for ci in range(c0, c1)
+        ]
+        return decode_block(parts, block_shape, block_dtype, read_processes)
+
+    pool = get_h5_pool()
+    out = np.empty(block_shape, dtype=block_dtype)
+    for ti in range(t0, t1):
+        for ci in range(c0, c1):
+            out[ti - t0, ci - c0] = pool.read(files[ti * size_c + ci], dataset_name, region)
+    return out
+
+def _tp_ch_numbers(filename: str) -> Tuple[int, int]:
+    """Return the ``(timepoint, channel)`` encoded as ``tp-<n>`` and ``ch-<n>`` in a file name."""
+    tp_match = re.search(r'tp-(\d+)', filename)
+    ch_match = re.search(r'ch-(\d+)', filename)
+    tp = int(tp_match.group(1)) if tp_match else -1
+    ch = int(ch_match.group(1)) if ch_match else -1
+    return tp, ch
+
 class LuxendoManager(MicroscopeManager):
     """
     Reader for Luxendo microscope data saved as multi-resolution HDF5 (.lux.h5) and XML metadata.
 
     This class parses Luxendo's XML configuration and builds a lazy Dask array pyramid for downstream processing.
     """
+
+    DEFAULT_CHUNKS: Tuple[int, ...] = (1, 1, 8, 4096, 4096)
         
     def __init__(self, 
                  path: str,
-                 chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096)):
+                 chunks: Optional[Tuple[int, ...]] = None,
+                 read_processes: Optional[int] = None,
+                 probe: bool = False,
+                 cache_metadata: Union[bool, str] = False):
         """
         Initialize the LuxendoManager.
 
@@ -26,23 +80,45 @@ class LuxendoManager(MicroscopeManager):
         path : str
             Path to the Luxendo dataset directory.
         chunks : Tuple[int, ...], optional
-            Chunk shape for Dask arrays, by default (1, 1, 8, 4096, 4096).
+            Chunk shape for Dask arrays. By default ``DEFAULT_CHUNKS`` rounded,
+            per level, to whole multiples of the HDF5 storage chunks so that
+            no storage chunk is decompressed twice. Explicit chunks are used
+            as given; a warning reports the read amplification if they cut
+            through storage chunks.
+        read_processes : int, optional
+            Decode HDF5 blocks in a pool of this many worker processes, which
+            sidesteps the GIL that h5py holds during decompression. Decoded
+            blocks come back through shared memory without being copied, and
+            the rest of the pipeline (e.g. zarr encoding) keeps using threads.
+            By default blocks are decoded in the calling thread.
+        probe : bool, optional
+            Only parse the XML metadata; no HDF5 file is opened and ``data``
+            stays empty. See :meth:`MicroscopeManager.probe`.
+        cache_metadata : bool or str, optional
+            Keep the parsed metadata, file listing and HDF5 dataset layouts in
+            a sidecar file, reused on the next open as long as the XML and
+            HDF5 files keep their modification times and sizes. ``True``
+            writes ``.pymif-metadata.json`` into the dataset folder, a path
+            writes the sidecar into that directory instead.
         """
         
         super().__init__()
         self.path = Path(path)
         self.chunks = chunks
+        self.read_processes = read_processes
+        self.cache_metadata = cache_metadata
+        self.h5_layouts: Dict[str, Dict[str, Any]] = {}
         self._open_files = []
-        self.read()
+        self._load(probe)
 
-    def _parse_metadata(self) -> Dict[str, Any]:
+    def _parse_xml_metadata(self) -> Dict[str, Any]:
         """
-        Parse XML metadata from the Luxendo dataset.
+        Parse the XML metadata of the Luxendo dataset, without opening HDF5 files.
 
         Returns
         -------
         Dict[str, Any]
-            A dictionary containing dataset shape, voxel sizes, channel info, and other metadata.
+            A dictionary containing the full-resolution shape, voxel sizes, channel info, and other metadata.
         """
         
         xml_path = next(self.path.glob("*.xml"))
@@ -79,27 +155,12 @@ class LuxendoManager(MicroscopeManager):
         size_z, size_y, size_x = setup_sizes[0]  # all setups have same size
         scales = [setup_voxels[0]]
         units = ["micrometer"] * 3  # consistent with metadata
-        
-        # Gather HDF5 files and dataset names
-        h5_files = sorted(self.path.glob("*.lux.h5"))
-        dataset_names = self.get_available_datasets(h5_files[0])
-        
-        size = [(size_t, size_c) + self._read_h5_shape(h5_files[0], ds_name)[0] for ds_name in dataset_names]
-        
-        for name in dataset_names[1:]:
-            downscale_factors = list(map(int, re.findall(r'\d+', name)))
-            
-            scales.append(tuple([
-                scales[0][0] * downscale_factors[0],
-                scales[0][1] * downscale_factors[1],
-                scales[0][2] * downscale_factors[2],
-            ]))
             
         palette = ['white', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan']
         channel_colors = list(itertools.islice(itertools.cycle(palette), len(channel_names)))
 
         return {
-            "size": size,
+            "size": [(size_t, size_c, size_z, size_y, size_x)],
             "scales": scales,
             "units": tuple(units),
             "time_increment": 1.0,
@@ -110,29 +171,104 @@ class LuxendoManager(MicroscopeManager):
             "plane_files": None,
             "axes": "tczyx"
         }
+
+    def _parse_metadata(self) -> Dict[str, Any]:
+        """
+        Parse XML metadata and the resolution levels stored in the HDF5 files.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary containing dataset shape, voxel sizes, channel info, and other metadata.
+        """
+        
+        metadata = self._parse_xml_metadata()
+        size_t, size_c = metadata["size"][0][:2]
+        scales = metadata["scales"]
+        
+        # Gather HDF5 files and dataset names
+        h5_files = sorted(self.path.glob("*.lux.h5"))
+        dataset_names = self.get_available_datasets(h5_files[0])
+        
+        metadata["size"] = [(size_t, size_c) + self._read_h5_shape(h5_files[0], ds_name)[0] for ds_name in dataset_names]
+        
+        for name in dataset_names[1:]:
+            downscale_factors = list(map(int, re.findall(r'\d+', name)))
+            
+            scales.append(tuple([
+                scales[0][0] * downscale_factors[0],
+                scales[0][1] * downscale_factors[1],
+                scales[0][2] * downscale_factors[2],
+            ]))
         
-    def _read_h5_stack(self, h5_path: Path, 
-                       dataset_name: str) -> np.ndarray:
+        return metadata
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Parse the XML only; HDF5 resolution levels are not listed."""
+        return cached_metadata(
+            self.cache_metadata, self.path, f"{type(self).__name__}/xml",
+            self.path.glob("*.xml"), self._parse_xml_metadata,
+        )
+        
+    def _read_h5_stack(self, 
+                       h5_files: List[Path], 
+                       dataset_name: str) -> da.Array:
         """
-        Load a single resolution dataset lazily as a Dask array.
+        Load one resolution level of all (t, c) files lazily as a 5D Dask array.
+
+        Files are not opened here: every block reads its region through the
+        process-wide LRU pool of :mod:`pymif.microscope_manager.utils.h5_pool`,
+        so descriptor usage stays bounded and the graph can be pickled. The
+        graph is a single blockwise layer whose size does not depend on the
+        number of files.
 
         Parameters
         ----------
-        h5_path : Path
-            Path to the .lux.h5 file.
+        h5_files : List[Path]
+            Paths of the .lux.h5 files, ordered by timepoint then channel.
         dataset_name : str
             Internal dataset name (e.g., "Data", "Data444", etc.)
 
         Returns
         -------
-        np.ndarray
-            A Dask array loaded from the HDF5 file.
+        da.Array
+            A TCZYX Dask array, chunked as described in :meth:`__init__`.
         """
         
-        f = h5py.File(h5_path, "r")
-        self._open_files.append(f)
-        # return dask array, no readings yet
-        return da.from_array(f[dataset_name], chunks=self.chunks[2:]) 
+        t, c = self.metadata["size"][0][:2]
+        layout = self.h5_layouts.get(dataset_name) or h5_layout(h5_files[0], dataset_name)
+        self.h5_layouts[dataset_name] = layout
+        dtype = layout["dtype"]
+        shape = (t, c) + layout["shape"]
+        files = [str(f) for f in h5_files]
+
+        if self.chunks is None:
+            block = self.DEFAULT_CHUNKS[:2] + align_to_storage(
+                self.DEFAULT_CHUNKS[2:], layout["shape"], layout["chunks"], itemsize=np.dtype(dtype).itemsize
+            )
+        else:
+            block = tuple(self.chunks)
+        chunks = da.core.normalize_chunks(block, shape=shape, dtype=dtype)
+
+        amplification = read_amplification(chunks[2:], layout["chunks"])
+        if amplification > 1.0 + 1e-6:
+            warnings.warn(
+                f"Chunks {block} of '{dataset_name}' are not aligned to the HDF5 storage chunks "
+                f"{layout['chunks']} (compression: {layout['compression']}); every voxel is decoded "
+                f"{amplification:.2f}x on average. Use chunks=None to align them automatically."
+            )
+
+        return block_reader_array(
+            _read_lux_block,
+            chunks,
+            dtype,
+            name=f"luxendo-{tokenize(files, dataset_name, chunks)}",
+            files=files,
+            dataset_name=dataset_name,
+            size_c=c,
+            block_dtype=dtype,
+            read_processes=self.read_processes,
+        )
 
     def _read_h5_shape(self, h5_path: Path, dataset_name: str):
         """
@@ -174,6 +310,57 @@ class LuxendoManager(MicroscopeManager):
         dataset_names = sorted(dataset_names, key=lambda s: (len(s), s))  # natural scale order
         return dataset_names
 
+    def timepoint_files(self) -> Dict[int, List[Path]]:
+        """
+        List the HDF5 files of every timepoint for which all channels are present.
+
+        Returns
+        -------
+        Dict[int, List[Path]]
+            File paths per timepoint index, ordered by channel.
+        """
+        
+        size_c = self.metadata["size"][0][1]
+        files: Dict[int, List[Tuple[int, Path]]] = {}
+        for f in self.path.glob("*.lux.h5"):
+            tp, ch = _tp_ch_numbers(f.name)
+            files.setdefault(tp, []).append((ch, f))
+        return {
+            tp: [f for _, f in sorted(files[tp])]
+            for tp in sorted(files)
+            if len(files[tp]) == size_c
+        }
+
+    def read_timepoint(self, t: int) -> np.ndarray:
+        """
+        Read the full-resolution data of one timepoint into memory.
+
+        Parameters
+        ----------
+        t : int
+            Timepoint index, as encoded by ``tp-<t>`` in the file names.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape ``(1, C, Z, Y, X)``.
+        """
+        
+        files = self.timepoint_files().get(t)
+        if files is None:
+            raise FileNotFoundError(f"Timepoint {t} is incomplete or missing in {self.path}.")
+        dataset_name = self.get_available_datasets(files[0])[0]
+        shape, dtype = self._read_h5_shape(files[0], dataset_name)
+        location = [(0, 1), (0, len(files))] + [(0, n) for n in shape]
+        return _read_lux_block(
+            files=[str(f) for f in files],
+            dataset_name=dataset_name,
+            size_c=len(files),
+            block_dtype=dtype,
+            read_processes=self.read_processes,
+            block_info={None: {"array-location": location}},
+        )
+
     def _build_dask_array(self) -> List[da.Array]:
         """
         Construct a multiscale image pyramid as Dask arrays.
@@ -186,36 +373,18 @@ class LuxendoManager(MicroscopeManager):
         
         t, c, z, y, x = self.metadata["size"][0]
         
-        def extract_tp_ch_numbers(filename: str) -> tuple[int, int]:
-            tp_match = re.search(r'tp-(\d+)', filename)
-            ch_match = re.search(r'ch-(\d+)', filename)
-            tp = int(tp_match.group(1)) if tp_match else -1
-            ch = int(ch_match.group(1)) if ch_match else -1
-            return tp, ch
-        
         h5_files = sorted(self.path.glob("*.lux.h5"), 
-                          key=lambda f: extract_tp_ch_numbers(f.name)
+                          key=lambda f: _tp_ch_numbers(f.name)
                           )
         assert len(h5_files) == t * c, "Mismatch between expected and found HDF5 files."
 
-        dataset_names = self.get_available_datasets(h5_files[0])
+        dataset_names = list(self.h5_layouts) or self.get_available_datasets(h5_files[0])
+
+        self._open_files.append(H5PoolLease(h5_files))
 
         pyramid = []
         for ds_name in dataset_names:
-            lazy_arrays = []
-            for ti in range(t):
-                row = []
-                for ci in range(c):
-                    index = ti * c + ci
-                    h5_path = h5_files[index]
-                    # shape, dtype = self._read_h5_shape(h5_path, ds_name)
-                    delayed_arr = self._read_h5_stack(h5_path, ds_name)
-                    row.append(delayed_arr)
-                lazy_arrays.append(row)
-
-            dask_stack = da.stack([[arr for arr in row] for row in lazy_arrays], axis=0)  # T, C, Z, Y, X
-            dask_stack = dask_stack.rechunk(self.chunks)
-            pyramid.append(dask_stack)
+            pyramid.append(self._read_h5_stack(h5_files, ds_name))
             
         return pyramid
 
@@ -229,7 +398,21 @@ class LuxendoManager(MicroscopeManager):
             A list of Dask arrays (pyramidal levels) and a metadata dictionary.
         """
         
-        self.metadata = self._parse_metadata()
+        h5_files = sorted(self.path.glob("*.lux.h5"))
+
+        def parse():
+            metadata = self._parse_metadata()
+            layouts = {name: h5_layout(h5_files[0], name) for name in self.get_available_datasets(h5_files[0])}
+            return {"metadata": metadata, "h5_layouts": layouts}
+
+        parsed = cached_metadata(
+            self.cache_metadata, self.path, type(self).__name__,
+            list(self.path.glob("*.xml")) + h5_files, parse,
+        )
+        self.metadata = parsed["metadata"]
+        self.h5_layouts = {
+            name: {**layout, "dtype": np.dtype(layout["dtype"])} for name, layout in parsed["h5_layouts"].items()
+        }
         self.data = self._build_dask_array()
         return
     
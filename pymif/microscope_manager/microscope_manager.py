@@ -44,6 +44,44 @@ class MicroscopeManager(ABC):
         """
         pass
 
+    @classmethod
+    def probe(cls, *args, **kwargs) -> Dict[str, Any]:
+        """Return the normalized metadata of a dataset without reading its data.
+
+        Only the vendor metadata (XML, OME-XML, TIFF or zarr headers) is parsed:
+        no dask graph is built and pixel data files are not opened. Arguments
+        are those of the manager's constructor, e.g.
+        ``LuxendoManager.probe(path)``. Equivalent to
+        ``cls(*args, probe=True, **kwargs).metadata``.
+
+        ``size`` and ``scales`` always describe the full-resolution level;
+        pyramid levels stored in the data files may be omitted.
+        """
+        return cls(*args, probe=True, **kwargs).metadata
+
+    def _load(self, probe: bool = False) -> None:
+        """Populate the manager from its source, or only its metadata if ``probe``."""
+        if probe:
+            self.metadata = self._probe_metadata()
+            self.data = []
+        else:
+            self.read()
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """
+        Parse the normalized metadata only, without building dask arrays.
+
+        The default falls back to a full :meth:`read`; managers override it
+        to parse the vendor metadata alone.
+
+        Returns
+        ----------
+        Dict[str, Any]
+            Metadata in the same schema as ``read``.
+        """
+        self.read()
+        return self.metadata
+
     def to_zarr(self, 
                 path: str,
                 **kwargs) -> None:
@@ -101,12 +139,15 @@ class MicroscopeManager(ABC):
                       num_levels: Optional[int] = 3, 
                       downscale_factor: int | Sequence[int] | None = 2,
                       start_level: Optional[int] = 0,
+                      reuse_levels: bool = False,
                       ) -> None:
         """Build additional pyramid levels from the current base-resolution data.
 
         The resulting data and scale metadata replace ``self.data`` and
         ``self.metadata`` in-place. This is mainly useful for managers that
-        initially expose only one resolution level.
+        initially expose only one resolution level. With ``reuse_levels=True``
+        existing levels of matching shape (e.g. a pyramid stored in the source
+        file) are kept instead of being recomputed.
         """
         from .utils.pyramid import build_pyramid as _build_pyramid
         self.data, self.metadata = _build_pyramid(
@@ -114,8 +155,58 @@ class MicroscopeManager(ABC):
             num_levels=num_levels, 
             downscale_factor=2 if downscale_factor is None else downscale_factor,
             start_level = start_level,
+            reuse_levels=reuse_levels,
         )
 
+    def get_region(self,
+                   bbox_physical: Dict[str, Any] | Sequence[Sequence[float]],
+                   target_resolution: float | Sequence[float] | Dict[str, float] | None = None,
+                   return_level: bool = False,
+                   ) -> da.Array | Tuple[da.Array, int, Tuple[float, ...]]:
+        """Return a lazy region selected in physical units from the best pyramid level.
+
+        The coarsest level listed in ``metadata["scales"]`` whose voxel size is
+        not larger than ``target_resolution`` on any spatial axis is used, so
+        only the chunks of that level intersecting the box are ever read.
+        Physical coordinates account for the level's NGFF translation, listed
+        in ``metadata["translations"]`` when the dataset has one.
+
+        Parameters
+        ----------
+        bbox_physical : dict | sequence
+            ``{axis: (start, stop)}`` in dataset units for ``z``/``y``/``x``,
+            or a sequence of ``(start, stop)`` pairs in spatial axis order.
+            Omitted spatial axes are returned in full. ``t`` and ``c`` may be
+            selected by index with an integer, a slice or a ``(start, stop)`` pair.
+        target_resolution : float | sequence | dict | None
+            Largest acceptable voxel size, either isotropic, per spatial axis,
+            or as ``{axis: size}`` for the constrained axes only. ``None``
+            reads the full-resolution level.
+        return_level : bool
+            Also return the index of the level used and its spatial voxel size.
+
+        Returns
+        -------
+        dask.array.Array or (dask.array.Array, int, tuple of float)
+            The lazily sliced region, followed with ``return_level`` by the
+            pyramid level it was read from and that level's voxel size.
+        """
+        from .utils.region import physical_to_index, select_level
+
+        if not self.data:
+            raise ValueError("No data loaded.")
+
+        scales = self.metadata["scales"][: len(self.data)]
+        translations = list(self.metadata.get("translations") or [])
+        axes = self.metadata.get("axes")
+        level = select_level(scales, axes, target_resolution)
+        arr = self.data[level]
+        translation = translations[level] if level < len(translations) else None
+        index = physical_to_index(bbox_physical, axes, scales[level], arr.shape, translation=translation)
+        if return_level:
+            return arr[index], level, tuple(scales[level])
+        return arr[index]
+
     def close(self) -> None:
         """Close all open resources, such as file handles."""
         for f in getattr(self, "_open_files", []):
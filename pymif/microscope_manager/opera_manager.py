@@ -4,9 +4,11 @@ import dask.array as da
 import zarr
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
+import warnings
 import tifffile
 from .microscope_manager import MicroscopeManager
+from .utils.chunk_align import align_to_storage, read_amplification
 
 class OperaManager(MicroscopeManager):
     """
@@ -14,10 +16,13 @@ class OperaManager(MicroscopeManager):
 
     This class reads and parses OME-XML metadata embedded in the TIFF file.
     """
+
+    DEFAULT_CHUNKS: Tuple[int, ...] = (1, 1, 8, 4096, 4096)
         
     def __init__(self, 
                  path: str,
-                 chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096)):
+                 chunks: Optional[Tuple[int, ...]] = None,
+                 probe: bool = False):
         """
         Initialize the OperaManager with the given file path.
 
@@ -26,13 +31,18 @@ class OperaManager(MicroscopeManager):
         path : str
             Path to the Opera pyramidal OME-TIFF file.
         chunks : tuple of int, optional
-            Chunk sizes for Dask arrays in TCZYX order. Defaults to (1, 1, 8, 4096, 4096).
+            Chunk sizes for Dask arrays in TCZYX order. By default ``DEFAULT_CHUNKS``
+            rounded, per level, to whole TIFF tiles and pages. Explicit chunks are
+            used as given; a warning reports the read amplification if they cut
+            through tiles.
+        probe : bool, optional
+            Only parse the OME-XML; ``data`` stays empty. See :meth:`MicroscopeManager.probe`.
         """
         
         super().__init__()
         self.path = Path(path)
         self.chunks = chunks
-        self.read()
+        self._load(probe)
 
     def _parse_metadata(self) -> dict:
         """
@@ -99,6 +109,10 @@ class OperaManager(MicroscopeManager):
             "axes": "tczyx"
         }
 
+    def _probe_metadata(self) -> dict:
+        """Parse the embedded OME-XML only; pyramid levels are not listed."""
+        return self._parse_metadata()
+
     def _build_dask_array(self) -> List[da.Array]:
         """
         Load pyramid levels from the pyramidal OME-TIFF and convert them to Dask arrays.
@@ -140,45 +154,64 @@ class OperaManager(MicroscopeManager):
             
             return da.transpose(arr, axes=permute_order)
         
-        with tifffile.TiffFile(self.path) as tif:
-            store = tif.aszarr()
-            zgroup = zarr.open(store, mode="r")
-            
-            if isinstance(zgroup, zarr.Array):
-                    pyramid = [
-                        (da.from_zarr(zgroup), tif.series[0].axes.lower())
-                    ]            
+        # Keep the file open for the lifetime of the manager; released by close().
+        tif = tifffile.TiffFile(self.path)
+        self._open_files.append(tif)
+        zgroup = zarr.open(tif.aszarr(), mode="r")
+
+        if isinstance(zgroup, zarr.Array):
+            pyramid = [
+                (zgroup, tif.series[0].axes.lower())
+            ]
+        else:
+            pyramid = [
+                (
+                    zgroup[str(i)], # image data
+                    tif.series[0].levels[i].axes.lower(), # axes order
+                ) for i in range(len(zgroup))
+            ]
+
+        data_levels = []
+        sizes = []
+        scales = []
+
+        # Base pixel sizes (scale)
+        base_scale = self.metadata["scales"][0]
+        base_size = self.metadata["size"][0][2:] # ZYX only
+
+        for i, (zarray, axes) in enumerate(pyramid):
+
+            # Dask chunks aligned to the TIFF tiles/pages, in the file's axes order
+            shape = tuple(zarray.shape[axes.index(ax)] if ax in axes else 1 for ax in "tczyx")
+            storage = tuple(zarray.chunks[axes.index(ax)] if ax in axes else 1 for ax in "tczyx")
+            if self.chunks is None:
+                chunks = align_to_storage(self.DEFAULT_CHUNKS, shape, storage, itemsize=zarray.dtype.itemsize)
             else:
-                pyramid = [
-                    ( 
-                        da.from_zarr(zgroup[str(i)]), # image data
-                        tif.series[0].levels[i].axes.lower(), # axes order
-                    ) for i in range(len(zgroup))
-                ]
-
-            data_levels = []
-            sizes = []
-            scales = []
-
-            # Base pixel sizes (scale)
-            base_scale = self.metadata["scales"][0]
-            base_size = self.metadata["size"][0][2:] # ZYX only
-
-            for i, level in enumerate(pyramid):
-
-                # Reorder to TCZYX
-                arr = _reorder_axes(level[0], level[1])
-
-                # Update scale
-                current_size = arr.shape[2:]
-                level_scale = (
-                                base_scale[0] / current_size[0] * base_size[0],
-                                base_scale[1] / current_size[1] * base_size[1],
-                                base_scale[2] / current_size[2] * base_size[2],
-                                )  # Z, Y, X
-                scales.append(level_scale)  # T, C, Z, Y, X
-                sizes.append(self.metadata["size"][0][:2] + current_size)
-                data_levels.append(arr.rechunk(chunks = self.chunks))
+                chunks = tuple(self.chunks)
+                amplification = read_amplification(
+                    da.core.normalize_chunks(chunks, shape=shape), storage
+                )
+                if amplification > 1.0 + 1e-6:
+                    warnings.warn(
+                        f"Chunks {chunks} of level {i} are not aligned to the TIFF tiles {storage}; "
+                        f"every pixel is decoded {amplification:.2f}x on average. "
+                        "Use chunks=None to align them automatically."
+                    )
+            arr = da.from_zarr(zarray, chunks=tuple(chunks["tczyx".index(ax)] for ax in axes))
+
+            # Reorder to TCZYX
+            arr = _reorder_axes(arr, axes)
+
+            # Update scale
+            current_size = arr.shape[2:]
+            level_scale = (
+                            base_scale[0] / current_size[0] * base_size[0],
+                            base_scale[1] / current_size[1] * base_size[1],
+                            base_scale[2] / current_size[2] * base_size[2],
+                            )  # Z, Y, X
+            scales.append(level_scale)  # T, C, Z, Y, X
+            sizes.append(self.metadata["size"][0][:2] + current_size)
+            data_levels.append(arr)
 
         self.metadata["scales"] = scales
         self.metadata["size"] = sizes
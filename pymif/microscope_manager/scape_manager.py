@@ -1,11 +1,11 @@
 import dask.array as da
-from dask import delayed
-from tifffile import imread, TiffFile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Tuple, Dict, Any, Optional
 
 from .microscope_manager import MicroscopeManager
+from .utils.handle_pool import HandleLease
+from .utils.tiff_planes import get_tiff_pool, tiff_series_layout, tiff_series_to_tczyx
 
 
 class ScapeManager(MicroscopeManager):
@@ -18,12 +18,16 @@ class ScapeManager(MicroscopeManager):
         self,
         ome_tiff_path: str,
         chunks: Tuple[int, ...] = (1, 1, 8, 1024, 1024),
+        probe: bool = False,
     ):
-        """Open a Leica SCAPE dataset described by an OME-TIFF and companion XLIF file."""
+        """Open a Leica SCAPE dataset described by an OME-TIFF and companion XLIF file.
+
+        With ``probe=True`` only the XLIF file is parsed, see :meth:`MicroscopeManager.probe`.
+        """
         super().__init__()
         self.ome_tiff_path = Path(ome_tiff_path)
         self.chunks = chunks
-        self.read()
+        self._load(probe)
 
     # ---------- Path resolution helpers ----------
 
@@ -222,52 +226,36 @@ class ScapeManager(MicroscopeManager):
     # ---------- Dask array construction ----------
 
     def _build_dask_array(self) -> List[da.Array]:
-        """Build a TCZYX dask array from the provided OME-TIFF file."""
-        ome_path = self.ome_tiff_path.resolve()
+        """Build a chunked TCZYX dask array from the provided OME-TIFF file.
 
-        with TiffFile(str(ome_path)) as tf:
-            series = tf.series[0]
-            tif_shape = series.shape
-            tif_axes = getattr(series, "axes", None)
-
-        lazy_read = delayed(imread)
-        arr = da.from_delayed(
-            lazy_read(str(ome_path)),
-            shape=tif_shape,
-            dtype=self.metadata["dtype"],
-        )
+        Each block reads only the TIFF pages it covers, so memory use is
+        bounded by ``self.chunks`` rather than by the file size.
+        """
+        ome_path = self.ome_tiff_path.resolve()
+        layout = tiff_series_layout(ome_path)
+        tif_axes = layout["axes"]
 
-        if tif_axes is None:
+        if any(ax not in "TCZYX" for ax in tif_axes):
             # Fallback if axes are not defined
             t, c, z, y, x = self.metadata["size"][0]
-            if arr.ndim == 3:      # (z, y, x)
-                arr = arr[None, None, ...]
-            elif arr.ndim == 4:    # (z, c, y, x) or (c, z, y, x)
-                if arr.shape[1] == c:
-                    arr = arr[None, ...]
-                    arr = arr.transpose(0, 2, 1, 3, 4)
-                elif arr.shape[0] == c:
-                    arr = arr[None, ...]
-                else:
-                    arr = arr[None, None, ...]
-        else:
-            axes_in = tif_axes.upper()
-            target = "TCZYX"
-            idx = {ax: i for i, ax in enumerate(axes_in)}
-
-            # Add missing singleton dimensions
-            for ax in target:
-                if ax not in idx:
-                    arr = da.expand_dims(arr, axis=0)
-                    axes_in = ax + axes_in
-                    idx = {a: i for i, a in enumerate(axes_in)}
-
-            perm = [idx[ax] for ax in target]
-            arr = arr.transpose(*perm)
-
-        arr = arr.rechunk(self.chunks)
+            tif_shape = layout["shape"]
+            if len(tif_shape) == 3:      # (z, y, x)
+                tif_axes = "ZYX"
+            elif len(tif_shape) == 4 and tif_shape[1] == c:
+                tif_axes = "ZCYX"
+            elif len(tif_shape) == 4:
+                tif_axes = "CZYX"
+
+        arr = tiff_series_to_tczyx(ome_path, self.chunks, axes=tif_axes)
+        self._open_files.append(HandleLease(get_tiff_pool(), [ome_path]))
         return [arr]
 
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Parse the XLIF file only; the OME-TIFF is not opened."""
+        self.metadata = self._parse_xlif_metadata()
+        self._convert_spatial_units_to_micrometers()
+        return self.metadata
+
     def read(self):
         """Main entry point: parse metadata and build data array."""
         self.metadata = self._parse_xlif_metadata()
@@ -0,0 +1,262 @@
+import glob
+import os
+import re
+import warnings
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List, Tuple, Dict, Any, Optional
+
+import dask.array as da
+import numpy as np
+import tifffile
+
+from .microscope_manager import MicroscopeManager
+from .utils.chunk_align import align_to_storage, read_amplification
+from .utils.handle_pool import HandleLease
+from .utils.ngff import _normalize_unit
+from .utils.tiff_planes import (
+    TCZYX,
+    check_tczyx_axes,
+    get_tiff_pool,
+    get_tiled_tiff_pool,
+    tiff_series_layout,
+    tiff_series_to_tczyx,
+    tiled_tiff_to_tczyx,
+)
+
+
+def _natural_key(path: str):
+    """Sort key that orders ``t2`` before ``t10``."""
+    return [int(tok) if tok.isdigit() else tok for tok in re.split(r"(\d+)", path)]
+
+
+class TiffManager(MicroscopeManager):
+    """
+    Manager for plain TIFF and OME-TIFF stacks from any instrument.
+
+    Uncompressed contiguous stacks are memory-mapped, other uncompressed
+    stacks are read page by page, and compressed stacks are read through
+    ``tifffile``'s zarr interface so only the tiles of a chunk are decoded.
+    A glob pattern concatenates several files along one axis.
+    """
+
+    DEFAULT_CHUNKS: Tuple[int, ...] = (1, 1, 8, 4096, 4096)
+
+    def __init__(self,
+                 path: str,
+                 chunks: Optional[Tuple[int, ...]] = None,
+                 series: int = 0,
+                 axes: Optional[str] = None,
+                 stack_axis: str = "t",
+                 probe: bool = False):
+        """
+        Open a TIFF stack or a sequence of TIFF stacks.
+
+        Parameters
+        ----------
+        path : str
+            TIFF/OME-TIFF file, or a glob pattern such as ``"stack_t*.tif"``.
+            Matching files are sorted naturally and must share shape and dtype.
+        chunks : tuple of int, optional
+            Dask chunks in TCZYX order. By default ``DEFAULT_CHUNKS``, rounded to
+            whole tiles for compressed files.
+        series : int
+            TIFF series to read.
+        axes : str, optional
+            Axes of the series, e.g. ``"ZCYX"``, overriding what the file declares.
+            Labels that are not T, C, Z, Y or X are otherwise guessed, with a warning.
+        stack_axis : str
+            Axis along which the files of a glob pattern are concatenated.
+        probe : bool, optional
+            Only parse the metadata and header of the first file; ``data`` stays
+            empty. See :meth:`MicroscopeManager.probe`.
+        """
+
+        super().__init__()
+        self.path = str(path)
+        self.chunks = chunks
+        self.series = series
+        self.axes = axes
+        self.stack_axis = stack_axis.lower()
+        if self.stack_axis not in "tcz" or len(self.stack_axis) != 1:
+            raise ValueError(f"stack_axis must be one of 't', 'c', 'z', not {stack_axis!r}.")
+        self.files = self._resolve_files()
+        self._load(probe)
+
+    def _resolve_files(self) -> List[str]:
+        """Return the TIFF files addressed by ``self.path``."""
+        if glob.has_magic(self.path):
+            files = sorted(glob.glob(self.path), key=_natural_key)
+            if not files:
+                raise FileNotFoundError(f"No TIFF file matches {self.path}.")
+            return files
+        if not os.path.isfile(self.path):
+            raise FileNotFoundError(f"TIFF file not found: {self.path}")
+        return [self.path]
+
+    def _series_axes(self, layout: Dict[str, Any]) -> str:
+        """Return the TCZYX axes of the series, guessing unknown leading labels."""
+        if self.axes is not None:
+            return check_tczyx_axes(self.axes, layout["shape"])
+
+        axes = layout["axes"]
+        if axes.endswith("YX") and any(ax not in TCZYX for ax in axes[:-2]):
+            free = [ax for ax in "TCZ" if ax not in axes]
+            unknown = [ax for ax in axes[:-2] if ax not in TCZYX]
+            if len(unknown) <= len(free):
+                guess = free[len(free) - len(unknown):]
+                mapped = "".join(guess.pop(0) if ax not in TCZYX else ax for ax in axes[:-2]) + "YX"
+                warnings.warn(
+                    f"TIFF series axes {axes!r} interpreted as {mapped!r}; pass axes= to override."
+                )
+                axes = mapped
+        return check_tczyx_axes(axes, layout["shape"])
+
+    def _parse_metadata(self) -> Dict[str, Any]:
+        """
+        Parse OME-XML, or ImageJ and resolution tags, of the first file.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Metadata dictionary in the PyMIF schema. ``size`` is filled by `read`.
+        """
+
+        scales = [1.0, 1.0, 1.0]
+        unit = "micrometer"
+        time_increment, time_unit = 1.0, "s"
+        channel_names, channel_colors = [], []
+
+        with tifffile.TiffFile(self.files[0]) as tif:
+            if tif.is_ome and tif.ome_metadata:
+                root = ET.fromstring(tif.ome_metadata)
+                images = [el for el in root if el.tag.endswith("Image")]
+                image = images[min(self.series, len(images) - 1)] if images else root
+                pixels = next(el for el in image.iter() if el.tag.endswith("Pixels"))
+                scales = [
+                    float(pixels.attrib.get("PhysicalSizeZ", 1)),
+                    float(pixels.attrib.get("PhysicalSizeY", 1)),
+                    float(pixels.attrib.get("PhysicalSizeX", 1)),
+                ]
+                unit = _normalize_unit(pixels.attrib.get("PhysicalSizeXUnit")) or unit
+                time_increment = float(pixels.attrib.get("TimeIncrement", 1))
+                time_unit = pixels.attrib.get("TimeIncrementUnit", "s")
+                for i, channel in enumerate(el for el in pixels if el.tag.endswith("Channel")):
+                    channel_names.append(channel.attrib.get("Name", f"Ch{i}"))
+                    if "Color" in channel.attrib:
+                        # Signed 32-bit RGBA
+                        rgba = int(channel.attrib["Color"]) & 0xFFFFFFFF
+                        channel_colors.append(f"#{rgba >> 8:06X}")
+            else:
+                page = tif.series[self.series].keyframe
+                ij = tif.imagej_metadata or {}
+                resolution = page.tags.get("XResolution"), page.tags.get("YResolution")
+                if all(tag is not None for tag in resolution):
+                    for i, tag in zip((2, 1), resolution):
+                        num, den = tag.value
+                        if num:
+                            scales[i] = den / num
+                if ij.get("spacing"):
+                    scales[0] = float(ij["spacing"])
+                if ij.get("unit"):
+                    unit = _normalize_unit(str(ij["unit"]).replace("\\u00B5", "µ")) or unit
+                if ij.get("finterval"):
+                    time_increment = float(ij["finterval"])
+                if ij.get("Labels") and isinstance(ij["Labels"], (list, tuple)):
+                    channel_names = [str(n) for n in ij["Labels"]]
+
+        return {
+            "scales": [tuple(scales)],
+            "units": (unit, unit, unit),
+            "time_increment": time_increment,
+            "time_increment_unit": time_unit,
+            "channel_names": channel_names,
+            "channel_colors": channel_colors,
+            "plane_files": [Path(f).name for f in self.files],
+            "axes": "tczyx",
+        }
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Parse the metadata and series header of the first file, assuming all files match it."""
+        metadata = self._parse_metadata()
+        layout = tiff_series_layout(self.files[0], self.series)
+        sizes = dict(zip(self._series_axes(layout), layout["shape"]))
+        shape = [sizes.get(ax, 1) for ax in TCZYX]
+        shape["tczyx".index(self.stack_axis)] *= len(self.files)
+        self._finish_metadata(metadata, tuple(shape), layout["dtype"])
+        return metadata
+
+    def _finish_metadata(self, metadata: Dict[str, Any], shape: Tuple[int, ...], dtype) -> None:
+        """Fill size, dtype and per-channel defaults once the array shape is known."""
+        size_c = shape[1]
+        names = metadata["channel_names"]
+        colors = metadata["channel_colors"]
+        default_colors = ["#FFFFFF", "#FF0000", "#0000FF", "#00FF00"]
+        metadata["channel_names"] = [names[i] if i < len(names) else f"Ch{i}" for i in range(size_c)]
+        metadata["channel_colors"] = [
+            colors[i] if i < len(colors) else default_colors[i % len(default_colors)] for i in range(size_c)
+        ]
+        metadata["size"] = [tuple(shape)]
+        metadata["dtype"] = str(dtype)
+
+    def _file_to_dask(self, path: str) -> da.Array:
+        """Expose one TIFF series as a lazy TCZYX dask array."""
+        layout = tiff_series_layout(path, self.series)
+        axes = self._series_axes(layout)
+        sizes = dict(zip(axes, layout["shape"]))
+        shape = tuple(sizes.get(ax, 1) for ax in TCZYX)
+        requested = self.DEFAULT_CHUNKS if self.chunks is None else tuple(self.chunks)
+
+        if not layout["compressed"]:
+            # Memory-mapped when contiguous, page-indexed reads otherwise.
+            self._open_files.append(HandleLease(get_tiff_pool(), [path]))
+            return tiff_series_to_tczyx(path, requested, series=self.series, axes=axes)
+
+        # Opened lazily through a bounded pool, so long series do not exhaust file descriptors.
+        self._open_files.append(HandleLease(get_tiled_tiff_pool(), [path]))
+        with get_tiled_tiff_pool().checkout(path) as tiled:
+            zarray = tiled.level(self.series)
+            storage = tuple(zarray.chunks[axes.index(ax)] if ax in axes else 1 for ax in TCZYX)
+            itemsize = zarray.dtype.itemsize
+        if self.chunks is None:
+            chunks = align_to_storage(requested, shape, storage, itemsize=itemsize)
+        else:
+            chunks = requested
+            amplification = read_amplification(da.core.normalize_chunks(chunks, shape=shape), storage)
+            if amplification > 1.0 + 1e-6:
+                warnings.warn(
+                    f"Chunks {chunks} are not aligned to the TIFF tiles {storage}; "
+                    f"every pixel is decoded {amplification:.2f}x on average. "
+                    "Use chunks=None to align them automatically."
+                )
+        return tiled_tiff_to_tczyx(path, chunks, series=self.series, axes=axes)
+
+    def read(self) -> Tuple[List[da.Array], Dict[str, Any]]:
+        """
+        Build the lazy TCZYX array and its metadata.
+
+        Returns
+        -------
+        Tuple[List[da.Array], Dict[str, Any]]
+            A tuple containing:
+            - A list with one dask array representing the image data.
+            - A metadata dictionary with pixel sizes, units, axes, etc.
+        """
+
+        self.metadata = self._parse_metadata()
+
+        arrays = [self._file_to_dask(f) for f in self.files]
+        for f, arr in zip(self.files[1:], arrays[1:]):
+            if arr.dtype != arrays[0].dtype or any(
+                a != b for i, (a, b) in enumerate(zip(arr.shape, arrays[0].shape)) if i != "tczyx".index(self.stack_axis)
+            ):
+                raise ValueError(
+                    f"{f} has shape {arr.shape} and dtype {arr.dtype}, "
+                    f"incompatible with {self.files[0]} ({arrays[0].shape}, {arrays[0].dtype})."
+                )
+        data = arrays[0] if len(arrays) == 1 else da.concatenate(arrays, axis="tczyx".index(self.stack_axis))
+        self.data = [data]
+        self.chunks = data.chunksize
+
+        self._finish_metadata(self.metadata, data.shape, data.dtype)
+        return
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import dask.array as da
+import numpy as np
+import zarr
+
+from .axes import normalize_axes
+from .downsampling import SpatialFactor, axis_names_from_multiscales
+from .ngff import DEFAULT_COLORS, _default_window, _get_group_multiscales
+from .occupancy import (
+    get_occupancy_index,
+    occupancy_for_array,
+    occupy_region,
+    resize_occupancy_entry,
+    set_occupancy_index,
+)
+from .write_image_region import _get_nested_group, _write_region
+
+APPENDABLE_AXES = ("t", "c")
+
+
+def _extend_omero_channels(group: zarr.Group, n_channels: int, dtype) -> None:
+    """Add default OMERO display entries for channels appended to ``group``."""
+    attrs = group.attrs.asdict()
+    versioned = isinstance(attrs.get("ome"), dict)
+    container = dict(attrs["ome"]) if versioned else attrs
+    omero = container.get("omero")
+    if not omero or "channels" not in omero:
+        return
+
+    lo, hi = _default_window(dtype)
+    channels = list(omero["channels"])
+    for i in range(len(channels), n_channels):
+        channels.append(
+            {
+                "label": f"channel_{i}",
+                "color": DEFAULT_COLORS[i % len(DEFAULT_COLORS)],
+                "window": {"start": lo, "end": hi, "min": lo, "max": hi},
+                "active": True,
+                "inverted": False,
+                "coefficient": 1.0,
+                "family": "linear",
+            }
+        )
+    omero = {**omero, "channels": channels}
+    if versioned:
+        container["omero"] = omero
+        group.attrs["ome"] = container
+    else:
+        group.attrs["omero"] = omero
+
+
+def append_to_group(
+    root: zarr.Group,
+    mode: str,
+    data: Union[np.ndarray, da.Array, list[Union[np.ndarray, da.Array]]],
+    axis: str = "t",
+    group_name: Optional[str] = None,
+    downscale_factor: SpatialFactor | None = None,
+) -> tuple[int, int]:
+    """Append data along a non-spatial axis of every level of an OME-Zarr pyramid.
+
+    Each level array is resized in place, which only rewrites its array
+    metadata, and ``data`` is written into the new slices. Coarser levels are
+    derived from ``data`` alone unless a full list of levels is passed, so
+    the cost is proportional to the appended data. Occupancy indexes and, for
+    ``axis="c"``, OMERO channel entries are extended accordingly.
+
+    Existing chunks are left untouched only when the arrays end on a chunk
+    (or shard) boundary along ``axis``, e.g. always with chunks of 1 along
+    it. Otherwise the last, partly filled chunk of every level is read,
+    completed with the new slices and rewritten.
+
+    Returns
+    -------
+    tuple of int
+        ``(start, stop)`` of the appended slices along ``axis``.
+    """
+    if mode not in ("r+", "a", "w"):
+        raise PermissionError(
+            f"Dataset opened in read-only mode ({mode!r}). Reopen with mode='r+' to allow modifications."
+        )
+
+    group = _get_nested_group(root, group_name)
+    if group is None:
+        raise ValueError(f"Group {group_name!r} not found. Available root groups: {list(root.group_keys())}")
+
+    multiscales_all = _get_group_multiscales(group)
+    if not multiscales_all or not multiscales_all[0].get("datasets"):
+        raise ValueError(f"Group {group_name or '/'!r} does not contain a multiscale image.")
+    multiscales = multiscales_all[0]
+    arrays = [group[ds["path"]] for ds in multiscales["datasets"]]
+
+    axes = normalize_axes(axis_names_from_multiscales(multiscales), ndim=arrays[0].ndim)
+    axis = str(axis).lower()
+    if axis not in APPENDABLE_AXES:
+        raise ValueError(f"Can only append along {APPENDABLE_AXES}, not {axis!r}.")
+    if axis not in axes:
+        raise ValueError(f"Dataset axes {''.join(axes)!r} have no {axis!r} axis to append to.")
+    index = axes.index(axis)
+
+    level0 = data[0] if isinstance(data, list) else data
+    start = int(arrays[0].shape[index])
+    count = int(level0.shape[index])
+    expected = tuple(count if i == index else s for i, s in enumerate(arrays[0].shape))
+    if tuple(level0.shape) != expected:
+        raise ValueError(f"Appended data must have shape {expected}, got {tuple(level0.shape)}.")
+    if count == 0:
+        return start, start
+
+    occupancy = get_occupancy_index(group)
+    occupancy = list(occupancy) if occupancy else None
+    for level, arr in enumerate(arrays):
+        shape = tuple(start + count if i == index else s for i, s in enumerate(arr.shape))
+        entry = occupancy_for_array(occupancy, level, arr)
+        appended = [(int(arr.shape[i]), s) if i == index else (0, s) for i, s in enumerate(shape)]
+        arr.resize(shape)
+        if entry is not None:
+            # The appended slices may hold data anywhere; flag them occupied up front
+            # so that writing them keeps the index.
+            occupancy[level] = occupy_region(resize_occupancy_entry(entry, shape), appended)
+    if occupancy is not None:
+        set_occupancy_index(group, occupancy)
+    if axis == "c":
+        _extend_omero_channels(group, start + count, arrays[0].dtype)
+
+    _write_region(
+        root=root,
+        mode=mode,
+        data=data,
+        selectors={axis: slice(start, start + count)},
+        level=0,
+        group_name=group_name,
+        downscale_factor=downscale_factor,
+    )
+    return start, start + count
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import Any, Callable, Sequence
+
+import dask.array as da
+import numpy as np
+
+
+class _Opaque:
+    """Hold a block-function argument that dask must neither traverse nor hash."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _read_located_block(block_id, *, read_block: Callable[..., np.ndarray], starts, **kwargs) -> np.ndarray:
+    """Translate a block index into the ``block_info`` that ``read_block`` expects."""
+    location = [(s[i], s[i + 1]) for s, i in zip(starts.value, block_id)]
+    kwargs = {k: v.value if isinstance(v, _Opaque) else v for k, v in kwargs.items()}
+    return read_block(block_info={None: {"array-location": location}}, **kwargs)
+
+
+def block_reader_array(
+    read_block: Callable[..., np.ndarray],
+    chunks: Sequence[Sequence[int]],
+    dtype,
+    name: str,
+    **kwargs: Any,
+) -> da.Array:
+    """Build a lazy array from a block reader in one blockwise layer of constant size.
+
+    ``da.map_blocks`` with a ``block_info`` argument precomputes one dict per
+    block, and walks list and dict arguments element by element, so building
+    a graph over thousands of files takes longer than reading the first
+    block. Here the block function only receives its block index and derives
+    the ``array-location`` from the chunk boundaries; large arguments (file
+    lists, plane maps) are passed by reference without being traversed or
+    hashed. They must not be dask collections, and the layer has no
+    dependency, so slicing still culls it to the blocks that are needed.
+
+    Parameters
+    ----------
+    read_block : callable
+        Function called as ``read_block(block_info=..., **kwargs)`` with
+        ``block_info[None]["array-location"]`` set, returning the block.
+    chunks : sequence of sequence of int
+        Normalized dask chunks.
+    dtype
+        Data type of the array.
+    name : str
+        Unique name of the array; callers tokenize the identity of the source
+        (paths, chunks) rather than its full file listing.
+    **kwargs
+        Forwarded to ``read_block``.
+
+    Returns
+    -------
+    dask.array.Array
+    """
+    starts = tuple(tuple(accumulate(c, initial=0)) for c in chunks)
+    for key, value in kwargs.items():
+        if isinstance(value, (list, dict, tuple, set)):
+            kwargs[key] = _Opaque(value)
+    return da.map_blocks(
+        _read_located_block,
+        chunks=tuple(tuple(c) for c in chunks),
+        dtype=dtype,
+        meta=np.empty((0,) * len(chunks), dtype=dtype),
+        name=name,
+        read_block=read_block,
+        starts=_Opaque(starts),
+        **kwargs,
+    )
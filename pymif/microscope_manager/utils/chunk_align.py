@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+
+DEFAULT_MAX_BLOCK_MB = 512
+
+
+def align_to_storage(
+    requested: Sequence[int],
+    shape: Sequence[int],
+    storage_chunks: Sequence[int] | None,
+    itemsize: int | None = None,
+    max_block_mb: float = DEFAULT_MAX_BLOCK_MB,
+) -> tuple[int, ...]:
+    """Round ``requested`` to whole multiples of ``storage_chunks`` per axis.
+
+    Each axis gets at least one storage chunk and never more than the axis
+    length. Without storage chunks (contiguous data) ``requested`` is only
+    clipped to ``shape``.
+
+    With ``itemsize``, blocks are kept within ``max_block_mb`` (or the
+    requested block size, if larger): when rounding up would exceed it, the
+    axes grown the most are rounded down instead, to a multiple of the
+    storage chunk or, below one storage chunk, to a divisor of it. Such a
+    block decodes its storage chunks more than once, see
+    :func:`read_amplification`, but its memory stays bounded.
+    """
+    clipped = tuple(max(1, min(int(r), int(s))) for r, s in zip(requested, shape))
+    if storage_chunks is None:
+        return clipped
+
+    aligned = []
+    for req, size, stored in zip(requested, shape, storage_chunks):
+        n = max(1, round(int(req) / int(stored)))
+        aligned.append(max(1, min(n * int(stored), int(size))))
+    if itemsize is None:
+        return tuple(aligned)
+
+    budget = max(max_block_mb * 1024 * 1024, math.prod(clipped) * int(itemsize))
+    for i in sorted(range(len(aligned)), key=lambda i: clipped[i] / aligned[i]):
+        if math.prod(aligned) * int(itemsize) <= budget:
+            break
+        if aligned[i] <= clipped[i]:
+            continue
+        stored = int(storage_chunks[i])
+        if clipped[i] >= stored:
+            aligned[i] = clipped[i] - clipped[i] % stored
+        else:
+            aligned[i] = max(d for d in range(1, clipped[i] + 1) if stored % d == 0)
+    return tuple(aligned)
+
+
+def read_amplification(
+    dask_chunks: Sequence[Sequence[int]],
+    storage_chunks: Sequence[int] | None,
+) -> float:
+    """Return how many voxels are decoded per voxel delivered for a chunking.
+
+    Each dask block decodes every storage chunk it intersects, so blocks that
+    cut through storage chunks decode those chunks more than once. ``1.0``
+    means every storage chunk is decoded exactly once.
+    """
+    if storage_chunks is None:
+        return 1.0
+
+    ratio = 1.0
+    for blocks, stored in zip(dask_chunks, storage_chunks):
+        size = sum(blocks)
+        if size == 0:
+            continue
+        decoded = 0
+        start = 0
+        for block in blocks:
+            stop = start + block
+            for k in range(start // stored, math.ceil(stop / stored)):
+                decoded += min(stored, size - k * stored)
+            start = stop
+        ratio *= decoded / size
+    return ratio
+
+
+def write_unit(zarr_array) -> tuple[int, ...]:
+    """Return the region a writer must own to store ``zarr_array`` safely.
+
+    This is the shard shape of sharded arrays, where chunks of one shard
+    share a file, and the chunk shape otherwise.
+    """
+    shards = getattr(zarr_array, "shards", None)
+    return tuple(int(c) for c in (shards or zarr_array.chunks))
+
+
+def align_blocks(arr, unit: Sequence[int]):
+    """Rechunk the dask array ``arr`` so that no block spans two write units.
+
+    Blocks that already tile ``unit`` exactly are kept; ``arr`` is returned
+    unchanged then.
+    """
+    if any(any(c != u for c in dim[:-1]) or dim[-1] > u for dim, u in zip(arr.chunks, unit)):
+        return arr.rechunk(tuple(int(u) for u in unit))
+    return arr
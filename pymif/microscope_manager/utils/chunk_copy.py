@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import zarr
+
+METADATA_FILES = frozenset({".zarray", ".zattrs", ".zgroup", ".zmetadata", "zarr.json"})
+"""Names of the zarr v2 and v3 metadata documents stored next to chunk files."""
+
+_V2_LAYOUT_FIELDS = ("shape", "chunks", "dtype", "compressor", "filters", "order", "fill_value", "dimension_separator")
+_V3_LAYOUT_FIELDS = ("shape", "data_type", "chunk_grid", "chunk_key_encoding", "fill_value", "codecs")
+
+
+def _local_array_dir(zarr_array: zarr.Array) -> Path | None:
+    """Return the directory holding ``zarr_array``'s chunks on a local store."""
+    if not isinstance(zarr_array.store, zarr.storage.LocalStore):
+        return None
+    return Path(zarr_array.store.root) / zarr_array.path
+
+
+def stored_bytes(root: str | os.PathLike) -> int:
+    """Size of the chunk files below ``root``, ignoring zarr metadata documents."""
+    total = 0
+    for folder, _, files in os.walk(root):
+        for name in files:
+            if name not in METADATA_FILES:
+                total += os.path.getsize(os.path.join(folder, name))
+    return total
+
+
+def can_copy_chunks(source: zarr.Array, target: zarr.Array) -> bool:
+    """Return ``True`` if encoded chunks of ``source`` are valid chunks of ``target``.
+
+    Both arrays must live on local stores and share zarr format, shape, dtype,
+    chunk grid, chunk key encoding, fill value and the full codec pipeline.
+    """
+    source_dir = _local_array_dir(source)
+    target_dir = _local_array_dir(target)
+    if source_dir is None or target_dir is None:
+        return False
+    if source_dir.resolve() == target_dir.resolve():
+        return False
+
+    src_meta = source.metadata
+    dst_meta = target.metadata
+    if src_meta.zarr_format != dst_meta.zarr_format:
+        return False
+
+    fields = _V2_LAYOUT_FIELDS if src_meta.zarr_format == 2 else _V3_LAYOUT_FIELDS
+    try:
+        return all(getattr(src_meta, f) == getattr(dst_meta, f) for f in fields)
+    except (AttributeError, ValueError):
+        return False
+
+
+def copy_chunks(
+    source: zarr.Array,
+    target: zarr.Array,
+    max_workers: int | None = None,
+) -> int:
+    """Copy every stored chunk file of ``source`` into ``target`` without decoding.
+
+    Parameters
+    ----------
+    source, target : zarr.Array
+        Arrays accepted by :func:`can_copy_chunks`.
+    max_workers : int | None
+        Number of concurrent copy threads. Defaults to the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    int
+        Number of chunk files copied. Chunks that were never written in the
+        source are not created in the target either.
+    """
+    if not can_copy_chunks(source, target):
+        raise ValueError(
+            f"Chunks of {source.path!r} cannot be copied byte-for-byte into {target.path!r}."
+        )
+
+    source_dir = _local_array_dir(source)
+    target_dir = _local_array_dir(target)
+
+    jobs = []
+    for dirpath, _, filenames in os.walk(source_dir):
+        rel = Path(dirpath).relative_to(source_dir)
+        for name in filenames:
+            if rel == Path(".") and name in METADATA_FILES:
+                continue
+            jobs.append((Path(dirpath) / name, target_dir / rel / name))
+
+    for parent in {dst.parent for _, dst in jobs}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(lambda job: shutil.copyfile(*job), jobs))
+
+    return len(jobs)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import math
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .chunk_align import read_amplification
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AccessProfile:
+    """How the converted data will mostly be read.
+
+    ``stages`` lists groups of axes in the order chunks grow along them:
+    the axes of a group grow together, the one with the smallest physical
+    extent first, until the chunk reaches its size budget or spans them
+    completely; only then does the next group grow.
+    """
+
+    name: str
+    stages: tuple[str, ...]
+    max_chunk_mb: float | None = None
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """Costs of the storage the output is written to.
+
+    Every chunk is a file (or object) and every read of it a request, so
+    chunks below ``min_chunk_mb``, or more than ``max_files`` chunks per
+    level, are grouped into shards of about ``shard_mb`` on Zarr v3.
+    """
+
+    name: str
+    target_chunk_mb: float
+    min_chunk_mb: float
+    max_files: int
+    shard_mb: float
+    description: str = ""
+
+
+ACCESS_PROFILES = {
+    "napari-2D": AccessProfile(
+        "napari-2D", ("yx", "z", "t", "c"), max_chunk_mb=4,
+        description="Plane-by-plane browsing: YX tiles one plane deep, grown in Z only once a plane fits.",
+    ),
+    "3D-analysis": AccessProfile(
+        "3D-analysis", ("zyx", "t", "c"),
+        description="Volumetric processing: chunks close to cubic in physical units.",
+    ),
+    "time-series": AccessProfile(
+        "time-series", ("t", "zyx", "c"),
+        description="Per-voxel traces: chunks span many timepoints of a small region.",
+    ),
+}
+
+STORAGE_PROFILES = {
+    "local": StorageProfile(
+        "local", target_chunk_mb=8, min_chunk_mb=0.5, max_files=100_000, shard_mb=256,
+        description="Local SSD or NVMe: small reads are cheap.",
+    ),
+    "network": StorageProfile(
+        "network", target_chunk_mb=32, min_chunk_mb=4, max_files=10_000, shard_mb=512,
+        description="NFS, SMB or parallel file systems: every file costs a metadata round trip.",
+    ),
+    "object": StorageProfile(
+        "object", target_chunk_mb=64, min_chunk_mb=16, max_files=100_000, shard_mb=1024,
+        description="S3-like object stores: every request has a high latency.",
+    ),
+}
+
+
+@dataclass
+class ChunkPlan:
+    """Chunk and shard shapes chosen by :func:`plan_chunks`, in the order of the axes."""
+
+    access: str
+    storage: str
+    chunks: tuple[int, ...]
+    shards: tuple[int, ...] | None
+    chunk_mb: float
+    shard_mb: float | None
+    n_files: int
+    read_amplification: float
+
+
+def _grow(
+    unit: dict[str, int],
+    sizes: dict[str, int],
+    extents: dict[str, float],
+    stages: Sequence[str],
+    itemsize: int,
+    budget_bytes: float,
+    next_value: Callable[[str, int], int],
+) -> dict[str, int]:
+    """Grow ``unit`` stage by stage, one axis step at a time, within ``budget_bytes``."""
+    unit = dict(unit)
+    for stage in stages:
+        group = [ax for ax in stage if ax in unit]
+        while True:
+            candidates = []
+            for ax in group:
+                if unit[ax] >= sizes[ax]:
+                    continue
+                grown = next_value(ax, unit[ax])
+                trial = {**unit, ax: grown}
+                if math.prod(trial.values()) * itemsize > budget_bytes:
+                    continue
+                candidates.append((unit[ax] * extents[ax], ax, grown))
+            if not candidates:
+                break
+            _, ax, grown = min(candidates)
+            unit[ax] = grown
+    return unit
+
+
+def plan_chunks(
+    shape: Sequence[int],
+    axes: str,
+    dtype,
+    *,
+    source_chunks: Sequence[int] | None = None,
+    scales: Sequence[float] | None = None,
+    access: str = "3D-analysis",
+    storage: str = "local",
+    max_chunk_mb: float | None = None,
+    zarr_format: int = 3,
+    fixed_chunks: dict[str, int] | None = None,
+) -> ChunkPlan:
+    """Choose output chunk and shard shapes for an access pattern and a storage.
+
+    Chunks start at one source block (one voxel without ``source_chunks``)
+    and double along the axes of the access profile (see
+    :data:`ACCESS_PROFILES`) up to the chunk budget of the storage profile
+    (see :data:`STORAGE_PROFILES`), so they stay multiples of the source
+    blocks and no output chunk decodes a source block it only partly uses.
+    A source block larger than the access profile's ``max_chunk_mb`` is
+    kept whole; only one larger than the storage budget (or the explicit
+    ``max_chunk_mb``) is split, into divisors along the axes the profile
+    grows last, with a warning about the read amplification. When the chunks are smaller than the storage handles efficiently, or
+    too many per level, Zarr v3 output groups them into shards.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        Full-resolution shape.
+    axes : str
+        Axis names of ``shape``, e.g. ``"tczyx"``.
+    dtype
+        Data type of the output.
+    source_chunks : sequence of int | None
+        Blocks the source decodes at once, e.g. ``dataset.data[0].chunksize``
+        of a reader that aligns its chunks to the file tiles.
+    scales : sequence of float | None
+        Physical voxel size of the spatial axes, in their order in ``axes``.
+        Used to keep "3D-analysis" chunks isotropic. Default: isotropic voxels.
+    access : str
+        Key of :data:`ACCESS_PROFILES`.
+    storage : str
+        Key of :data:`STORAGE_PROFILES`.
+    max_chunk_mb : float | None
+        Upper bound on the chunk size, on top of the profiles' budgets.
+    zarr_format : int
+        Shards are only planned for Zarr v3.
+    fixed_chunks : dict[str, int] | None
+        Chunk sizes of axes the caller does not let the planner choose,
+        e.g. ``{"c": 1}`` for writers that always store one channel per
+        chunk. These axes are neither grown nor split.
+
+    Returns
+    -------
+    ChunkPlan
+        ``n_files`` is the number of chunk (or shard) files of the
+        full-resolution level; ``read_amplification`` the voxels decoded
+        from the source per voxel written, see
+        :func:`~pymif.microscope_manager.utils.chunk_align.read_amplification`.
+    """
+    if access not in ACCESS_PROFILES:
+        raise ValueError(f"Unknown access pattern {access!r}; use one of {sorted(ACCESS_PROFILES)}.")
+    if storage not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage {storage!r}; use one of {sorted(STORAGE_PROFILES)}.")
+    profile = ACCESS_PROFILES[access]
+    store = STORAGE_PROFILES[storage]
+
+    axes = str(axes).lower()
+    itemsize = np.dtype(dtype).itemsize
+    sizes = {ax: max(1, int(s)) for ax, s in zip(axes, shape)}
+    source = dict(zip(axes, (int(c) for c in source_chunks))) if source_chunks is not None else {}
+    spatial = [ax for ax in axes if ax in "zyx"]
+    extents = {ax: 1.0 for ax in axes}
+    if scales is not None:
+        extents.update({ax: float(s) for ax, s in zip(spatial, scales)})
+
+    budget_mb = min(
+        b for b in (store.target_chunk_mb, profile.max_chunk_mb, max_chunk_mb) if b is not None
+    )
+
+    def next_chunk(ax: str, current: int) -> int:
+        block = source.get(ax)
+        if not block or block >= sizes[ax]:
+            return min(sizes[ax], current * 2)
+        if current < block:
+            return next(d for d in range(current + 1, block + 1) if block % d == 0)
+        return min(sizes[ax], current * 2)
+
+    def previous_chunk(ax: str, current: int) -> int:
+        block = min(source.get(ax) or sizes[ax], sizes[ax])
+        smaller = [d for d in range(current // 2, current) if block % d == 0]
+        return max(smaller) if smaller else math.ceil(current / 2)
+
+    # Source blocks are the smallest chunks that read every source voxel once.
+    start = {ax: min(source.get(ax, 1), sizes[ax]) for ax in axes}
+    fixed = {ax: max(1, min(int(c), sizes[ax])) for ax, c in (fixed_chunks or {}).items() if ax in sizes}
+    start.update(fixed)
+    # Too large a block is split along the axes the access profile grows last.
+    shrink_order = [[ax for ax in stage if ax in start and ax not in fixed] for stage in reversed(profile.stages)]
+    shrink_order.append([ax for ax in axes if ax not in fixed and not any(ax in stage for stage in profile.stages)])
+    # The access profile's cap is a preference; the storage and explicit caps are hard limits.
+    hard_mb = min(b for b in (store.target_chunk_mb, max_chunk_mb) if b is not None)
+    while math.prod(start.values()) * itemsize > hard_mb * MB:
+        group = next((g for g in shrink_order if any(start[ax] > 1 for ax in g)), None)
+        if group is None:
+            break
+        ax = max((ax for ax in group if start[ax] > 1), key=lambda a: start[a] * extents[a])
+        start[ax] = previous_chunk(ax, start[ax])
+
+    chunk_map = _grow(start, {**sizes, **fixed}, extents, profile.stages, itemsize, budget_mb * MB, next_chunk)
+    chunks = tuple(chunk_map[ax] for ax in axes)
+    chunk_mb = math.prod(chunks) * itemsize / MB
+    n_chunks = math.prod(math.ceil(sizes[ax] / chunk_map[ax]) for ax in axes)
+
+    shards = None
+    if int(zarr_format) == 3 and (chunk_mb < store.min_chunk_mb or n_chunks > store.max_files):
+        limits = {ax: math.ceil(sizes[ax] / chunk_map[ax]) * chunk_map[ax] for ax in axes}
+
+        def next_shard(ax: str, current: int) -> int:
+            return min(limits[ax], current * 2)
+
+        shard_map = _grow(chunk_map, limits, extents, profile.stages, itemsize, store.shard_mb * MB, next_shard)
+        if shard_map != chunk_map:
+            shards = tuple(shard_map[ax] for ax in axes)
+
+    files = shards or chunks
+    n_files = math.prod(math.ceil(sizes[ax] / f) for ax, f in zip(axes, files))
+    amplification = 1.0
+    if source_chunks is not None:
+        output = tuple(
+            tuple(min(c, s - start) for start in range(0, s, c))
+            for s, c in zip((sizes[ax] for ax in axes), chunks)
+        )
+        amplification = read_amplification(output, tuple(source[ax] for ax in axes))
+        if amplification > 1:
+            warnings.warn(
+                f"Source blocks {tuple(source_chunks)} exceed the {hard_mb:g} MB chunk budget; "
+                f"chunks {chunks} read {amplification:.1f}x the source data.",
+                UserWarning,
+                stacklevel=2,
+            )
+
+    return ChunkPlan(
+        access=access,
+        storage=storage,
+        chunks=chunks,
+        shards=shards,
+        chunk_mb=chunk_mb,
+        shard_mb=None if shards is None else math.prod(shards) * itemsize / MB,
+        n_files=n_files,
+        read_amplification=amplification,
+    )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+import h5py
+
+
+def h5_layout(path, dataset_name: str) -> dict[str, Any]:
+    """Return shape, dtype, storage chunks and compression of an HDF5 dataset.
+
+    ``chunks`` is ``None`` for contiguous datasets.
+    """
+    with h5py.File(path, "r") as f:
+        ds = f[dataset_name]
+        return {
+            "shape": tuple(int(s) for s in ds.shape),
+            "dtype": ds.dtype,
+            "chunks": tuple(int(c) for c in ds.chunks) if ds.chunks else None,
+            "compression": ds.compression,
+        }
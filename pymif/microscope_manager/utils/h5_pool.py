@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+import h5py
+import numpy as np
+
+DEFAULT_MAX_OPEN = 64
+
+
+class H5HandlePool:
+    """Bounded least-recently-used pool of read-only ``h5py.File`` handles.
+
+    Handles are opened lazily on first access and keyed by path. Once more
+    than ``max_open`` files are open the least recently used one is closed,
+    so descriptor usage stays constant however many files a dataset spans.
+
+    Reads go through :meth:`read`, which holds the pool lock while reading so
+    a handle is never evicted mid-read. h5py serializes calls into libhdf5
+    anyway, so the lock costs no parallelism within a process.
+
+    The pool pickles as an empty pool with the same size, which keeps dask
+    graphs that reference it usable under process-based schedulers.
+    """
+
+    def __init__(self, max_open: int = DEFAULT_MAX_OPEN):
+        if int(max_open) < 1:
+            raise ValueError("max_open must be at least 1.")
+        self.max_open = int(max_open)
+        self._files: OrderedDict[str, h5py.File] = OrderedDict()
+        self._leases: dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"max_open": self.max_open}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["max_open"])
+
+    def _get(self, path: str) -> h5py.File:
+        handle = self._files.get(path)
+        if handle is not None:
+            self._files.move_to_end(path)
+            return handle
+
+        handle = h5py.File(path, "r")
+        self._files[path] = handle
+        self._shrink(self.max_open)
+        return handle
+
+    def _shrink(self, max_open: int) -> None:
+        while len(self._files) > max_open:
+            _, handle = self._files.popitem(last=False)
+            handle.close()
+
+    def read(self, path: str | os.PathLike, dataset_name: str, region: tuple = ()) -> np.ndarray:
+        """Read ``region`` of ``dataset_name`` from the file at ``path``."""
+        with self._lock:
+            return np.asarray(self._get(os.fspath(path))[dataset_name][region])
+
+    def read_into(
+        self,
+        path: str | os.PathLike,
+        dataset_name: str,
+        region: tuple,
+        out: np.ndarray,
+    ) -> None:
+        """Decode ``region`` of ``dataset_name`` directly into the C-contiguous array ``out``."""
+        with self._lock:
+            self._get(os.fspath(path))[dataset_name].read_direct(out, source_sel=region)
+
+    def resize(self, max_open: int) -> None:
+        """Change the pool bound, closing least recently used handles if needed."""
+        if int(max_open) < 1:
+            raise ValueError("max_open must be at least 1.")
+        with self._lock:
+            self.max_open = int(max_open)
+            self._shrink(self.max_open)
+
+    def acquire(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Register one more user of the files at ``paths``, see :meth:`release`."""
+        with self._lock:
+            for path in paths:
+                path = os.fspath(path)
+                self._leases[path] = self._leases.get(path, 0) + 1
+
+    def release(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Drop one user of ``paths`` and close the handles no user is left for."""
+        with self._lock:
+            unused = []
+            for path in paths:
+                path = os.fspath(path)
+                count = self._leases.get(path, 0) - 1
+                if count > 0:
+                    self._leases[path] = count
+                else:
+                    self._leases.pop(path, None)
+                    unused.append(path)
+            self.evict(unused)
+
+    def evict(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Close the handles of ``paths`` that are currently open."""
+        with self._lock:
+            for path in paths:
+                handle = self._files.pop(os.fspath(path), None)
+                if handle is not None:
+                    handle.close()
+
+    def close(self) -> None:
+        """Close every open handle."""
+        with self._lock:
+            self._shrink(0)
+
+
+_pool: H5HandlePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_h5_pool() -> H5HandlePool:
+    """Return the process-wide HDF5 handle pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = H5HandlePool()
+    return _pool
+
+
+def set_h5_pool_size(max_open: int) -> None:
+    """Set how many HDF5 files the process-wide pool keeps open at once."""
+    get_h5_pool().resize(max_open)
+
+
+class H5PoolLease:
+    """Closable entry for :attr:`MicroscopeManager._open_files`.
+
+    Leases are counted per file: closing a lease closes the pooled handles
+    of the manager's files that no other open lease refers to. A lease does
+    not pin handles, which the pool may still close when it evicts its least
+    recently used files; they are reopened on the next read.
+    """
+
+    def __init__(self, paths: Iterable[str | os.PathLike]):
+        self.paths = [os.fspath(p) for p in paths]
+        self._closed = False
+        get_h5_pool().acquire(self.paths)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            get_h5_pool().release(self.paths)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+import numpy as np
+
+from .h5_pool import get_h5_pool
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _shared_dir() -> str:
+    """Return a RAM-backed directory for block buffers when the platform has one."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def get_process_pool(processes: int) -> ProcessPoolExecutor:
+    """Return the shared HDF5 decoding process pool with ``processes`` workers.
+
+    One pool is kept per size, so managers asking for different sizes never
+    shut down a pool another manager is still submitting to; pools are only
+    stopped by :func:`shutdown_process_pool`, which also runs at exit.
+    Workers are started with ``spawn`` so they never inherit the locks of
+    the parent's dask and h5py threads.
+    """
+    processes = int(processes)
+    with _executor_lock:
+        executor = _executors.get(processes)
+        if executor is None:
+            executor = _executors[processes] = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return executor
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared HDF5 decoding processes, if any."""
+    with _executor_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _decode_into_buffer(
+    buffer_path: str,
+    block_shape: tuple[int, ...],
+    dtype: str,
+    position: tuple[int, ...],
+    path: str,
+    dataset_name: str,
+    region: tuple[slice, ...],
+) -> None:
+    """Worker: decode one HDF5 region into its slot of the shared block buffer."""
+    out = np.memmap(buffer_path, dtype=np.dtype(dtype), mode="r+", shape=block_shape)
+    get_h5_pool().read_into(path, dataset_name, region, out[position])
+    out.flush()
+    del out
+
+
+def decode_block(
+    parts: Sequence[tuple[tuple[int, ...], str, str, tuple[slice, ...]]],
+    block_shape: tuple[int, ...],
+    dtype: np.dtype,
+    processes: int,
+) -> np.ndarray:
+    """Decode a block from several HDF5 regions in worker processes.
+
+    Each worker writes its decoded region straight into a memory-mapped
+    buffer in shared memory; the returned array maps the same pages, so the
+    decoded data never crosses a pipe or gets copied by the parent.
+
+    Parameters
+    ----------
+    parts : sequence of (position, path, dataset_name, region)
+        ``position`` indexes the leading axes of the block that the HDF5
+        ``region`` fills.
+    block_shape : tuple of int
+        Shape of the block to return.
+    dtype : np.dtype
+        Block dtype.
+    processes : int
+        Size of the shared process pool.
+    """
+    dtype = np.dtype(dtype)
+    fd, buffer_path = tempfile.mkstemp(prefix="pymif-h5-", suffix=".buf", dir=_shared_dir())
+    try:
+        try:
+            os.ftruncate(fd, max(1, int(np.prod(block_shape)) * dtype.itemsize))
+        finally:
+            os.close(fd)
+
+        pool = get_process_pool(processes)
+        futures = [
+            pool.submit(_decode_into_buffer, buffer_path, tuple(block_shape), dtype.str, position, path, name, region)
+            for position, path, name, region in parts
+        ]
+        for future in futures:
+            future.result()
+
+        block = np.memmap(buffer_path, dtype=dtype, mode="r+", shape=tuple(block_shape)).view(np.ndarray)
+    except BaseException:
+        os.unlink(buffer_path)
+        raise
+
+    try:
+        # On POSIX the mapping stays valid after unlinking and is released with the array.
+        os.unlink(buffer_path)
+    except OSError:
+        # Platforms that cannot unlink mapped files get a private copy instead.
+        block = np.array(block)
+        os.unlink(buffer_path)
+    return block
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator
+
+DEFAULT_MAX_OPEN = 64
+
+
+class FileHandlePool:
+    """Bounded least-recently-used pool of read-only file handles, shared by all threads.
+
+    Handles are opened lazily with ``opener(path)`` and kept open for later
+    blocks, so a file's header or directory is parsed once instead of once
+    per block. A handle is checked out by one reader at a time with
+    :meth:`checkout`, so readers that are not thread-safe (TIFF files,
+    libCZI readers) are never shared; threads reading the same file at once
+    get a handle each. At most ``max_open`` handles are open in the process:
+    past that bound the least recently used idle handle is closed, and a
+    reader waits when every handle is checked out.
+
+    Files are counted as in use with :meth:`acquire` / :meth:`release`
+    (see :class:`HandleLease`); :meth:`evict` and :meth:`close` close idle
+    handles at once and checked-out ones when they are returned.
+
+    Like :class:`~pymif.microscope_manager.utils.h5_pool.H5HandlePool`, the
+    pool pickles as an empty pool, provided ``opener`` is picklable.
+    """
+
+    def __init__(self, opener: Callable[[str], Any], max_open: int = DEFAULT_MAX_OPEN):
+        if int(max_open) < 1:
+            raise ValueError("max_open must be at least 1.")
+        self.opener = opener
+        self.max_open = int(max_open)
+        self._idle: OrderedDict[int, tuple[str, Any]] = OrderedDict()
+        self._busy: dict[int, tuple[str, Any]] = {}
+        self._stale: set[int] = set()
+        self._opening = 0
+        self._leases: dict[str, int] = {}
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._idle) + len(self._busy)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"opener": self.opener, "max_open": self.max_open}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["opener"], state["max_open"])
+
+    @contextlib.contextmanager
+    def checkout(self, path: str | os.PathLike) -> Iterator[Any]:
+        """Lend a handle of ``path`` to the caller until the ``with`` block ends."""
+        handle = self._take(os.fspath(path))
+        try:
+            yield handle
+        finally:
+            self._give_back(handle)
+
+    def _take(self, path: str) -> Any:
+        with self._cond:
+            while True:
+                for key in reversed(self._idle):
+                    if self._idle[key][0] == path:
+                        self._busy[key] = self._idle.pop(key)
+                        return self._busy[key][1]
+                if len(self) + self._opening < self.max_open:
+                    self._opening += 1
+                    break
+                if self._idle:
+                    _, (_, old) = self._idle.popitem(last=False)
+                    old.close()
+                    continue
+                self._cond.wait()
+
+        try:
+            handle = self.opener(path)
+        except BaseException:
+            with self._cond:
+                self._opening -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._opening -= 1
+            self._busy[id(handle)] = (path, handle)
+        return handle
+
+    def _give_back(self, handle: Any) -> None:
+        with self._cond:
+            key = id(handle)
+            entry = self._busy.pop(key)
+            if key in self._stale:
+                self._stale.discard(key)
+                handle.close()
+            else:
+                self._idle[key] = entry
+            self._cond.notify()
+
+    def acquire(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Register one more user of the files at ``paths``, see :meth:`release`."""
+        with self._cond:
+            for path in paths:
+                path = os.fspath(path)
+                self._leases[path] = self._leases.get(path, 0) + 1
+
+    def release(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Drop one user of ``paths`` and close the handles no user is left for."""
+        with self._cond:
+            unused = []
+            for path in paths:
+                path = os.fspath(path)
+                count = self._leases.get(path, 0) - 1
+                if count > 0:
+                    self._leases[path] = count
+                else:
+                    self._leases.pop(path, None)
+                    unused.append(path)
+            self.evict(unused)
+
+    def evict(self, paths: Iterable[str | os.PathLike]) -> None:
+        """Close the handles of ``paths``, checked-out ones once they are returned."""
+        paths = {os.fspath(p) for p in paths}
+        with self._cond:
+            for key in [k for k, (p, _) in self._idle.items() if p in paths]:
+                self._idle.pop(key)[1].close()
+            self._stale.update(k for k, (p, _) in self._busy.items() if p in paths)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Close every handle, checked-out ones once they are returned."""
+        with self._cond:
+            while self._idle:
+                _, (_, handle) = self._idle.popitem(last=False)
+                handle.close()
+            self._stale.update(self._busy)
+            self._cond.notify_all()
+
+
+class HandleLease:
+    """Closable entry for :attr:`MicroscopeManager._open_files`.
+
+    Closing the lease releases the pooled handles of the manager's files
+    that no other open lease refers to, as
+    :class:`~pymif.microscope_manager.utils.h5_pool.H5PoolLease` does for
+    HDF5 files.
+    """
+
+    def __init__(self, pool: FileHandlePool, paths: Iterable[str | os.PathLike]):
+        self.pool = pool
+        self.paths = [os.fspath(p) for p in paths]
+        self._closed = False
+        pool.acquire(self.paths)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.pool.release(self.paths)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Iterable, Union
+
+import numpy as np
+
+CACHE_VERSION = 1
+SIDECAR_NAME = ".pymif-metadata.json"
+
+MetadataCache = Union[bool, str, os.PathLike, None]
+
+
+def _encode(value: Any) -> Any:
+    """Turn parsed metadata into JSON, keeping tuples and non-string dict keys."""
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and "__tuple__" not in value and "__items__" not in value:
+            return {k: _encode(v) for k, v in value.items()}
+        return {"__items__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.dtype):
+        return value.str if value.names is None else str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of :func:`_encode`. Dtypes come back as strings."""
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if isinstance(value, dict):
+        if set(value) == {"__tuple__"}:
+            return tuple(_decode(v) for v in value["__tuple__"])
+        if set(value) == {"__items__"}:
+            return {_decode(k): _decode(v) for k, v in value["__items__"]}
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
+def sidecar_path(source: str | os.PathLike, cache: MetadataCache) -> Path:
+    """Return the sidecar file caching the metadata of ``source``.
+
+    ``cache=True`` stores it next to the dataset: ``<folder>/.pymif-metadata.json``
+    for folder datasets, ``.<file name>.pymif-metadata.json`` for single files.
+    A directory stores the sidecars of all datasets there, named after a hash
+    of the dataset path, for read-only acquisitions.
+    """
+    source = Path(source).resolve()
+    if cache is True:
+        if source.is_dir():
+            return source / SIDECAR_NAME
+        return source.parent / f".{source.name}{SIDECAR_NAME}"
+    digest = hashlib.sha1(str(source).encode()).hexdigest()[:16]
+    return Path(cache).expanduser() / f"{source.name}-{digest}.json"
+
+
+def fingerprint(source: str | os.PathLike, inputs: Iterable[str | os.PathLike]) -> dict[str, list[int]]:
+    """Modification time and size of every input file, keyed by path relative to the dataset."""
+    source = Path(source).resolve()
+    root = source if source.is_dir() else source.parent
+    stamps = {}
+    for path in inputs:
+        st = os.stat(path)
+        stamps[os.path.relpath(Path(path).resolve(), root)] = [st.st_mtime_ns, st.st_size]
+    return dict(sorted(stamps.items()))
+
+
+def _read_sidecar(path: Path) -> dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(content, dict) or content.get("version") != CACHE_VERSION:
+        return {}
+    return content.get("entries", {})
+
+
+def _write_sidecar(path: Path, entries: dict[str, Any]) -> None:
+    """Replace the sidecar atomically, so concurrent readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def cached_metadata(
+    cache: MetadataCache,
+    source: str | os.PathLike,
+    key: str,
+    inputs: Iterable[str | os.PathLike],
+    parse: Callable[[], Any],
+) -> Any:
+    """Return ``parse()``, reusing the sidecar entry ``key`` while ``inputs`` are unchanged.
+
+    The entry is valid as long as the set of input files and their
+    modification times and sizes match the ones recorded when it was
+    written; otherwise ``parse`` runs again and the entry is replaced.
+
+    Parameters
+    ----------
+    cache : bool | str | PathLike | None
+        ``False``/``None`` disables the cache, ``True`` keeps the sidecar next
+        to the dataset and a path keeps it in that directory. See
+        :func:`sidecar_path`.
+    source : str | PathLike
+        Dataset folder or file.
+    key : str
+        Entry name, e.g. the manager class; one sidecar holds several entries.
+    inputs : iterable of path
+        Files the parsed result depends on.
+    parse : callable
+        Parses the metadata. The result must be made of JSON types, tuples,
+        dicts, numpy scalars and dtypes (returned as strings).
+
+    Returns
+    -------
+    Any
+        The parsed or cached result.
+    """
+    if not cache:
+        return parse()
+
+    path = sidecar_path(source, cache)
+    stamps = fingerprint(source, inputs)
+    entries = _read_sidecar(path)
+    entry = entries.get(key)
+    if entry is not None and entry.get("inputs") == stamps:
+        return _decode(entry["payload"])
+
+    result = parse()
+    entries[key] = {"inputs": stamps, "payload": _encode(result)}
+    try:
+        _write_sidecar(path, entries)
+    except OSError as e:
+        warnings.warn(f"Could not write the metadata cache {path}: {e}", UserWarning)
+    return result
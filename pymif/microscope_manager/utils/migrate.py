@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Sequence
+
+import numpy as np
+import zarr
+from numcodecs import Blosc, GZip, Zstd
+
+from .chunk_copy import METADATA_FILES
+from .ngff import (
+    _build_v3_compressors,
+    _infer_data_type_from_group,
+    _normalize_shards,
+    _register_label_on_labels_group,
+    _set_dimension_names,
+    _set_group_ngff_metadata,
+)
+from .occupancy import _decode_mask, _encode_mask
+
+JOURNAL_NAME = ".pymif_migration.json"
+
+_NGFF_V04_KEYS = {"multiscales", "omero", "labels", "image-label", "data_type"}
+_BLOSC_SHUFFLE = {
+    Blosc.NOSHUFFLE: "noshuffle",
+    Blosc.SHUFFLE: "shuffle",
+    Blosc.BITSHUFFLE: "bitshuffle",
+}
+
+
+@dataclass(slots=True)
+class _ArrayPlan:
+    """How one source array is migrated into its target array."""
+
+    key: str
+    source: zarr.Array
+    target: zarr.Array
+    mode: Literal["rekey", "transcode"]
+    unit_shape: tuple[int, ...]
+    units: list[tuple[int, ...]]
+    resumed: bool = False
+
+
+class _Journal:
+    """Chunk-level progress record that makes an interrupted migration resumable.
+
+    The journal lives next to the output metadata as a small JSON file holding
+    one packed bit mask of completed write units per array. It is rewritten
+    atomically at most every ``interval`` seconds and removed on success.
+    """
+
+    def __init__(self, destination: Path, source: Path, resume: bool, interval: float = 2.0):
+        self.path = destination / JOURNAL_NAME
+        self.source = str(source)
+        self.interval = interval
+        self._last_save = 0.0
+        self._masks: dict[str, np.ndarray] = {}
+        self._stored: dict[str, dict[str, Any]] = {}
+
+        if resume and self.path.exists():
+            state = json.loads(self.path.read_text())
+            if state.get("source") != self.source:
+                raise ValueError(
+                    f"Migration journal in {destination} belongs to {state.get('source')!r}, "
+                    f"not {self.source!r}."
+                )
+            self._stored = state.get("arrays", {})
+
+    def mask(self, key: str, grid: Sequence[int], restart: bool = False) -> np.ndarray:
+        """Return the completed-unit mask of ``key``, empty if ``restart`` or unknown."""
+        grid = tuple(int(g) for g in grid)
+        if key not in self._masks:
+            stored = None if restart else self._stored.get(key)
+            if stored is not None and tuple(stored["grid"]) == grid:
+                self._masks[key] = _decode_mask(stored["done"], grid)
+            else:
+                self._masks[key] = np.zeros(grid, dtype=bool)
+        return self._masks[key]
+
+    def mark(self, key: str, unit: tuple[int, ...]) -> None:
+        self._masks[key][unit] = True
+
+    def save(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_save < self.interval:
+            return
+        state = {
+            "source": self.source,
+            "arrays": {
+                key: {"grid": list(mask.shape), "done": _encode_mask(mask)}
+                for key, mask in self._masks.items()
+            },
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.path)
+        self._last_save = now
+
+    def finish(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def _rekey_compressors(source: zarr.Array) -> tuple[bool, list | None]:
+    """Return ``(True, v3_compressors)`` if v2 chunks of ``source`` are valid v3 chunks as-is."""
+    meta = source.metadata
+    if meta.filters or meta.order != "C":
+        return False, None
+
+    dtype = np.dtype(meta.dtype.to_native_dtype())
+    if dtype.hasobject or dtype.kind not in "biufc":
+        return False, None
+    if dtype.itemsize > 1 and dtype.byteorder == ">":
+        return False, None
+
+    compressor = meta.compressor
+    if compressor is None:
+        return True, None
+    if isinstance(compressor, Blosc):
+        shuffle = _BLOSC_SHUFFLE.get(
+            compressor.shuffle, "shuffle" if dtype.itemsize > 1 else "noshuffle"
+        )
+        return True, [
+            zarr.codecs.BloscCodec(
+                cname=compressor.cname,
+                clevel=compressor.clevel,
+                shuffle=shuffle,
+                typesize=dtype.itemsize,
+                blocksize=compressor.blocksize,
+            )
+        ]
+    if isinstance(compressor, GZip):
+        return True, [zarr.codecs.GzipCodec(level=compressor.level)]
+    if isinstance(compressor, Zstd):
+        return True, [zarr.codecs.ZstdCodec(level=compressor.level)]
+    return False, None
+
+
+def _stored_v2_chunks(source: zarr.Array) -> list[tuple[int, ...]]:
+    """List the chunk coordinates that actually exist on disk for a v2 array."""
+    array_dir = Path(source.store.root) / source.path
+    separator = source.metadata.dimension_separator
+    ndim = len(source.shape)
+    found = []
+    for dirpath, _, filenames in os.walk(array_dir):
+        rel = Path(dirpath).relative_to(array_dir)
+        for name in filenames:
+            if rel == Path(".") and name in METADATA_FILES:
+                continue
+            key = name if rel == Path(".") else "/".join(rel.parts + (name,))
+            try:
+                coords = tuple(int(p) for p in key.split(separator))
+            except ValueError:
+                continue
+            if len(coords) == ndim:
+                found.append(coords)
+    return sorted(found)
+
+
+def _reusable_target(existing: Any, create_kwargs: dict[str, Any]) -> bool:
+    """Whether an array left by an interrupted run is laid out and encoded as this run would write it.
+
+    A resume with other chunks, shards or codecs must not add its chunks
+    to an array whose finished chunks were encoded differently.
+    """
+    if not isinstance(existing, zarr.Array) or existing.metadata.zarr_format != 3:
+        return False
+    expected = zarr.create_array(zarr.storage.MemoryStore(), **create_kwargs)
+    return (
+        existing.shape == expected.shape
+        and existing.dtype == expected.dtype
+        and existing.chunks == expected.chunks
+        and existing.shards == expected.shards
+        and existing.metadata.codecs == expected.metadata.codecs
+    )
+
+
+def _plan_array(
+    source: zarr.Array,
+    dst_group: zarr.Group,
+    name: str,
+    key: str,
+    *,
+    dimension_names: Sequence[str] | None,
+    compressor: str | None,
+    compressor_level: int,
+    shard_shape: Sequence[int] | None,
+    resume: bool,
+) -> _ArrayPlan:
+    """Create the v3 target array for ``source`` and decide how to fill it."""
+    chunks = tuple(int(c) for c in source.chunks)
+    shards = _normalize_shards(shard_shape, source.shape, chunks)
+    rekeyable, rekey_codecs = _rekey_compressors(source)
+
+    if compressor == "keep":
+        mode = "rekey" if rekeyable and shards is None else "transcode"
+        compressors = rekey_codecs if rekeyable else _build_v3_compressors("blosc", compressor_level)
+    else:
+        mode = "transcode"
+        compressors = _build_v3_compressors(compressor, compressor_level)
+
+    create_kwargs = {
+        "name": name,
+        "shape": tuple(int(s) for s in source.shape),
+        "chunks": chunks,
+        "dtype": np.dtype(source.metadata.dtype.to_native_dtype()).newbyteorder("="),
+        "fill_value": source.fill_value,
+        "compressors": compressors,
+        "dimension_names": list(dimension_names) if dimension_names else None,
+    }
+    if shards is not None:
+        create_kwargs["shards"] = shards
+
+    resumed = resume and name in dst_group and _reusable_target(dst_group[name], create_kwargs)
+    if resumed:
+        target = dst_group[name]
+    else:
+        target = dst_group.create_array(**create_kwargs, overwrite=True)
+
+    for attr_key, value in source.attrs.asdict().items():
+        target.attrs[attr_key] = value
+
+    if mode == "rekey":
+        unit_shape = chunks
+        units = _stored_v2_chunks(source)
+    else:
+        unit_shape = shards or chunks
+        grid = [range(math.ceil(int(s) / int(u))) for s, u in zip(source.shape, unit_shape)]
+        units = [tuple(int(i) for i in idx) for idx in np.ndindex(*[len(g) for g in grid])]
+
+    return _ArrayPlan(
+        key=key,
+        source=source,
+        target=target,
+        mode=mode,
+        unit_shape=unit_shape,
+        units=units,
+        resumed=resumed,
+    )
+
+
+def _run_unit(plan: _ArrayPlan, unit: tuple[int, ...], move: bool) -> None:
+    """Migrate one chunk (re-key) or one chunk/shard region (transcode)."""
+    if plan.mode == "rekey":
+        src = Path(plan.source.store.root) / plan.source.path / plan.source.metadata.encode_chunk_key(unit)
+        dst = Path(plan.target.store.root) / plan.target.path / plan.target.metadata.encode_chunk_key(unit)
+        if not src.exists():
+            return
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if move:
+            shutil.move(src, dst)
+        else:
+            shutil.copyfile(src, dst)
+        return
+
+    region = tuple(
+        slice(i * u, min((i + 1) * u, int(s)))
+        for i, u, s in zip(unit, plan.unit_shape, plan.source.shape)
+    )
+    plan.target[region] = plan.source[region]
+
+
+def _run_bounded(
+    pool: ThreadPoolExecutor,
+    jobs: Iterable[tuple[Callable[[], None], Callable[[], None]]],
+    max_pending: int,
+) -> None:
+    """Run ``(work, on_done)`` pairs keeping at most ``max_pending`` futures in flight."""
+    pending = {}
+    for work, on_done in jobs:
+        pending[pool.submit(work)] = on_done
+        if len(pending) >= max_pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                pending.pop(future)()
+    for future in list(pending):
+        future.result()
+        pending.pop(future)()
+
+
+def _dimension_names_for(multiscales: dict[str, Any] | None, array_name: str) -> list[str] | None:
+    if not multiscales:
+        return None
+    paths = {str(ds.get("path")) for ds in multiscales.get("datasets", [])}
+    if array_name not in paths:
+        return None
+    names = [ax.get("name") if isinstance(ax, dict) else ax for ax in multiscales.get("axes", [])]
+    return names or None
+
+
+def _migrate_group(
+    src_group: zarr.Group,
+    dst_group: zarr.Group,
+    prefix: str,
+    plans: list[_ArrayPlan],
+    options: dict[str, Any],
+) -> None:
+    """Recursively create the v3 hierarchy and NGFF v0.5 metadata for ``src_group``."""
+    attrs = src_group.attrs.asdict()
+    multiscales_all = attrs.get("multiscales") or []
+    multiscales = dict(multiscales_all[0]) if multiscales_all else None
+
+    for name, src_array in src_group.arrays():
+        plans.append(
+            _plan_array(
+                src_array,
+                dst_group,
+                name,
+                f"{prefix}{name}",
+                dimension_names=_dimension_names_for(multiscales, name),
+                **options,
+            )
+        )
+
+    for name, src_sub in src_group.groups():
+        dst_sub = dst_group.require_group(name)
+        _migrate_group(src_sub, dst_sub, f"{prefix}{name}/", plans, options)
+
+    for key, value in attrs.items():
+        if key not in _NGFF_V04_KEYS:
+            dst_group.attrs[key] = value
+
+    if multiscales is not None:
+        multiscales.pop("version", None)
+        extra = {"image-label": attrs["image-label"]} if "image-label" in attrs else None
+        _set_group_ngff_metadata(
+            dst_group,
+            ngff_version="0.5",
+            multiscales=multiscales,
+            omero=attrs.get("omero"),
+            data_type=_infer_data_type_from_group(src_group),
+            extra=extra,
+        )
+        axes = [ax.get("name") if isinstance(ax, dict) else ax for ax in multiscales.get("axes", [])]
+        _set_dimension_names(dst_group, multiscales.get("datasets", []), axes, zarr_format=3)
+
+    if "labels" in src_group.group_keys():
+        label_names = src_group["labels"].attrs.asdict().get("labels", [])
+        for label_name in label_names:
+            _register_label_on_labels_group(dst_group, str(label_name), "0.5")
+
+
+def migrate_to_v05(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    compressor: Literal["keep", "blosc", "gzip"] | None = "keep",
+    compressor_level: int = 3,
+    shard_shape: Sequence[int] | None = None,
+    move: bool = False,
+    max_workers: int | None = None,
+    resume: bool = True,
+    overwrite: bool = False,
+) -> zarr.Group:
+    """Migrate an NGFF v0.4 / Zarr v2 store to NGFF v0.5 / Zarr v3 without dask.
+
+    Metadata of every group is rewritten through the regular PyMIF NGFF
+    helpers. Chunk data is moved in parallel in one of two ways:
+
+    - **re-key**: with ``compressor="keep"`` and no sharding, chunks whose v2
+      codec has a byte-compatible v3 equivalent (no compressor, Blosc, GZip or
+      Zstd; C order; no filters) are copied, or moved with ``move=True``, to
+      their v3 chunk keys without being decoded;
+    - **transcode**: otherwise each output chunk (or shard) is decoded from the
+      source and re-encoded with the requested codec.
+
+    Parameters
+    ----------
+    source : str | Path
+        Local NGFF v0.4 / Zarr v2 store.
+    destination : str | Path
+        Output path of the NGFF v0.5 / Zarr v3 store.
+    compressor : {"keep", "blosc", "gzip", None}
+        ``"keep"`` preserves the source compression (re-keying where possible);
+        any other value recompresses on the fly, ``None`` stores raw chunks.
+    compressor_level : int
+        Compression level used when recompressing.
+    shard_shape : sequence of int | None
+        Optional shard shape in array axis order, clipped per array and
+        rounded to whole chunks. Sharded arrays are always transcoded.
+    move : bool
+        Move re-keyed chunk files instead of copying them. The source store is
+        left with its metadata only and should be discarded afterwards.
+    max_workers : int | None
+        Number of worker threads.
+    resume : bool
+        Continue an interrupted migration into ``destination`` using its
+        progress journal. Completed chunks are not migrated again; arrays
+        whose dtype, chunks, shards or codecs differ from the ones this run
+        writes are restarted from scratch.
+    overwrite : bool
+        Replace an existing ``destination`` that has no progress journal.
+
+    Returns
+    -------
+    zarr.Group
+        The migrated root group.
+    """
+    source = Path(source).resolve()
+    destination = Path(destination).resolve()
+
+    src_root = zarr.open_group(zarr.storage.LocalStore(str(source)), mode="r")
+    if src_root.metadata.zarr_format != 2:
+        raise ValueError(f"{source} is already a Zarr v3 store.")
+    if compressor not in ("keep", "blosc", "gzip", None):
+        raise ValueError(f"Unsupported compressor for migration: {compressor!r}")
+    if destination == source:
+        raise ValueError("destination must differ from source.")
+
+    resuming = resume and (destination / JOURNAL_NAME).exists()
+    if destination.exists() and not resuming and not overwrite:
+        raise FileExistsError(
+            f"{destination} already exists. Pass overwrite=True to replace it."
+        )
+
+    dst_root = zarr.open_group(
+        zarr.storage.LocalStore(str(destination)),
+        mode="a" if resuming else "w",
+        zarr_format=3,
+    )
+    journal = _Journal(destination, source, resume=resuming)
+    journal.save(force=True)
+
+    plans: list[_ArrayPlan] = []
+    options = {
+        "compressor": compressor,
+        "compressor_level": compressor_level,
+        "shard_shape": shard_shape,
+        "resume": resuming,
+    }
+    _migrate_group(src_root, dst_root, "", plans, options)
+
+    def jobs():
+        for plan in plans:
+            grid = [math.ceil(int(s) / int(u)) for s, u in zip(plan.source.shape, plan.unit_shape)]
+            done = journal.mask(plan.key, grid, restart=not plan.resumed)
+            todo = [unit for unit in plan.units if not done[unit]]
+            print(f"{plan.key or '/'}: {plan.mode} {len(todo)}/{len(plan.units)} units")
+            for unit in todo:
+                def work(plan=plan, unit=unit):
+                    _run_unit(plan, unit, move)
+
+                def on_done(plan=plan, unit=unit):
+                    journal.mark(plan.key, unit)
+                    journal.save()
+
+                yield work, on_done
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            _run_bounded(pool, jobs(), max_pending=workers * 4)
+        finally:
+            journal.save(force=True)
+
+    journal.finish()
+    print(f"Migrated {source} -> {destination} (NGFF 0.5 / Zarr v3).")
+    return dst_root
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+import dask.array as da
+import numpy as np
+import zarr
+from dask.base import tokenize
+
+
+def _native_chunk_dtype(zarr_array: zarr.Array) -> np.dtype | None:
+    """Return the on-disk numpy dtype of raw chunk bytes, or ``None`` if unsupported."""
+    metadata = zarr_array.metadata
+    try:
+        if metadata.zarr_format == 2:
+            dtype = np.dtype(metadata.dtype.to_native_dtype())
+        else:
+            dtype = np.dtype(metadata.data_type.to_native_dtype())
+            endian = getattr(getattr(zarr_array.serializer, "endian", None), "value", None)
+            if dtype.itemsize > 1 and endian in ("little", "big"):
+                dtype = dtype.newbyteorder("<" if endian == "little" else ">")
+    except (AttributeError, TypeError):
+        return None
+
+    if dtype.kind not in "biufc" or dtype.hasobject:
+        return None
+    return dtype
+
+
+def is_mmap_readable(zarr_array: zarr.Array) -> bool:
+    """Return ``True`` if the chunks of ``zarr_array`` are raw C-ordered bytes on a local disk.
+
+    This holds for arrays written with ``compressor=None`` (Zarr v2) or with an
+    empty codec pipeline apart from the ``bytes`` serializer (Zarr v3), stored
+    in a :class:`zarr.storage.LocalStore`. Sharded, filtered or compressed
+    arrays are rejected and must go through the regular zarr codec pipeline.
+    """
+    if not isinstance(zarr_array.store, zarr.storage.LocalStore):
+        return False
+
+    metadata = zarr_array.metadata
+    if metadata.zarr_format == 2:
+        if metadata.compressor is not None or metadata.filters:
+            return False
+        if metadata.order != "C":
+            return False
+    else:
+        if zarr_array.compressors or zarr_array.filters:
+            return False
+        if type(zarr_array.serializer).__name__ != "BytesCodec":
+            return False
+
+    return _native_chunk_dtype(zarr_array) is not None
+
+
+def _read_mmap_chunk(
+    *,
+    zarr_array: zarr.Array,
+    array_root: str,
+    chunk_shape: tuple[int, ...],
+    disk_dtype: np.dtype,
+    fill_value: Any,
+    block_info=None,
+) -> np.ndarray:
+    """Return one dask block as a read-only view onto a memory-mapped chunk file."""
+    info = block_info[None]
+    location = tuple(int(i) for i in info["chunk-location"])
+    region = tuple(slice(start, stop) for start, stop in info["array-location"])
+    block_shape = tuple(s.stop - s.start for s in region)
+
+    chunk_key = zarr_array.metadata.encode_chunk_key(location)
+    chunk_path = os.path.join(array_root, chunk_key)
+    expected_nbytes = int(np.prod(chunk_shape)) * disk_dtype.itemsize
+
+    try:
+        nbytes = os.path.getsize(chunk_path)
+    except OSError:
+        return np.full(block_shape, fill_value, dtype=disk_dtype.newbyteorder("="))
+
+    if nbytes != expected_nbytes:
+        # Unexpected layout (e.g. a chunk written by another tool): let zarr decode it.
+        return np.asarray(zarr_array[region])
+
+    chunk = np.memmap(chunk_path, dtype=disk_dtype, mode="r", shape=chunk_shape, order="C")
+    view = chunk[tuple(slice(0, n) for n in block_shape)].view(np.ndarray)
+    if not view.dtype.isnative:
+        view = view.astype(view.dtype.newbyteorder("="))
+    return view
+
+
+def mmap_from_zarr(
+    zarr_array: zarr.Array,
+    chunks: Sequence[int] | None = None,
+) -> da.Array:
+    """Build a dask array whose blocks are memory-mapped views of uncompressed chunks.
+
+    Parameters
+    ----------
+    zarr_array : zarr.Array
+        Array accepted by :func:`is_mmap_readable`.
+    chunks : sequence of int | None
+        Optional dask chunk shape. The array is first built on the stored zarr
+        chunk grid (one block per chunk file) and then rechunked.
+
+    Returns
+    -------
+    dask.array.Array
+        Lazy array with the same shape and dtype as ``zarr_array``. Chunk files
+        that do not exist yet are returned as ``fill_value`` blocks.
+    """
+    if not is_mmap_readable(zarr_array):
+        raise ValueError(f"Zarr array {zarr_array.path!r} cannot be memory-mapped.")
+
+    shape = tuple(int(s) for s in zarr_array.shape)
+    chunk_shape = tuple(int(c) for c in zarr_array.chunks)
+    disk_dtype = _native_chunk_dtype(zarr_array)
+    array_root = str(Path(zarr_array.store.root) / zarr_array.path)
+
+    dask_chunks = tuple(
+        tuple(min(chunk, size - start) for start in range(0, size, chunk)) or (0,)
+        for size, chunk in zip(shape, chunk_shape)
+    )
+
+    fill_value = zarr_array.fill_value
+    if fill_value is None:
+        fill_value = 0
+
+    arr = da.map_blocks(
+        _read_mmap_chunk,
+        chunks=dask_chunks,
+        meta=np.empty((0,) * len(shape), dtype=disk_dtype.newbyteorder("=")),
+        name=f"mmap-zarr-{tokenize(array_root, shape, chunk_shape, str(disk_dtype))}",
+        zarr_array=zarr_array,
+        array_root=array_root,
+        chunk_shape=chunk_shape,
+        disk_dtype=disk_dtype,
+        fill_value=fill_value,
+    )
+
+    if chunks is not None and len(chunks) == len(shape):
+        arr = arr.rechunk(tuple(chunks))
+    return arr
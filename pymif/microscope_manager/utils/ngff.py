@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Any, Literal, Sequence
 
@@ -15,6 +16,11 @@ from .axes import (
     normalize_data_type,
     spatial_axes_in_order,
 )
+from .chunk_align import align_blocks, write_unit
+from .chunk_copy import can_copy_chunks, copy_chunks
+from .occupancy import occupancy_for_array
+from .occupancy import set_occupancy_index as _set_occupancy_index
+from .occupancy import store_with_occupancy as _store_with_occupancy
 
 DEFAULT_COLORS = (
     "FF0000", "00FF00", "0000FF", "FFFF00",
@@ -34,6 +40,14 @@ class ZarrWriteConfig:
     data_type
         Optional dataset semantic type.  Use ``"intensity"`` for regular image
         intensities or ``"label"`` for integer segmentation/annotation data.
+    occupancy_index
+        If ``True`` (and ``compute=True``), record which chunks contain data
+        and the voxel bounding box of each level in the group attributes
+        while writing.  See :mod:`pymif.microscope_manager.utils.occupancy`.
+    shards
+        Zarr v3 only: shard shape grouping several chunks per file.  It is
+        clipped to every level and rounded to whole chunks; each shard is
+        then written by a single task.
     """
 
     ngff_version: Literal["0.4", "0.5"] | None = None
@@ -44,6 +58,8 @@ class ZarrWriteConfig:
     compressor: Literal["blosc", "gzip"] | None = None
     compressor_level: int = 3
     data_type: Literal["intensity", "label"] | None = None
+    occupancy_index: bool = True
+    shards: tuple[int, ...] | None = None
 
 def _infer_ngff_version(group: zarr.Group) -> str:
     """Infer the NGFF metadata layout used by an existing group."""
@@ -204,9 +220,19 @@ def _write_pyramid_v2(
     root: zarr.Group,
     data_levels: Sequence[da.Array],
     cfg: ZarrWriteConfig,
+    sources: Sequence[zarr.Array] | None = None,
+    source_occupancy: Sequence[dict[str, Any] | None] | None = None,
 ):
-    """Create and populate zarr v2 arrays for each pyramid level."""
+    """Create and populate zarr v2 arrays for each pyramid level.
+
+    ``sources`` optionally lists the on-disk arrays that ``data_levels`` were
+    read from unchanged; levels whose layout matches are copied byte-for-byte.
+    """
+    if cfg.shards is not None:
+        raise ValueError("Sharding requires zarr v3 (ngff_version 0.5).")
+
     delayed = []
+    occupancy = []
 
     for i, arr in enumerate(data_levels):
         chunks = _get_chunks(arr)
@@ -225,10 +251,13 @@ def _write_pyramid_v2(
 
         z = root.create_array(**create_kwargs)
 
-        task = da.store(arr, z, lock=False, compute=cfg.compute)
+        source = sources[i] if sources is not None and i < len(sources) else None
+        task, index = _store_level(arr, z, cfg, source=source, source_occupancy=source_occupancy, level=i)
         if not cfg.compute:
             delayed.append(task)
+        occupancy.append(index)
 
+    _set_occupancy_index(root, _occupancy_to_store(occupancy, cfg))
     return delayed
 
 
@@ -237,9 +266,16 @@ def _write_pyramid_v3(
     root: zarr.Group,
     data_levels: Sequence[da.Array],
     cfg: ZarrWriteConfig,
+    sources: Sequence[zarr.Array] | None = None,
+    source_occupancy: Sequence[dict[str, Any] | None] | None = None,
 ):
-    """Create and populate zarr v3 arrays for each pyramid level."""
+    """Create and populate zarr v3 arrays for each pyramid level.
+
+    ``sources`` optionally lists the on-disk arrays that ``data_levels`` were
+    read from unchanged; levels whose layout matches are copied byte-for-byte.
+    """
     delayed = []
+    occupancy = []
 
     for i, arr in enumerate(data_levels):
         chunks = _get_chunks(arr)
@@ -254,18 +290,76 @@ def _write_pyramid_v3(
         compressors = _build_v3_compressors(cfg.compressor, cfg.compressor_level)
         create_kwargs["compressors"] = compressors
 
+        shards = _normalize_shards(cfg.shards, arr.shape, chunks)
+        if shards is not None:
+            create_kwargs["shards"] = shards
+
         if cfg.storage_options is not None:
             create_kwargs.update(cfg.storage_options)
 
         z = root.create_array(**create_kwargs)
 
-        task = da.store(arr, z, lock=False, compute=cfg.compute)
+        source = sources[i] if sources is not None and i < len(sources) else None
+        task, index = _store_level(arr, z, cfg, source=source, source_occupancy=source_occupancy, level=i)
         if not cfg.compute:
             delayed.append(task)
+        occupancy.append(index)
 
+    _set_occupancy_index(root, _occupancy_to_store(occupancy, cfg))
     return delayed
 
 
+def _store_level(
+    arr: da.Array,
+    z: zarr.Array,
+    cfg: ZarrWriteConfig,
+    *,
+    source: zarr.Array | None = None,
+    source_occupancy: Sequence[dict[str, Any] | None] | None = None,
+    level: int = 0,
+):
+    """Store one pyramid level and return ``(delayed_task, occupancy_entry)``.
+
+    Encoded chunks are copied directly from ``source`` when its codecs and
+    chunking match ``z``; otherwise the level is computed through dask,
+    building its occupancy index when requested.
+    """
+    if source is not None and cfg.compute and can_copy_chunks(source, z):
+        copy_chunks(source, z)
+        return None, occupancy_for_array(source_occupancy, level, source)
+    if cfg.compute and cfg.occupancy_index:
+        return None, _store_with_occupancy(arr, z)
+    return da.store(align_blocks(arr, write_unit(z)), z, lock=False, compute=cfg.compute), None
+
+
+def _occupancy_to_store(
+    occupancy: Sequence[dict[str, Any] | None],
+    cfg: ZarrWriteConfig,
+) -> list[dict[str, Any] | None] | None:
+    """Return the occupancy entries worth persisting, or ``None`` to drop the index."""
+    if not (cfg.compute and cfg.occupancy_index):
+        return None
+    if all(entry is None for entry in occupancy):
+        return None
+    return list(occupancy)
+
+
+def _normalize_shards(
+    shard_shape: Sequence[int] | None,
+    shape: Sequence[int],
+    chunks: Sequence[int],
+) -> tuple[int, ...] | None:
+    """Clip a requested shard shape to the array and round it to whole chunks."""
+    if shard_shape is None or len(shard_shape) != len(shape):
+        return None
+    shards = []
+    for requested, size, chunk in zip(shard_shape, shape, chunks):
+        limit = math.ceil(int(size) / int(chunk)) * int(chunk)
+        shards.append(max(int(chunk), (min(int(requested), limit) // int(chunk)) * int(chunk)))
+    shards = tuple(shards)
+    return None if shards == tuple(int(c) for c in chunks) else shards
+
+
 def _get_chunks(arr: da.Array) -> tuple[int, ...]:
     """Return one normalized chunk tuple for a dask array."""
     if hasattr(arr, "chunksize") and arr.chunksize is not None:
@@ -296,6 +390,8 @@ def _build_v3_compressors(compressor: str | None, level: int):
                 shuffle=zarr.codecs.BloscShuffle.bitshuffle,
             )
         ]
+    if compressor == "gzip":
+        return [zarr.codecs.GzipCodec(level=level)]
     raise ValueError(f"Unsupported compressor for zarr v3: {compressor}")
 
 
@@ -461,6 +557,8 @@ def _normalize_unit(unit: str | None) -> str | None:
 
     aliases = {
         "um": "micrometer",
+        "\u00b5m": "micrometer",
+        "\u03bcm": "micrometer",
         "micron": "micrometer",
         "microns": "micrometer",
         "s": "second",
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import base64
+from typing import Any, Sequence
+
+import dask
+import dask.array as da
+import numpy as np
+import zarr
+from dask.base import tokenize
+
+from .chunk_align import align_blocks, write_unit
+
+PYMIF_ATTR = "pymif"
+OCCUPANCY_KEY = "occupancy"
+
+
+def _content_mask(block: np.ndarray, fill_value: Any) -> np.ndarray:
+    """Return a boolean mask of voxels that differ from ``fill_value``."""
+    if isinstance(fill_value, float) and np.isnan(fill_value):
+        return ~np.isnan(block)
+    return block != fill_value
+
+
+def _block_extent(block: np.ndarray, offset: Sequence[int], fill_value: Any) -> list[list[int]] | None:
+    """Return the ``[start, stop)`` extent of non-fill voxels in ``block``, in array coordinates."""
+    mask = _content_mask(np.asarray(block), fill_value)
+    if not mask.any():
+        return None
+
+    extent = []
+    for axis in range(mask.ndim):
+        other = tuple(a for a in range(mask.ndim) if a != axis)
+        hits = np.flatnonzero(mask.any(axis=other) if other else mask)
+        extent.append([int(offset[axis] + hits[0]), int(offset[axis] + hits[-1] + 1)])
+    return extent
+
+
+def _encode_mask(mask: np.ndarray) -> str:
+    return base64.b64encode(np.packbits(mask.ravel(order="C")).tobytes()).decode("ascii")
+
+
+def _decode_mask(encoded: str, grid: Sequence[int]) -> np.ndarray:
+    n = int(np.prod(grid))
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(encoded), dtype=np.uint8), count=n)
+    return bits.astype(bool).reshape(tuple(int(g) for g in grid))
+
+
+def build_occupancy_index(
+    extents: Sequence[list[list[int]] | None],
+    grid: Sequence[int],
+    shape: Sequence[int],
+    chunks: Sequence[int],
+) -> dict[str, Any]:
+    """Assemble the per-level occupancy entry from per-chunk extents.
+
+    ``extents`` holds one entry per chunk in C order, either ``None`` for a
+    chunk that only contains ``fill_value`` or the voxel extent of its content.
+    """
+    mask = np.array([e is not None for e in extents], dtype=bool).reshape(tuple(grid))
+
+    bounding_box = None
+    for extent in extents:
+        if extent is None:
+            continue
+        if bounding_box is None:
+            bounding_box = [list(axis) for axis in extent]
+            continue
+        for axis, (start, stop) in enumerate(extent):
+            bounding_box[axis][0] = min(bounding_box[axis][0], start)
+            bounding_box[axis][1] = max(bounding_box[axis][1], stop)
+
+    return {
+        "shape": [int(s) for s in shape],
+        "chunks": [int(c) for c in chunks],
+        "grid": [int(g) for g in grid],
+        "mask": _encode_mask(mask),
+        "bounding_box": bounding_box,
+    }
+
+
+def _block_extents(
+    block: np.ndarray,
+    offset: Sequence[int],
+    fill_value: Any,
+    chunks: Sequence[int],
+) -> list[tuple[tuple[int, ...], list[list[int]] | None]]:
+    """Return the chunk index and extent of every chunk inside ``block``.
+
+    ``block`` starts on a chunk boundary; it holds one chunk, or a whole
+    shard of sharded arrays.
+    """
+    block = np.asarray(block)
+    out = []
+    for inner in np.ndindex(*(-(-s // c) for s, c in zip(block.shape, chunks))):
+        region = tuple(slice(i * c, min((i + 1) * c, s)) for i, c, s in zip(inner, chunks, block.shape))
+        start = tuple(int(o + r.start) for o, r in zip(offset, region))
+        index = tuple(s // c for s, c in zip(start, chunks))
+        out.append((index, _block_extent(block[region], start, fill_value)))
+    return out
+
+
+def _store_block(
+    block: np.ndarray,
+    zarr_array: zarr.Array,
+    offset: Sequence[int],
+    fill_value: Any,
+    chunks: Sequence[int],
+) -> list[tuple[tuple[int, ...], list[list[int]] | None]]:
+    """Write ``block`` to ``zarr_array`` at ``offset`` and return its chunk extents."""
+    block = np.asarray(block)
+    zarr_array[tuple(slice(o, o + s) for o, s in zip(offset, block.shape))] = block
+    return _block_extents(block, offset, fill_value, chunks)
+
+
+def store_with_occupancy(arr: da.Array, zarr_array: zarr.Array) -> dict[str, Any]:
+    """Store ``arr`` into ``zarr_array`` and build its occupancy index in the same pass.
+
+    Every task writes one block and returns the extents of its chunks, so
+    the source data is read only once. Sharded arrays are written one shard
+    per task and indexed per chunk.
+    """
+    chunks = tuple(int(c) for c in zarr_array.chunks)
+    aligned = align_blocks(arr, write_unit(zarr_array))
+
+    fill_value = zarr_array.fill_value if zarr_array.fill_value is not None else 0
+    offsets = [np.cumsum((0,) + dim[:-1]) for dim in aligned.chunks]
+    blocks = aligned.to_delayed()
+    tasks = [
+        dask.delayed(_store_block)(
+            blocks[index],
+            zarr_array,
+            tuple(int(offsets[axis][i]) for axis, i in enumerate(index)),
+            fill_value,
+            chunks,
+        )
+        for index in np.ndindex(*aligned.numblocks)
+    ]
+    extents = dask.compute(*tasks)
+
+    grid = tuple(-(-int(s) // c) for s, c in zip(arr.shape, chunks))
+    per_chunk = [None] * int(np.prod(grid))
+    for block in extents:
+        for index, extent in block:
+            per_chunk[int(np.ravel_multi_index(index, grid))] = extent
+    return build_occupancy_index(per_chunk, grid, arr.shape, chunks)
+
+
+def get_occupancy_index(group: zarr.Group) -> list[dict[str, Any] | None] | None:
+    """Return the stored per-level occupancy entries of ``group`` or ``None``."""
+    pymif_attrs = group.attrs.asdict().get(PYMIF_ATTR, {})
+    if not isinstance(pymif_attrs, dict):
+        return None
+    return pymif_attrs.get(OCCUPANCY_KEY)
+
+
+def set_occupancy_index(group: zarr.Group, levels: Sequence[dict[str, Any] | None] | None) -> None:
+    """Write (or remove with ``levels=None``) the occupancy index on ``group``."""
+    pymif_attrs = dict(group.attrs.asdict().get(PYMIF_ATTR, {}) or {})
+    if levels is None:
+        if OCCUPANCY_KEY not in pymif_attrs:
+            return
+        pymif_attrs.pop(OCCUPANCY_KEY)
+    else:
+        pymif_attrs[OCCUPANCY_KEY] = list(levels)
+
+    if pymif_attrs:
+        group.attrs[PYMIF_ATTR] = pymif_attrs
+    elif PYMIF_ATTR in group.attrs:
+        del group.attrs[PYMIF_ATTR]
+
+
+def occupancy_for_array(
+    levels: Sequence[dict[str, Any] | None] | None,
+    level: int,
+    zarr_array: zarr.Array,
+) -> dict[str, Any] | None:
+    """Return the index entry for ``level`` if it still matches ``zarr_array``'s layout.
+
+    Only the layout is checked, so opening a store costs no I/O per chunk.
+    Writers other than PyMIF do not update the index; :func:`masked_from_zarr`
+    therefore still looks up chunks flagged as empty before skipping them.
+    """
+    if not levels or level >= len(levels) or levels[level] is None:
+        return None
+    entry = levels[level]
+    if list(entry.get("shape", [])) != [int(s) for s in zarr_array.shape]:
+        return None
+    if list(entry.get("chunks", [])) != [int(c) for c in zarr_array.chunks]:
+        return None
+    return entry
+
+
+def _chunk_stored(zarr_array: zarr.Array, location: Sequence[int]) -> bool:
+    """Return ``True`` if the chunk (or shard) holding chunk ``location`` exists in the store."""
+    from zarr.core.sync import sync
+
+    unit = write_unit(zarr_array)
+    key = zarr_array.metadata.encode_chunk_key(
+        tuple(int(i) * int(c) // int(u) for i, c, u in zip(location, zarr_array.chunks, unit))
+    )
+    store_path = zarr_array.store_path
+    prefix = f"{store_path.path}/" if store_path.path else ""
+    return sync(store_path.store.exists(prefix + key))
+
+
+def occupancy_mask(entry: dict[str, Any]) -> np.ndarray:
+    """Decode the boolean chunk-occupancy grid of one index entry."""
+    return _decode_mask(entry["mask"], entry["grid"])
+
+
+def resize_occupancy_entry(entry: dict[str, Any], shape: Sequence[int]) -> dict[str, Any]:
+    """Return ``entry`` adapted to its array resized to ``shape``.
+
+    Chunks that already existed keep their flag; chunks added by the resize
+    only hold ``fill_value`` and are flagged empty.
+    """
+    chunks = [int(c) for c in entry["chunks"]]
+    grid = [-(-int(s) // c) for s, c in zip(shape, chunks)]
+    old = occupancy_mask(entry)
+    mask = np.zeros(grid, dtype=bool)
+    overlap = tuple(slice(0, min(a, b)) for a, b in zip(old.shape, grid))
+    mask[overlap] = old[overlap]
+
+    bounding_box = entry.get("bounding_box")
+    if bounding_box is not None:
+        bounding_box = [[min(start, int(s)), min(stop, int(s))] for (start, stop), s in zip(bounding_box, shape)]
+        if any(stop <= start for start, stop in bounding_box):
+            bounding_box = None
+
+    return {
+        **entry,
+        "shape": [int(s) for s in shape],
+        "grid": grid,
+        "mask": _encode_mask(mask),
+        "bounding_box": bounding_box,
+    }
+
+
+def occupy_region(entry: dict[str, Any], region: Sequence[tuple[int, int]]) -> dict[str, Any]:
+    """Return ``entry`` with the chunks of ``region`` (``[start, stop)`` per axis) flagged as occupied.
+
+    The bounding box grows to cover ``region``. Used by writers that own the
+    whole index, e.g. :func:`~pymif.microscope_manager.utils.append.append_to_group`.
+    """
+    if any(stop <= start for start, stop in region):
+        return entry
+
+    mask = occupancy_mask(entry)
+    mask[tuple(
+        slice(start // chunk, (stop - 1) // chunk + 1)
+        for (start, stop), chunk in zip(region, entry["chunks"])
+    )] = True
+
+    bounding_box = entry.get("bounding_box")
+    if bounding_box is None:
+        bounding_box = [[int(start), int(stop)] for start, stop in region]
+    else:
+        bounding_box = [
+            [min(old[0], int(start)), max(old[1], int(stop))]
+            for old, (start, stop) in zip(bounding_box, region)
+        ]
+    return {**entry, "mask": _encode_mask(mask), "bounding_box": bounding_box}
+
+
+def drop_stale_occupancy(
+    group: zarr.Group,
+    level: int,
+    index: Sequence[Any],
+    shape: Sequence[int],
+) -> None:
+    """Remove the occupancy index of ``group`` if a region write may have outdated it.
+
+    Called after region writes. Writes that stay inside chunks flagged as
+    occupied and inside the bounding box leave the index valid and do not
+    touch it. Any other write removes the whole index instead of merging
+    the region into it: concurrent writers would lose each other's merges,
+    while removals are idempotent. ``index`` may contain integers, slices
+    or integer sequences per axis.
+    """
+    levels = get_occupancy_index(group)
+    if not levels or level >= len(levels) or levels[level] is None:
+        return
+
+    entry = levels[level]
+    region = []
+    for sel, size in zip(index, shape):
+        if isinstance(sel, (int, np.integer)):
+            start = int(sel) + (size if sel < 0 else 0)
+            region.append((start, start + 1))
+        elif isinstance(sel, slice):
+            start, stop, _ = sel.indices(int(size))
+            region.append((start, max(start, stop)))
+        else:
+            values = [int(v) + (size if v < 0 else 0) for v in sel]
+            region.append((min(values), max(values) + 1) if values else (0, 0))
+
+    if any(stop <= start for start, stop in region):
+        return
+
+    chunk_slices = tuple(
+        slice(start // chunk, (stop - 1) // chunk + 1)
+        for (start, stop), chunk in zip(region, entry["chunks"])
+    )
+    bounding_box = entry.get("bounding_box")
+    inside = bounding_box is not None and all(
+        old[0] <= start and stop <= old[1] for old, (start, stop) in zip(bounding_box, region)
+    )
+    if not inside or not occupancy_mask(entry)[chunk_slices].all():
+        set_occupancy_index(group, None)
+
+
+def _read_masked_chunk(
+    *,
+    zarr_array: zarr.Array,
+    mask: np.ndarray,
+    fill_value: Any,
+    block_dtype: np.dtype,
+    mmap_kwargs: dict[str, Any] | None,
+    block_info=None,
+) -> np.ndarray:
+    """Return a fill block for unoccupied chunks and read the others from disk.
+
+    A chunk flagged as empty is still read when it exists in the store, as
+    it does after writes by tools that do not update the index.
+    """
+    info = block_info[None]
+    location = tuple(int(i) for i in info["chunk-location"])
+    region = tuple(slice(start, stop) for start, stop in info["array-location"])
+
+    if not mask[location] and not _chunk_stored(zarr_array, location):
+        return np.full(tuple(s.stop - s.start for s in region), fill_value, dtype=block_dtype)
+
+    if mmap_kwargs is not None:
+        from .mmap_zarr import _read_mmap_chunk
+
+        return _read_mmap_chunk(zarr_array=zarr_array, block_info=block_info, **mmap_kwargs)
+    return np.asarray(zarr_array[region])
+
+
+def masked_from_zarr(
+    zarr_array: zarr.Array,
+    entry: dict[str, Any],
+    chunks: Sequence[int] | None = None,
+    use_mmap: bool = False,
+) -> da.Array:
+    """Build a dask array that does not decode chunks marked empty in ``entry``.
+
+    A chunk marked empty costs one key lookup instead of a read, and is read
+    after all if it exists, so data written without updating the index is
+    never hidden.
+
+    Parameters
+    ----------
+    zarr_array : zarr.Array
+        Source array whose layout matches ``entry`` (see :func:`occupancy_for_array`).
+    entry : dict
+        Per-level occupancy index entry.
+    chunks : sequence of int | None
+        Optional dask chunk shape applied after building the chunk-aligned array.
+    use_mmap : bool
+        Read occupied chunks through the memory-mapped fast path of
+        :mod:`pymif.microscope_manager.utils.mmap_zarr`.
+    """
+    from pathlib import Path
+
+    from .mmap_zarr import _native_chunk_dtype, is_mmap_readable
+
+    shape = tuple(int(s) for s in zarr_array.shape)
+    chunk_shape = tuple(int(c) for c in zarr_array.chunks)
+    dtype = np.dtype(zarr_array.dtype)
+    fill_value = zarr_array.fill_value if zarr_array.fill_value is not None else 0
+
+    mmap_kwargs = None
+    if use_mmap and is_mmap_readable(zarr_array):
+        mmap_kwargs = {
+            "array_root": str(Path(zarr_array.store.root) / zarr_array.path),
+            "chunk_shape": chunk_shape,
+            "disk_dtype": _native_chunk_dtype(zarr_array),
+            "fill_value": fill_value,
+        }
+
+    dask_chunks = tuple(
+        tuple(min(chunk, size - start) for start in range(0, size, chunk)) or (0,)
+        for size, chunk in zip(shape, chunk_shape)
+    )
+
+    arr = da.map_blocks(
+        _read_masked_chunk,
+        chunks=dask_chunks,
+        meta=np.empty((0,) * len(shape), dtype=dtype),
+        name=f"occupancy-zarr-{tokenize(str(zarr_array.store), zarr_array.path, shape, chunk_shape, entry['mask'])}",
+        zarr_array=zarr_array,
+        mask=occupancy_mask(entry),
+        fill_value=fill_value,
+        block_dtype=dtype,
+        mmap_kwargs=mmap_kwargs,
+    )
+
+    if chunks is not None and len(chunks) == len(shape):
+        arr = arr.rechunk(tuple(chunks))
+    return arr
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Sequence
+
+import numpy as np
+
+from .chunk_copy import stored_bytes
+from .ngff import _build_v2_compressor, _build_v3_compressors
+from .scenes import scene_footprint_mb
+
+
+
+@dataclass
+class WritePlan:
+    """Resource estimate of writing a pyramid to OME-Zarr, see :func:`plan_write`.
+
+    Sizes are in MB, throughputs in MB/s of decoded data and times in seconds.
+    ``raw_mb`` counts whole chunks, as zarr stores edge chunks at full size.
+    """
+
+    shapes: list[tuple[int, ...]] = field(default_factory=list)
+    chunks: tuple[int, ...] = ()
+    shards: tuple[int, ...] | None = None
+    n_chunks: list[int] = field(default_factory=list)
+    dtype: str = ""
+    compressor: str | None = None
+    raw_mb: float = 0.0
+    stored_mb: float = 0.0
+    blosc_mb: float = 0.0
+    sampled_chunks: int = 0
+    read_mb_s: float = 0.0
+    write_mb_s: float = 0.0
+    threads: int = 1
+    peak_memory_mb: float = 0.0
+    runtime_s: float = 0.0
+    runtime_serial_s: float = 0.0
+
+
+def _sample_block_indices(numblocks: Sequence[int], n_samples: int) -> list[tuple[int, ...]]:
+    """Pick up to ``n_samples`` blocks spread evenly over the chunk grid."""
+    total = int(np.prod(numblocks))
+    if total == 0 or n_samples <= 0:
+        return []
+    flat = np.unique(np.linspace(0, total - 1, min(n_samples, total)).round().astype(int))
+    return [tuple(int(i) for i in index) for index in zip(*np.unravel_index(flat, tuple(numblocks)))]
+
+
+def _scratch_array(path: Path, shape, chunks, dtype, zarr_format: int, compressor, compressor_level: int):
+    import zarr
+
+    kwargs = {"shape": shape, "chunks": chunks, "dtype": dtype, "zarr_format": zarr_format}
+    if zarr_format == 2:
+        kwargs["compressors"] = _build_v2_compressor(compressor, compressor_level)
+    else:
+        kwargs["compressors"] = _build_v3_compressors(compressor, compressor_level)
+    return zarr.create_array(store=str(path), **kwargs)
+
+
+def plan_write(
+    data_levels: Sequence[Any],
+    *,
+    zarr_format: Literal[2, 3] = 3,
+    compressor: Literal["blosc", "gzip"] | None = None,
+    compressor_level: int = 3,
+    n_samples: int = 4,
+    scratch_dir: str | os.PathLike | None = None,
+    threads: int | None = None,
+    shards: Sequence[int] | None = None,
+) -> WritePlan:
+    """Estimate the output size, peak memory and runtime of writing ``data_levels``.
+
+    A few chunks of the full-resolution level, spread over the chunk grid,
+    are read from the source and written to a throw-away zarr array with the
+    same format and codec as the output. Their timings give the read and
+    write throughput, their stored size the compression ratio applied to
+    every level. Nothing is written to the output; the scratch array lives
+    in a temporary folder inside ``scratch_dir`` (so that the write
+    throughput is the one of the target storage) and is deleted afterwards.
+
+    Parameters
+    ----------
+    data_levels : sequence of dask.array.Array
+        Pyramid levels as they will be written, i.e. rechunked.
+    zarr_format, compressor, compressor_level
+        Output format and codec, as in
+        :class:`~pymif.microscope_manager.utils.ngff.ZarrWriteConfig`.
+    n_samples : int
+        Number of chunks read and written to measure throughput and compression.
+    scratch_dir : str | PathLike | None
+        Existing folder for the scratch array. Default: the system temporary folder.
+    threads : int | None
+        Dask threads of the conversion. Default: the ``num_workers`` dask
+        setting, else the number of CPUs.
+    shards : sequence of int | None
+        Shard shape of the output. Shards are written whole, so they replace
+        the chunks in the peak memory.
+
+    Returns
+    -------
+    WritePlan
+        The runtime assumes the measured single-thread throughput scales with
+        the threads; ``runtime_serial_s`` is the estimate without scaling.
+        Storage that saturates with one stream lies between the two.
+    """
+    import dask
+
+    base = data_levels[0]
+    dtype = np.dtype(base.dtype)
+    chunks = tuple(int(c) for c in base.chunksize)
+    chunk_bytes = [int(np.prod(level.chunksize)) * dtype.itemsize for level in data_levels]
+    threads = int(threads or dask.config.get("num_workers", None) or os.cpu_count() or 1)
+
+    plan = WritePlan(
+        shapes=[tuple(int(s) for s in level.shape) for level in data_levels],
+        chunks=chunks,
+        shards=None if shards is None else tuple(int(s) for s in shards),
+        n_chunks=[int(np.prod(level.numblocks)) for level in data_levels],
+        dtype=dtype.str,
+        compressor=compressor,
+        threads=threads,
+        peak_memory_mb=scene_footprint_mb(data_levels, threads),
+    )
+    if plan.shards is not None:
+        shard_bytes = int(np.prod([min(s, n) for s, n in zip(plan.shards, plan.shapes[0])])) * dtype.itemsize
+        plan.peak_memory_mb = max(plan.peak_memory_mb, 2 * shard_bytes * threads / 1024 / 1024)
+    plan.raw_mb = sum(n * b for n, b in zip(plan.n_chunks, chunk_bytes)) / 1024 / 1024
+
+    indices = _sample_block_indices(base.numblocks, n_samples)
+    if not indices:
+        return plan
+
+    blosc = _build_v2_compressor("blosc", compressor_level)
+    read_s = write_s = 0.0
+    read_bytes = blosc_bytes = 0
+    with tempfile.TemporaryDirectory(prefix=".pymif-plan-", dir=scratch_dir) as tmp:
+        scratch = _scratch_array(
+            Path(tmp) / "sample.zarr", (len(indices),) + chunks, (1,) + chunks, dtype,
+            int(zarr_format), compressor, compressor_level,
+        )
+        for i, index in enumerate(indices):
+            start = time.perf_counter()
+            block = np.asarray(base.blocks[index].compute(scheduler="synchronous"))
+            read_s += time.perf_counter() - start
+            read_bytes += block.nbytes
+
+            start = time.perf_counter()
+            scratch[(i,) + tuple(slice(0, s) for s in block.shape)] = block
+            write_s += time.perf_counter() - start
+
+            full = np.zeros(chunks, dtype=dtype)
+            full[tuple(slice(0, s) for s in block.shape)] = block
+            blosc_bytes += len(blosc.encode(full))
+        stored = stored_bytes(tmp)
+
+    sampled_bytes = len(indices) * chunk_bytes[0]
+    plan.sampled_chunks = len(indices)
+    plan.stored_mb = plan.raw_mb * stored / sampled_bytes
+    plan.blosc_mb = plan.raw_mb * blosc_bytes / sampled_bytes
+    plan.read_mb_s = read_bytes / 1024 / 1024 / max(read_s, 1e-9)
+    plan.write_mb_s = sampled_bytes / 1024 / 1024 / max(write_s, 1e-9)
+
+    level0_mb = plan.n_chunks[0] * chunk_bytes[0] / 1024 / 1024
+    plan.runtime_serial_s = level0_mb / plan.read_mb_s + plan.raw_mb / plan.write_mb_s
+    plan.runtime_s = plan.runtime_serial_s / max(1, min(threads, plan.n_chunks[0]))
+    return plan
+
+
+def describe_plan(plan: WritePlan) -> str:
+    """Format a :class:`WritePlan` as the lines printed by ``pymif 2zarr --plan``."""
+    codec = plan.compressor or "none"
+    lines = [f"CHUNK SHAPE: {plan.chunks} ({plan.dtype})"]
+    if plan.shards is not None:
+        lines.append(f"SHARD SHAPE: {plan.shards}")
+    for i, (shape, n) in enumerate(zip(plan.shapes, plan.n_chunks)):
+        lines.append(f"LEVEL {i}: shape {shape}, {n} chunks")
+    lines.append(f"UNCOMPRESSED SIZE (MB): {plan.raw_mb:.1f}")
+    if plan.sampled_chunks:
+        lines.append(f"ESTIMATED OUTPUT SIZE (MB, compressor={codec}): {plan.stored_mb:.1f}"
+                     f" (blosc-zstd: {plan.blosc_mb:.1f}), from {plan.sampled_chunks} sampled chunks")
+        lines.append(f"THROUGHPUT (MB/s, one thread): read {plan.read_mb_s:.1f}, write {plan.write_mb_s:.1f}")
+    lines.append(f"PEAK MEMORY (MB, {plan.threads} threads): {plan.peak_memory_mb:.1f}")
+    if plan.sampled_chunks:
+        lines.append(f"ESTIMATED RUNTIME (s): {plan.runtime_s:.1f} with {plan.threads} threads,"
+                     f" {plan.runtime_serial_s:.1f} if the storage does not scale")
+    return "\n".join(lines)
@@ -104,6 +104,7 @@ def build_pyramid(
     num_levels: int = 3,
     downscale_factor: SpatialFactor = 2,
     start_level: int = 0,
+    reuse_levels: bool = False,
 ) -> Tuple[List[da.Array], Dict[str, Any]]:
     """
     Generate a multiscale pyramid and updated metadata for NGFF-compatible
@@ -115,6 +116,11 @@ def build_pyramid(
 
     - 2, meaning downsample Z, Y and X by 2
     - (1, 2, 2), meaning keep Z unchanged and downsample only YX
+
+    With ``reuse_levels=True``, existing levels in ``data_levels`` whose shape
+    matches the level being built are used as-is instead of being downsampled
+    again, and coarser levels are derived from them. This keeps native
+    pyramids stored by the source file and avoids reading level 0 for them.
     """
     if not data_levels:
         raise ValueError("data_levels cannot be empty.")
@@ -159,12 +165,15 @@ def build_pyramid(
         pyramid = [_rechunk_to_target(down, target_chunks)]
         new_scales = [multiply_scales(metadata["scales"][0], base_downscale)]
 
-    for _ in range(1, num_levels):
+    for level in range(1, num_levels):
         if spatial_axes:
             current = pad_to_divisible(pyramid[-1], factors, spatial_axes=spatial_axes)
             down = downsample_nn(current, factors, spatial_axes=spatial_axes)
         else:
             down = pyramid[-1]
+        source = start_level + level
+        if reuse_levels and source < len(data_levels) and data_levels[source].shape == down.shape:
+            down = data_levels[source]
         pyramid.append(_rechunk_to_target(down, target_chunks))
 
     for level in range(1, num_levels):
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+import numbers
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from .axes import normalize_axes, spatial_axes_in_order
+
+PhysicalBox = Mapping[str, Any] | Sequence[Sequence[float]]
+
+
+def _per_axis(
+    value: float | Sequence[float] | Mapping[str, float],
+    spatial_axes: tuple[str, ...],
+    name: str,
+) -> dict[str, float]:
+    """Expand a scalar, per-axis sequence or axis mapping to ``{axis: value}``."""
+    if isinstance(value, Mapping):
+        out = {str(ax).lower(): float(v) for ax, v in value.items()}
+        unknown = sorted(set(out) - set(spatial_axes))
+        if unknown:
+            raise ValueError(f"{name} has axes {unknown!r} that are not spatial axes of the dataset.")
+        return out
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        if len(value) != len(spatial_axes):
+            raise ValueError(
+                f"{name} must have one entry per spatial axis {''.join(spatial_axes)!r}."
+            )
+        return {ax: float(v) for ax, v in zip(spatial_axes, value)}
+    return {ax: float(value) for ax in spatial_axes}
+
+
+def select_level(
+    scales: Sequence[Sequence[float]],
+    axes: str | Sequence[str],
+    target_resolution: float | Sequence[float] | Mapping[str, float] | None,
+) -> int:
+    """Return the coarsest pyramid level whose voxel size satisfies ``target_resolution``.
+
+    A level satisfies the request if its voxel size is not larger than the
+    target along every constrained spatial axis. Level 0 is returned when no
+    target is given or when even level 0 is coarser than requested.
+    """
+    if target_resolution is None or not scales:
+        return 0
+
+    spatial_axes = spatial_axes_in_order(axes)
+    target = _per_axis(target_resolution, spatial_axes, "target_resolution")
+    if any(v <= 0 for v in target.values()):
+        raise ValueError("target_resolution must be positive.")
+
+    best = 0
+    for level, scale in enumerate(scales):
+        voxel = dict(zip(spatial_axes, scale))
+        if all(voxel[ax] <= target[ax] * (1 + 1e-9) for ax in target):
+            if _voxel_volume(scale) >= _voxel_volume(scales[best]):
+                best = level
+    return best
+
+
+def _voxel_volume(scale: Sequence[float]) -> float:
+    """Return the product of the spatial voxel sizes of one level."""
+    return math.prod(float(s) for s in scale)
+
+
+def physical_to_index(
+    bbox_physical: PhysicalBox,
+    axes: str | Sequence[str],
+    scale: Sequence[float],
+    shape: Sequence[int],
+    translation: Sequence[float] | None = None,
+) -> tuple[Any, ...]:
+    """Convert a physical bounding box to an index tuple for one pyramid level.
+
+    Parameters
+    ----------
+    bbox_physical : mapping or sequence
+        Either a mapping ``{axis: (start, stop)}`` or a sequence of
+        ``(start, stop)`` pairs in spatial axis order. Spatial bounds are in
+        the dataset units; spatial axes that are omitted are read in full.
+        A mapping may also select ``t`` / ``c`` by index with an integer,
+        a ``slice`` or a ``(start, stop)`` pair.
+    axes : str | sequence of str
+        Axis labels of the level array.
+    scale : sequence of float
+        Spatial voxel size of the level.
+    shape : sequence of int
+        Shape of the level array.
+    translation : sequence of float | None
+        Spatial NGFF translation of the level, i.e. the physical position of
+        its first voxel. Default: the origin.
+
+    Returns
+    -------
+    tuple
+        One ``slice`` per axis, covering every voxel that intersects the box.
+    """
+    labels = normalize_axes(axes, ndim=len(shape))
+    spatial_axes = spatial_axes_in_order(labels)
+
+    if isinstance(bbox_physical, Mapping):
+        bounds = {str(ax).lower(): v for ax, v in bbox_physical.items()}
+    else:
+        if len(bbox_physical) != len(spatial_axes):
+            raise ValueError(
+                f"bbox_physical must have one (start, stop) pair per spatial axis {''.join(spatial_axes)!r}."
+            )
+        bounds = dict(zip(spatial_axes, bbox_physical))
+
+    unknown = sorted(set(bounds) - set(labels))
+    if unknown:
+        raise ValueError(f"bbox_physical has axes {unknown!r} that are not present in the dataset.")
+
+    voxel = dict(zip(spatial_axes, scale))
+    origin = dict(zip(spatial_axes, translation if translation is not None else [0.0] * len(spatial_axes)))
+    index = []
+    for ax, size in zip(labels, shape):
+        value = bounds.get(ax)
+        if value is None:
+            index.append(slice(None))
+        elif ax in voxel:
+            start, stop = (float(v) for v in value)
+            if stop <= start:
+                raise ValueError(f"bbox_physical for axis '{ax}' must satisfy start < stop.")
+            start, stop = start - float(origin[ax]), stop - float(origin[ax])
+            lo = min(max(int(math.floor(start / voxel[ax])), 0), int(size))
+            hi = min(max(int(math.ceil(stop / voxel[ax])), lo), int(size))
+            index.append(slice(lo, hi))
+        elif isinstance(value, slice):
+            index.append(value)
+        elif isinstance(value, numbers.Integral):
+            index.append(slice(int(value), int(value) + 1))
+        else:
+            start, stop = (int(v) for v in value)
+            index.append(slice(start, stop))
+    return tuple(index)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Literal, Sequence
+
+import dask
+import numpy as np
+import zarr
+
+SceneLayout = Literal["stores", "groups"]
+
+
+class MemoryBudget:
+    """Shared pool of megabytes that concurrent scene writers reserve from.
+
+    A reservation larger than the whole budget is clamped to it, so such a
+    scene still runs, but alone.
+    """
+
+    def __init__(self, total_mb: float | None):
+        self.total_mb = None if total_mb is None else float(total_mb)
+        self._available = self.total_mb
+        self._cond = threading.Condition()
+
+    def acquire(self, mb: float) -> float:
+        if self.total_mb is None:
+            return 0.0
+        mb = min(float(mb), self.total_mb)
+        with self._cond:
+            self._cond.wait_for(lambda: self._available >= mb)
+            self._available -= mb
+        return mb
+
+    def release(self, mb: float) -> None:
+        if self.total_mb is None:
+            return
+        with self._cond:
+            self._available += mb
+            self._cond.notify_all()
+
+
+def scene_footprint_mb(data_levels: Sequence[Any], threads: int) -> float:
+    """Estimate the peak memory of writing one scene.
+
+    Every writer thread holds at most one decoded chunk and its encoded copy.
+    """
+    chunk_bytes = max(
+        int(np.prod(level.chunksize)) * np.dtype(level.dtype).itemsize for level in data_levels
+    )
+    return 2 * chunk_bytes * max(1, int(threads)) / 1024 / 1024
+
+
+def scene_group_names(scenes: Sequence[str]) -> list[str]:
+    """Return unique, filesystem- and zarr-safe names for ``scenes``."""
+    names = []
+    for i, scene in enumerate(scenes):
+        name = re.sub(r"[^0-9A-Za-z_.-]+", "_", str(scene)).strip("_.") or f"scene_{i}"
+        if name in names:
+            name = f"{name}_{i}"
+        names.append(name)
+    return names
+
+
+def write_scenes(
+    manager,
+    zarr_path: str | os.PathLike,
+    *,
+    scene_indices: Sequence[int] | None = None,
+    layout: SceneLayout = "stores",
+    prepare: Callable[[Any], Any] | None = None,
+    max_workers: int | None = None,
+    memory_budget_mb: float | None = None,
+    **kwargs,
+) -> list[str]:
+    """Write several scenes of one multi-scene manager to OME-Zarr.
+
+    The scene datasets are built one after the other from ``manager`` (which
+    keeps its file parsed once), then written concurrently. Each running
+    scene reserves its estimated footprint from ``memory_budget_mb``, so the
+    number of scenes in flight adapts to their chunk sizes.
+
+    Parameters
+    ----------
+    manager
+        Manager exposing ``scenes`` and ``scene(index)``, e.g.
+        :class:`~pymif.microscope_manager.ZeissManager`.
+    zarr_path : str | PathLike
+        With ``layout="stores"``, a folder receiving one ``<scene>.zarr``
+        store per scene. With ``layout="groups"``, a single store holding the
+        first scene at its root and every other scene as an image subgroup.
+    scene_indices : sequence of int | None
+        Scenes to write. Default: all of them.
+    layout : {"stores", "groups"}
+        Output layout, see ``zarr_path``.
+    prepare : callable | None
+        Applied to every scene dataset before writing, e.g. to rechunk it or
+        build its pyramid. Must return the dataset to write.
+    max_workers : int | None
+        Maximum number of scenes written at the same time. Default: the
+        number of CPUs, capped by the number of scenes. The dask threads are
+        split between the running scenes.
+    memory_budget_mb : float | None
+        Memory shared by all running scenes. ``None`` disables the budget.
+    **kwargs
+        Forwarded to :class:`~pymif.microscope_manager.utils.ngff.ZarrWriteConfig`.
+
+    Returns
+    -------
+    list of str
+        Path of the store or group holding each scene.
+    """
+    from .ngff import ZarrWriteConfig, _resolve_format
+    from .to_zarr import write_multiscale_to_group
+
+    if layout not in ("stores", "groups"):
+        raise ValueError(f"Unknown scene layout {layout!r}; use 'stores' or 'groups'.")
+
+    indices = list(range(len(manager.scenes))) if scene_indices is None else [int(i) for i in scene_indices]
+    if not indices:
+        raise ValueError("No scenes to write.")
+    names = scene_group_names([manager.scenes[i] for i in indices])
+
+    cfg = ZarrWriteConfig(**kwargs)
+    n_workers = max(1, min(max_workers or os.cpu_count() or 1, len(indices)))
+    threads = max(1, (os.cpu_count() or 1) // n_workers)
+    budget = MemoryBudget(memory_budget_mb)
+
+    # Build every scene graph up front: scene switches on the shared reader
+    # are not thread safe, the lazy graphs are.
+    datasets = []
+    for index in indices:
+        dataset = manager.scene(index)
+        if prepare is not None:
+            dataset = prepare(dataset)
+        datasets.append(dataset)
+
+    zarr_path = Path(zarr_path)
+    if layout == "stores":
+        zarr_path.mkdir(parents=True, exist_ok=True)
+        targets = [str(zarr_path / f"{name}.zarr") for name in names]
+    else:
+        _, zarr_format = _resolve_format(cfg)
+        root = zarr.open_group(str(zarr_path), mode="w" if cfg.overwrite else "w-", zarr_format=zarr_format)
+        groups = [root] + [root.create_group(name) for name in names[1:]]
+        targets = [str(zarr_path)] + [str(zarr_path / name) for name in names[1:]]
+
+    def _write(i: int) -> None:
+        dataset = datasets[i]
+        reserved = budget.acquire(scene_footprint_mb(dataset.data, threads))
+        try:
+            print(f"Writing scene {manager.scenes[indices[i]]} to {targets[i]}")
+            if layout == "stores":
+                dataset.to_zarr(targets[i], **kwargs)
+            else:
+                write_multiscale_to_group(
+                    groups[i],
+                    dataset.data,
+                    dataset.metadata,
+                    config=cfg,
+                    name=manager.scenes[indices[i]],
+                )
+        finally:
+            budget.release(reserved)
+
+    with dask.config.set(scheduler="threads", num_workers=threads):
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for future in [pool.submit(_write, i) for i in range(len(datasets))]:
+                future.result()
+
+    return targets
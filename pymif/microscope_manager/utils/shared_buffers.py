@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+import mmap
+import sys
+from typing import Sequence
+
+import dask.array as da
+import numpy as np
+from dask.base import tokenize
+
+PAGE_SIZE = mmap.PAGESIZE
+# Page alignment may grow a block to at most this multiple of the requested volume.
+MAX_ALIGN_GROWTH = 2.0
+
+
+def is_zero_copy_buffer(array) -> bool:
+    """Return ``True`` if ``array`` is backed by a memory map or a shared-memory block.
+
+    This covers :class:`numpy.memmap` (and views of it) as well as arrays
+    built on the ``buf`` of a :class:`multiprocessing.shared_memory.SharedMemory`,
+    whose base chain ends in a :class:`mmap.mmap`.
+    """
+    if isinstance(array, np.memmap):
+        return True
+    base = getattr(array, "base", None)
+    seen = set()
+    while base is not None and id(base) not in seen:
+        seen.add(id(base))
+        if isinstance(base, (mmap.mmap, np.memmap)):
+            return True
+        base = base.obj if isinstance(base, memoryview) else getattr(base, "base", None)
+    return False
+
+
+def page_aligned_chunks(
+    array: np.ndarray,
+    chunks: Sequence[int],
+    page_size: int = PAGE_SIZE,
+) -> tuple[tuple[int, ...], ...]:
+    """Chunk ``array`` so that block boundaries fall on page boundaries of its buffer.
+
+    Along each axis, a boundary moves the block start by a multiple of that
+    axis' stride; requested chunk sizes are rounded down to a multiple of the
+    smallest number of elements spanning whole pages. Axes whose stride already spans
+    whole pages (the outer axes of a C-ordered stack, the inner axes of a
+    Fortran-ordered one) keep the requested size. A chunk smaller than one
+    alignment step is grown to it only while the block stays within
+    ``MAX_ALIGN_GROWTH`` times the requested volume; otherwise it keeps the
+    requested, unaligned size. Views are zero-copy at any offset, so
+    alignment never costs more than a bounded change of the block count.
+
+    Offsets are relative to the first element. Shared-memory blocks start on
+    a page, as do memmaps whose ``offset`` is a multiple of the page size.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Memory-mapped or shared-memory array.
+    chunks : sequence of int
+        Requested chunk shape, clipped to the array shape.
+    page_size : int
+        Page size in bytes. Default: the system page size.
+
+    Returns
+    -------
+    tuple of tuple of int
+        Explicit dask chunks.
+    """
+    shape = tuple(int(s) for s in array.shape)
+    strides = tuple(abs(int(s)) for s in array.strides)
+    sizes = []
+    growth = MAX_ALIGN_GROWTH
+    for n, c, stride in zip(shape, chunks, strides):
+        c = max(1, min(int(c), n))
+        step = page_size // math.gcd(page_size, stride) if stride else 1
+        if c < n and c >= step:
+            c -= c % step
+        elif c < n and min(step, n) / c <= growth:
+            growth /= min(step, n) / c
+            c = step
+        sizes.append(min(c, n))
+
+    return tuple(
+        tuple(min(c, n - start) for start in range(0, n, c)) or (0,) for n, c in zip(shape, sizes)
+    )
+
+
+def _buffer_view(*, buffer: np.ndarray, block_info=None) -> np.ndarray:
+    """Return one dask block as a view of ``buffer``, never a copy."""
+    region = tuple(slice(start, stop) for start, stop in block_info[None]["array-location"])
+    return buffer[region].view(np.ndarray)
+
+
+def zero_copy_dask(array: np.ndarray, chunks: Sequence[int]) -> da.Array:
+    """Wrap a memory-mapped or shared-memory array in dask without copying it.
+
+    Every block is a view of ``array`` on :func:`page_aligned_chunks`. The
+    graph is keyed on the buffer address and layout, so the data is never
+    hashed.
+    """
+    key = (array.ctypes.data, array.shape, array.strides, str(array.dtype))
+    if isinstance(array, np.memmap):
+        key += (str(array.filename), array.offset)
+    return da.map_blocks(
+        _buffer_view,
+        chunks=page_aligned_chunks(array, chunks),
+        meta=np.empty((0,) * array.ndim, dtype=array.dtype),
+        name=f"zero-copy-{tokenize(*key)}",
+        buffer=array,
+    )
+
+
+def attach_shared_memory(name: str):
+    """Attach to an existing :class:`multiprocessing.shared_memory.SharedMemory` block.
+
+    The block stays owned by the process that created it: it is not
+    registered with this process' resource tracker, which would otherwise
+    unlink it when this process exits.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
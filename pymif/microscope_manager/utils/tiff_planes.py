@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import itertools
+import os
+from typing import Any, Sequence
+
+import dask.array as da
+import numpy as np
+from dask.base import tokenize
+from tifffile import TiffFile
+
+from .handle_pool import FileHandlePool
+
+TCZYX = "TCZYX"
+
+
+
+class _TiledTiff:
+    """TIFF file with zarr views of its series, for tile-wise reads of compressed files."""
+
+    def __init__(self, path: str):
+        self.tif = TiffFile(path)
+        self._levels: dict[int, Any] = {}
+
+    def level(self, series: int = 0):
+        """Return the full-resolution level of ``series`` as a read-only zarr array."""
+        arr = self._levels.get(series)
+        if arr is None:
+            import zarr
+
+            arr = self._levels[series] = zarr.open(self.tif.aszarr(series=series, level=0), mode="r")
+        return arr
+
+    def close(self) -> None:
+        self._levels.clear()
+        self.tif.close()
+
+
+_tiff_pool = FileHandlePool(TiffFile)
+_tiled_pool = FileHandlePool(_TiledTiff)
+
+
+def get_tiff_pool() -> FileHandlePool:
+    """Return the process-wide pool of TIFF handles used by :func:`read_tiff_pages`.
+
+    Managers register their files with a
+    :class:`~pymif.microscope_manager.utils.handle_pool.HandleLease` on this
+    pool so that :meth:`MicroscopeManager.close` releases the handles.
+    """
+    return _tiff_pool
+
+
+def get_tiled_tiff_pool() -> FileHandlePool:
+    """Return the process-wide pool of compressed TIFF files read by :func:`tiled_tiff_to_tczyx`.
+
+    Its entries hold the ``TiffFile`` and the zarr view of each series; call
+    ``.level(series)`` on the entry lent by ``checkout(path)``.
+    """
+    return _tiled_pool
+
+
+def check_tczyx_axes(axes: str, shape: Sequence[int]) -> str:
+    """Validate TIFF series axes against its shape and return them upper-cased.
+
+    The axes must be unique labels from ``"TCZYX"`` ending with ``"YX"``.
+    """
+    axes = str(axes).upper()
+    if len(axes) != len(shape):
+        raise ValueError(f"axes {axes!r} do not match the TIFF series shape {tuple(shape)}.")
+    if not axes.endswith("YX") or any(ax not in TCZYX for ax in axes) or len(set(axes)) != len(axes):
+        raise ValueError(
+            f"Unsupported TIFF series axes {axes!r}; expected unique labels from 'TCZYX' ending with 'YX'."
+        )
+    return axes
+
+
+def tiff_series_layout(path: str | os.PathLike, series: int = 0) -> dict[str, Any]:
+    """Return shape, axes, dtype and plane shape of one TIFF series.
+
+    ``contiguous`` is ``True`` when the series is stored uncompressed in one
+    contiguous block, so its planes can be memory-mapped. ``chunks`` is the
+    shape of one tile or strip of a plane.
+    """
+    with TiffFile(os.fspath(path)) as tif:
+        s = tif.series[series]
+        return {
+            "shape": tuple(int(n) for n in s.shape),
+            "axes": str(s.axes).upper(),
+            "dtype": np.dtype(s.dtype),
+            "plane_shape": tuple(int(n) for n in s.keyframe.shape),
+            "contiguous": s.dataoffset is not None,
+            "compressed": int(s.keyframe.compression) != 1,
+            "chunks": tuple(int(n) for n in s.keyframe.chunks),
+        }
+
+
+def read_tiff_pages(
+    path: str | os.PathLike,
+    pages: Sequence[int],
+    series: int = 0,
+    region: tuple[slice, ...] = (),
+) -> np.ndarray:
+    """Read selected pages (planes) of a TIFF series without loading the rest.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        TIFF file.
+    pages : sequence of int
+        Page indices within ``series``.
+    series : int
+        Series index.
+    region : tuple of slice
+        Optional selection applied to every plane, e.g. ``(ys, xs)``.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(len(pages),) + plane_region_shape``. Uncompressed
+        contiguous series are read through a memory map, so only the bytes
+        of the requested region are touched; other layouts decode the
+        requested pages only. The file is opened through
+        :func:`get_tiff_pool`, so its IFD chain and series are parsed once
+        per pooled handle rather than once per call.
+    """
+    pages = [int(p) for p in pages]
+    with _tiff_pool.checkout(path) as tif:
+        s = tif.series[series]
+        plane_shape = tuple(int(n) for n in s.keyframe.shape)
+        selection = (slice(None),) + tuple(region)
+
+        if s.dataoffset is not None:
+            n_planes = int(np.prod(s.shape)) // max(1, int(np.prod(plane_shape)))
+            planes = np.memmap(
+                os.fspath(path),
+                dtype=np.dtype(s.dtype).newbyteorder(tif.byteorder),
+                mode="r",
+                offset=s.dataoffset,
+                shape=(n_planes,) + plane_shape,
+            )
+            if pages and pages == list(range(pages[0], pages[-1] + 1)):
+                data = planes[pages[0]:pages[-1] + 1]
+            else:
+                data = planes[pages]
+            return np.ascontiguousarray(data[selection], dtype=np.dtype(s.dtype).newbyteorder("="))
+
+        data = tif.asarray(series=series, key=pages)
+        return np.asarray(data).reshape((len(pages),) + plane_shape)[selection]
+
+
+def _read_tczyx_block(
+    *,
+    path: str,
+    series: int,
+    tif_axes: str,
+    tif_shape: tuple[int, ...],
+    block_dtype: np.dtype,
+    block_info=None,
+) -> np.ndarray:
+    """Read one TCZYX block of a TIFF series from the pages it covers."""
+    ranges = dict(zip(TCZYX, block_info[None]["array-location"]))
+    plane_axes = tif_axes[:-2]
+
+    grids = [range(*ranges[ax]) for ax in plane_axes]
+    coords = np.array(list(itertools.product(*grids)), dtype=np.intp).reshape(-1, len(plane_axes))
+    pages = np.ravel_multi_index(coords.T, tif_shape[:-2]) if plane_axes else [0]
+
+    region = (slice(*ranges["Y"]), slice(*ranges["X"]))
+    planes = read_tiff_pages(path, pages, series=series, region=region)
+    block = planes.reshape([len(g) for g in grids] + list(planes.shape[1:])).astype(block_dtype, copy=False)
+    return _as_tczyx(block, tif_axes)
+
+
+def _read_tiled_block(
+    *,
+    path: str,
+    series: int,
+    tif_axes: str,
+    block_dtype: np.dtype,
+    block_info=None,
+) -> np.ndarray:
+    """Read one TCZYX block of a compressed TIFF series from the tiles it covers."""
+    ranges = dict(zip(TCZYX, block_info[None]["array-location"]))
+    region = tuple(slice(*ranges[ax]) for ax in tif_axes)
+    with _tiled_pool.checkout(path) as tiled:
+        block = np.asarray(tiled.level(series)[region]).astype(block_dtype, copy=False)
+    return _as_tczyx(block, tif_axes)
+
+
+def _as_tczyx(block: np.ndarray, tif_axes: str) -> np.ndarray:
+    """Insert the axes missing from ``tif_axes`` and reorder ``block`` to TCZYX."""
+    axes_in = tif_axes
+    for ax in TCZYX:
+        if ax not in axes_in:
+            block = block[None]
+            axes_in = ax + axes_in
+    return block.transpose([axes_in.index(ax) for ax in TCZYX])
+
+
+def tiff_series_to_tczyx(
+    path: str | os.PathLike,
+    chunks: Sequence[int],
+    series: int = 0,
+    axes: str | None = None,
+) -> da.Array:
+    """Expose a TIFF series as a lazily chunked TCZYX dask array.
+
+    Every block reads only the pages (and, for uncompressed files, only the
+    bytes) it covers, so memory stays bounded by the block size whatever the
+    file size.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        TIFF file.
+    chunks : sequence of int
+        TCZYX dask chunk shape.
+    series : int
+        Series index.
+    axes : str | None
+        Override for the series axes reported by ``tifffile``. Must end with
+        ``"YX"`` and only use labels from ``"TCZYX"``.
+    """
+    path = os.fspath(path)
+    layout = tiff_series_layout(path, series)
+    tif_axes = check_tczyx_axes(axes or layout["axes"], layout["shape"])
+
+    sizes = dict(zip(tif_axes, layout["shape"]))
+    shape = tuple(sizes.get(ax, 1) for ax in TCZYX)
+    dtype = layout["dtype"]
+    chunks = da.core.normalize_chunks(tuple(chunks), shape=shape, dtype=dtype)
+
+    return da.map_blocks(
+        _read_tczyx_block,
+        chunks=chunks,
+        meta=np.empty((0,) * 5, dtype=dtype),
+        name=f"tiff-{tokenize(path, os.path.getmtime(path), series, tif_axes, chunks)}",
+        path=path,
+        series=series,
+        tif_axes=tif_axes,
+        tif_shape=layout["shape"],
+        block_dtype=dtype,
+    )
+
+
+def tiled_tiff_to_tczyx(
+    path: str | os.PathLike,
+    chunks: Sequence[int],
+    series: int = 0,
+    axes: str | None = None,
+) -> da.Array:
+    """Expose a compressed TIFF series as a lazily chunked TCZYX dask array.
+
+    Blocks are read through ``tifffile``'s zarr interface, so only the tiles
+    or strips a block covers are decoded. Files are opened on first read
+    through :func:`get_tiled_tiff_pool`, which bounds the number of open
+    files however many series a dataset concatenates.
+
+    Parameters are those of :func:`tiff_series_to_tczyx`.
+    """
+    path = os.fspath(path)
+    layout = tiff_series_layout(path, series)
+    tif_axes = check_tczyx_axes(axes or layout["axes"], layout["shape"])
+
+    sizes = dict(zip(tif_axes, layout["shape"]))
+    shape = tuple(sizes.get(ax, 1) for ax in TCZYX)
+    dtype = layout["dtype"]
+    chunks = da.core.normalize_chunks(tuple(chunks), shape=shape, dtype=dtype)
+
+    return da.map_blocks(
+        _read_tiled_block,
+        chunks=chunks,
+        meta=np.empty((0,) * 5, dtype=dtype),
+        name=f"tiff-tiles-{tokenize(path, os.path.getmtime(path), series, tif_axes, chunks)}",
+        path=path,
+        series=series,
+        tif_axes=tif_axes,
+        block_dtype=dtype,
+    )
@@ -139,11 +139,18 @@ def write_multiscale_to_group(
     config: ZarrWriteConfig | None = None,
     name: str | None = None,
     is_label: bool = False,
+    source_arrays: Sequence[zarr.Array] | None = None,
+    source_occupancy: Sequence[dict | None] | None = None,
 ):
     """Write a pyramid of Dask arrays into an existing zarr group.
 
     Used by :class:`pymif.microscope_manager.ZarrManager` for raw data, image
     subgroups and label groups.  The axes may be any subset of ``tczyx``.
+
+    When ``source_arrays`` lists the unmodified zarr arrays backing
+    ``data_levels``, levels whose codecs and chunking match the output are
+    copied as encoded bytes instead of being decoded and re-encoded.
+    ``source_occupancy`` carries their occupancy index over to the output.
     """
     cfg = config or ZarrWriteConfig()
     if not data_levels:
@@ -165,10 +172,17 @@ def write_multiscale_to_group(
             if str(key).isdigit():
                 del group[key]
 
+    pyramid_kwargs = {
+        "root": group,
+        "data_levels": data_levels,
+        "cfg": cfg,
+        "sources": source_arrays,
+        "source_occupancy": source_occupancy,
+    }
     if zarr_format == 3:
-        delayed = _write_pyramid_v3(root=group, data_levels=data_levels, cfg=cfg)
+        delayed = _write_pyramid_v3(**pyramid_kwargs)
     else:
-        delayed = _write_pyramid_v2(root=group, data_levels=data_levels, cfg=cfg)
+        delayed = _write_pyramid_v2(**pyramid_kwargs)
 
     multiscales = _build_multiscales(
         effective_metadata,
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import dask.array as da
+
+from .downsampling import SpatialFactor
+from .occupancy import PYMIF_ATTR
+
+WATCH_KEY = "watch"
+
+
+def _written_timepoints(group, source: str) -> set[int]:
+    """Return the timepoints a previous watch of ``source`` already wrote into ``group``."""
+    state = (group.attrs.asdict().get(PYMIF_ATTR, {}) or {}).get(WATCH_KEY)
+    if not state:
+        return set()
+    if state.get("source") != source:
+        raise ValueError(
+            f"{group.store} was filled by watching {state.get('source')!r}, not {source!r}."
+        )
+    return {int(t) for t in state.get("timepoints", [])}
+
+
+def _set_written_timepoints(group, source: str, timepoints: set[int]) -> None:
+    """Record the timepoints written so far, so an interrupted watch can resume."""
+    pymif_attrs = dict(group.attrs.asdict().get(PYMIF_ATTR, {}) or {})
+    pymif_attrs[WATCH_KEY] = {"source": source, "timepoints": sorted(int(t) for t in timepoints)}
+    group.attrs[PYMIF_ATTR] = pymif_attrs
+
+
+def settled_timepoints(
+    timepoint_files: dict[int, Sequence[Path]],
+    settle_seconds: float,
+    now: float | None = None,
+) -> list[int]:
+    """Return the timepoints whose files all exist and were last modified ``settle_seconds`` ago.
+
+    Vendors write every file of a timepoint in one go, so a file that has not
+    changed for a while is considered complete.
+    """
+    now = time.time() if now is None else now
+    ready = []
+    for t, files in timepoint_files.items():
+        try:
+            newest = max(os.stat(f).st_mtime for f in files)
+        except (FileNotFoundError, ValueError):
+            continue
+        if now - newest >= settle_seconds:
+            ready.append(t)
+    return ready
+
+
+def _empty_store_metadata(
+    metadata: dict[str, Any],
+    chunks: Sequence[int],
+    num_levels: int,
+    downscale_factor: SpatialFactor,
+) -> dict[str, Any]:
+    """Pyramid metadata (sizes, chunks, scales) of the store receiving the acquisition."""
+    from .pyramid import build_pyramid
+
+    shape = tuple(metadata["size"][0])
+    chunks = tuple(min(int(c), int(n)) for c, n in zip(chunks, shape))
+    level0 = da.zeros(shape, dtype=metadata["dtype"], chunks=chunks)
+    base = {**metadata, "scales": [tuple(metadata["scales"][0])], "chunksize": [chunks]}
+    _, pyramid_metadata = build_pyramid(
+        [level0], base, num_levels=num_levels, downscale_factor=downscale_factor
+    )
+    pyramid_metadata["plane_files"] = None
+    return pyramid_metadata
+
+
+def watch_to_zarr(
+    manager_cls,
+    source_path: str | os.PathLike,
+    zarr_path: str | os.PathLike,
+    *,
+    chunks: Sequence[int] | None = None,
+    num_levels: int = 3,
+    downscale_factor: SpatialFactor = 2,
+    poll_interval: float = 5.0,
+    settle_seconds: float = 10.0,
+    idle_timeout: float | None = 600.0,
+    ngff_version: str | None = None,
+    zarr_format: int | None = None,
+    on_timepoint: Callable[[int], None] | None = None,
+    **manager_kwargs,
+) -> list[int]:
+    """Stream a running acquisition into an OME-Zarr store, one timepoint at a time.
+
+    The source folder is polled for timepoints whose files are complete. Each
+    one is read into memory and written with
+    :meth:`~pymif.microscope_manager.ZarrManager.write_image_region`, which
+    also fills the coarser pyramid levels, so the store is browsable while
+    the acquisition is still running. The store is created from the planned
+    acquisition size on first use and grown with
+    :meth:`~pymif.microscope_manager.ZarrManager.append` if the acquisition
+    runs longer. Written timepoints are recorded in the store, so restarting
+    the watch resumes where it stopped.
+
+    Parameters
+    ----------
+    manager_cls
+        Manager class with ``probe`` support, ``timepoint_files()`` and
+        ``read_timepoint(t)``: :class:`~pymif.microscope_manager.ViventisManager`
+        or :class:`~pymif.microscope_manager.LuxendoManager`.
+    source_path : str | PathLike
+        Acquisition folder.
+    zarr_path : str | PathLike
+        Output store, created if missing.
+    chunks : sequence of int | None
+        Level-0 chunks in TCZYX order. Default: the manager's default chunks.
+    num_levels : int
+        Number of pyramid levels of a new store.
+    downscale_factor : int | sequence of int
+        Pyramid downsampling factor of a new store.
+    poll_interval : float
+        Seconds between two scans of the source folder.
+    settle_seconds : float
+        Minimum age, in seconds, of the newest file of a timepoint before it
+        is considered complete.
+    idle_timeout : float | None
+        Stop after this many seconds without a new timepoint. ``None`` waits
+        until every planned timepoint has been written.
+    ngff_version, zarr_format : optional
+        Format of a new store. Default: NGFF v0.5 / Zarr v3.
+    on_timepoint : callable | None
+        Called with the index of every timepoint once it is written.
+    **manager_kwargs
+        Forwarded to ``manager_cls``.
+
+    Returns
+    -------
+    list of int
+        Timepoints written by this call, in order.
+    """
+    from ..zarr_manager import ZarrManager
+
+    source = str(Path(source_path).resolve())
+    if chunks is not None:
+        manager_kwargs["chunks"] = tuple(chunks)
+
+    manager = manager_cls(source_path, probe=True, **manager_kwargs)
+    metadata = manager.metadata
+    size_t = int(metadata["size"][0][0])
+
+    if os.path.exists(zarr_path):
+        z = ZarrManager(str(zarr_path), mode="r+")
+        if tuple(z.metadata["size"][0][1:]) != tuple(metadata["size"][0][1:]):
+            raise ValueError(
+                f"Store {zarr_path} has shape {z.metadata['size'][0]}, "
+                f"incompatible with the acquisition ({metadata['size'][0]})."
+            )
+        size_t = int(z.metadata["size"][0][0])
+    else:
+        requested = manager.chunks if manager.chunks is not None else manager.DEFAULT_CHUNKS
+        store_metadata = _empty_store_metadata(metadata, requested, num_levels, downscale_factor)
+        z = ZarrManager(
+            str(zarr_path),
+            mode="a",
+            metadata=store_metadata,
+            ngff_version=ngff_version,
+            zarr_format=zarr_format,
+        )
+
+    written = _written_timepoints(z.root, source)
+    new: list[int] = []
+    last_progress = time.monotonic()
+    print(f"Watching {source} -> {zarr_path}: {len(written)}/{size_t} timepoints already written.")
+
+    while len(written) < max(size_t, int(manager.metadata["size"][0][0])):
+        ready = settled_timepoints(manager.timepoint_files(), settle_seconds)
+        for t in sorted(set(ready) - written):
+            if t > size_t:
+                # Wait for the timepoints in between so the store grows contiguously.
+                break
+            if t == size_t:
+                z.append(manager.read_timepoint(t), axis="t")
+                size_t += 1
+            else:
+                z.write_image_region(manager.read_timepoint(t), t=slice(t, t + 1))
+            written.add(t)
+            _set_written_timepoints(z.root, source, written)
+            new.append(t)
+            last_progress = time.monotonic()
+            print(f"Timepoint {t} written ({len(written)}/{size_t}).")
+            if on_timepoint is not None:
+                on_timepoint(t)
+
+        if len(written) >= max(size_t, int(manager.metadata["size"][0][0])):
+            break
+        if idle_timeout is not None and time.monotonic() - last_progress > idle_timeout:
+            print(f"No new timepoint for {idle_timeout} s, stopping with {len(written)}/{size_t} written.")
+            break
+        time.sleep(poll_interval)
+        # Re-parse the metadata: vendors extend their file listing as the acquisition runs.
+        manager = manager_cls(source_path, probe=True, **manager_kwargs)
+
+    return new
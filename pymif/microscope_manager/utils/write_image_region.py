@@ -16,6 +16,7 @@ from .downsampling import (
     relative_level_factors_for_axes,
 )
 from .ngff import _get_group_multiscales, _infer_data_type_from_group
+from .occupancy import drop_stale_occupancy
 from .zoom import _zoom_dask, _zoom_numpy
 
 
@@ -158,6 +159,7 @@ def _write_region(
             )
             continue
         zarr_array[index] = subdata
+        drop_stale_occupancy(group, i, index, zarr_array.shape)
 
     store = getattr(root, "store", None)
     if store is not None and hasattr(store, "flush"):
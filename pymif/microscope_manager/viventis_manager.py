@@ -1,10 +1,38 @@
 import dask.array as da
-from tifffile import imread
+import numpy as np
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
-from dask import delayed
+from typing import List, Tuple, Dict, Any, Union
+from dask.base import tokenize
 from .microscope_manager import MicroscopeManager
+from .utils.blockwise import block_reader_array
+from .utils.handle_pool import HandleLease
+from .utils.metadata_cache import cached_metadata
+from .utils.tiff_planes import get_tiff_pool, read_tiff_pages
+
+
+def _read_viventis_block(*,
+                         root: str,
+                         plane_map: Dict[Tuple[int, int], List[Tuple[int, int, str, int]]],
+                         block_dtype: np.dtype,
+                         block_info=None) -> np.ndarray:
+    """Read one TCZYX block, touching only the z-planes (TIFF pages) it covers."""
+    location = block_info[None]["array-location"]
+    (t0, t1), (c0, c1), (z0, z1) = location[:3]
+    region = tuple(slice(start, stop) for start, stop in location[3:])
+
+    out = np.zeros(tuple(stop - start for start, stop in location), dtype=block_dtype)
+    for ti in range(t0, t1):
+        for ci in range(c0, c1):
+            for first_z, count, filename, ifd in plane_map.get((ti, ci), []):
+                start, stop = max(z0, first_z), min(z1, first_z + count)
+                if start >= stop:
+                    continue
+                pages = range(ifd + start - first_z, ifd + stop - first_z)
+                out[ti - t0, ci - c0, start - z0:stop - z0] = read_tiff_pages(
+                    Path(root) / filename, pages, region=region
+                )
+    return out
 
 class ViventisManager(MicroscopeManager):
     """
@@ -15,7 +43,9 @@ class ViventisManager(MicroscopeManager):
         
     def __init__(self, 
                  path: str,
-                 chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096)):
+                 chunks: Tuple[int, ...] = (1, 1, 8, 4096, 4096),
+                 probe: bool = False,
+                 cache_metadata: Union[bool, str] = False):
         """
         Initialize the ViventisManager.
 
@@ -25,12 +55,21 @@ class ViventisManager(MicroscopeManager):
             Path to the folder containing the Viventis dataset (including `.ome` and `.tif` files).
         chunks : Tuple[int, ...], optional
             Desired chunk shape for the output Dask array. Default is `(1, 1, 8, 4096, 4096)`.
+        probe : bool, optional
+            Only parse the metadata; ``data`` stays empty. See :meth:`MicroscopeManager.probe`.
+        cache_metadata : bool or str, optional
+            Keep the parsed companion file (metadata and plane map) in a
+            sidecar file, reused on the next open as long as the companion
+            file keeps its modification time and size. ``True`` writes
+            ``.pymif-metadata.json`` into the dataset folder, a path writes
+            the sidecar into that directory instead.
         """
         
         super().__init__()
         self.path = Path(path)
         self.chunks = chunks
-        self.read()
+        self.cache_metadata = cache_metadata
+        self._load(probe)
 
     def _parse_companion_file(self) -> Dict[str, Any]:
         """
@@ -71,15 +110,19 @@ class ViventisManager(MicroscopeManager):
 
         dtype = str(pixels.attrib["Type"])
 
-        # Plane map: (t, c) -> filename
+        # Plane map: (t, c) -> filename, and (t, c) -> [(first_z, plane_count, filename, ifd)]
         tiffdata = root.findall(".//{*}TiffData")
         plane_files = {}
+        self._plane_map = {}
         for entry in tiffdata:
             t = int(entry.attrib["FirstT"])
             c = int(entry.attrib["FirstC"])
-            z_count = int(entry.attrib.get("PlaneCount", 1))
+            first_z = int(entry.attrib.get("FirstZ", 0))
+            ifd = int(entry.attrib.get("IFD", 0))
+            z_count = int(entry.attrib.get("PlaneCount", size_z - first_z))
             filename = entry.find(".//{*}UUID").attrib["FileName"]
             plane_files[(t, c)] = filename
+            self._plane_map.setdefault((t, c), []).append((first_z, z_count, filename, ifd))
 
         return {
             "size": [(size_t, size_c, size_z, size_y, size_x)],
@@ -94,9 +137,75 @@ class ViventisManager(MicroscopeManager):
             "axes": "tczyx"
         }
 
+    def _companion_metadata(self) -> Dict[str, Any]:
+        """Return the parsed companion file and set the plane map, from the sidecar cache if enabled."""
+
+        def parse():
+            metadata = self._parse_companion_file()
+            return {"metadata": metadata, "plane_map": self._plane_map}
+
+        parsed = cached_metadata(
+            self.cache_metadata, self.path, type(self).__name__, self.path.glob("*.ome"), parse
+        )
+        self._plane_map = parsed["plane_map"]
+        return parsed["metadata"]
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Parse the companion `.ome` file only; no TIFF file is opened."""
+        return self._companion_metadata()
+
+    def timepoint_files(self) -> Dict[int, List[Path]]:
+        """
+        List the TIFF files each timepoint is stored in, according to the companion file.
+
+        Returns
+        -------
+        Dict[int, List[Path]]
+            Sorted file paths per timepoint index. Files may not exist yet while
+            an acquisition is running.
+        """
+        
+        files: Dict[int, set] = {}
+        for (t, _), entries in self._plane_map.items():
+            files.setdefault(t, set()).update(self.path / filename for _, _, filename, _ in entries)
+        return {t: sorted(files[t]) for t in sorted(files)}
+
+    def read_timepoint(self, t: int) -> np.ndarray:
+        """
+        Read one full timepoint into memory.
+
+        Parameters
+        ----------
+        t : int
+            Timepoint index.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape ``(1, C, Z, Y, X)``.
+        """
+        
+        _, size_c, size_z, size_y, size_x = self.metadata["size"][0]
+        location = [(t, t + 1), (0, size_c), (0, size_z), (0, size_y), (0, size_x)]
+        try:
+            return _read_viventis_block(
+                root=str(self.path),
+                plane_map=self._plane_map,
+                block_dtype=np.dtype(self.metadata["dtype"]),
+                block_info={None: {"array-location": location}},
+            )
+        finally:
+            # Files of a running acquisition may still grow: do not keep their handles.
+            get_tiff_pool().evict(self.timepoint_files().get(t, []))
+
     def _build_dask_array(self) -> List[da.Array]:
         """
-        Lazily construct a dask array for the image data using tifffile and delayed loading.
+        Lazily construct a dask array for the image data, reading TIFF pages per block.
+
+        Each block reads only its own z-planes, located through the companion
+        file's TiffData plane map, and memory-maps them when the TIFF is stored
+        uncompressed. The graph is a single blockwise layer whose size does not
+        depend on the number of timepoints and channels.
 
         Returns
         -------
@@ -104,21 +213,23 @@ class ViventisManager(MicroscopeManager):
             A list containing a single Dask array representing the full dataset (level 0).
         """
         
-        t, c, z, y, x = self.metadata["size"][0]
-
-        lazy_imread = delayed(imread)  # lazy reader
-        filenames = self.metadata["plane_files"]
-        lazy_arrays = [ [ lazy_imread(f"{self.path}/{filenames[(ti,ci)]}") for ci in range(c) ] for ti in range(t) ] 
-        dask_arrays = [
-            [
-                da.from_delayed(l2, shape=(z,y,x), dtype=self.metadata["dtype"])
-                for l2 in l1
-            ]
-            for l1 in lazy_arrays
-        ]
-        # Stack into one large dask.array
-        stack = da.stack(dask_arrays, axis=0)
-        stack = stack.rechunk((self.chunks))
+        shape = tuple(self.metadata["size"][0])
+        dtype = np.dtype(self.metadata["dtype"])
+        chunks = da.core.normalize_chunks(self.chunks, shape=shape, dtype=dtype)
+
+        companion = next(self.path.glob("*.ome"))
+        stat = companion.stat()
+        files = {filename for planes in self._plane_map.values() for _, _, filename, _ in planes}
+        self._open_files.append(HandleLease(get_tiff_pool(), [self.path / f for f in sorted(files)]))
+        stack = block_reader_array(
+            _read_viventis_block,
+            chunks,
+            dtype,
+            name=f"viventis-{tokenize(str(companion), stat.st_mtime_ns, stat.st_size, chunks)}",
+            root=str(self.path),
+            plane_map=self._plane_map,
+            block_dtype=dtype,
+        )
   
         return [stack]  # level 0 only
 
@@ -134,7 +245,7 @@ class ViventisManager(MicroscopeManager):
             - A metadata dictionary with pixel sizes, units, axes, etc.
         """
         
-        self.metadata = self._parse_companion_file()
+        self.metadata = self._companion_metadata()
         self.data = self._build_dask_array()
         return
     
@@ -10,12 +10,14 @@ import zarr
 from .microscope_manager import MicroscopeManager
 from .utils.axes import normalize_axes, normalize_data_type
 from .utils.ngff import _infer_data_type_from_group, _register_label_on_labels_group
+from .utils.mmap_zarr import is_mmap_readable, mmap_from_zarr
+from .utils.occupancy import get_occupancy_index, masked_from_zarr, occupancy_for_array, occupancy_mask
 from collections.abc import Iterator, Sequence
 
 if TYPE_CHECKING:
     import napari
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class ZarrDataset(Sequence):
@@ -24,6 +26,57 @@ class ZarrDataset(Sequence):
     metadata: Dict[str, Any]
     name: str | None = None
     path: str | None = None
+    occupancy: List[Dict[str, Any] | None] | None = None
+    _source_names: List[str] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._snapshot_source()
+
+    def _snapshot_source(self) -> None:
+        """Remember which lazy arrays were built directly from ``zarr_data``."""
+        self._source_names = (
+            [arr.name for arr in self.data] if self.zarr_data is not None else None
+        )
+
+    def is_zarr_backed(self) -> bool:
+        """Return ``True`` if ``data`` still maps one-to-one onto ``zarr_data``.
+
+        This is ``False`` after lazy transformations such as subsetting,
+        pyramid rebuilding or channel reordering, and after ``data`` has been
+        replaced by arrays that were not read from disk.
+        """
+        if self.zarr_data is None or self._source_names is None:
+            return False
+        if len(self.data) != len(self.zarr_data):
+            return False
+        return [arr.name for arr in self.data] == self._source_names
+
+    def bounding_box(self, level: int = 0) -> Dict[str, Tuple[int, int]] | None:
+        """Return the ``[start, stop)`` voxel extent of non-empty data per axis.
+
+        The extent is read from the occupancy index written at export time, so
+        no image data is scanned. ``None`` is returned for a level that only
+        contains ``fill_value``. Only writes made through PyMIF are accounted
+        for: region writes that reach beyond the indexed extent remove the
+        index, and writes by other tools are not seen.
+
+        Raises
+        ------
+        ValueError
+            If no valid occupancy index is available for ``level``, e.g. for
+            stores written by other tools, after region writes outside the
+            indexed extent or after in-memory transformations.
+        """
+        if not self.occupancy or level >= len(self.occupancy) or self.occupancy[level] is None:
+            raise ValueError(
+                f"No occupancy index available for level {level} of dataset {self.name!r}. "
+                "Re-export the dataset with PyMIF to record one."
+            )
+        bbox = self.occupancy[level].get("bounding_box")
+        if bbox is None:
+            return None
+        axes = self.metadata.get("axes", "")
+        return {ax: (int(start), int(stop)) for ax, (start, stop) in zip(axes, bbox)}
 
     def __len__(self):
         return len(self.data)
@@ -71,6 +124,8 @@ class ZarrManager(MicroscopeManager):
         metadata: dict[str, Any] = None,
         ngff_version: str | None = None,
         zarr_format: int | None = None,
+        use_mmap: bool = True,
+        probe: bool = False,
     ):
         """Open or create an OME-Zarr dataset.
 
@@ -88,6 +143,15 @@ class ZarrManager(MicroscopeManager):
             reading an existing dataset.
         ngff_version, zarr_format : optional
             Explicit format override used when creating a new store.
+        use_mmap : bool
+            If ``True``, uncompressed arrays on a local store are read by
+            memory-mapping the chunk files instead of going through the zarr
+            codec pipeline. Compressed or sharded arrays are always read via
+            :func:`dask.array.from_zarr`.
+        probe : bool
+            If ``True``, only the root image metadata of an existing dataset is
+            read; ``data`` stays empty and subgroups and labels are not indexed.
+            See :meth:`MicroscopeManager.probe`.
         """
         super().__init__()
         self.path = path
@@ -97,11 +161,12 @@ class ZarrManager(MicroscopeManager):
         self.ngff_version: str | None = None
         self.ngff_version_override = ngff_version
         self.zarr_format_override = zarr_format
+        self.use_mmap = use_mmap
 
         if os.path.exists(self.path):
             if mode in ("r", "a", "r+"):
                 self.root = zarr.open(zarr.storage.LocalStore(self.path), mode=self.mode)
-                self.read()
+                self._load(probe)
             else:
                 raise FileNotFoundError(
                     f"Zarr path {self.path} exists and mode='{mode}' is write-only. "
@@ -190,7 +255,7 @@ class ZarrManager(MicroscopeManager):
         data_type = normalize_data_type(data_type)
 
         sizes = [tuple(arr.shape) for arr in data_levels]
-        chunksize = [arr.chunksize for arr in data_levels]
+        chunksize = [tuple(getattr(arr, "chunksize", arr.chunks)) for arr in data_levels]
         dtype = data_levels[0].dtype
 
         spatial_idx = [i for i, ax in enumerate(axis_names) if ax in ("z", "y", "x")]
@@ -198,18 +263,27 @@ class ZarrManager(MicroscopeManager):
         channel_idx = axis_names.index("c") if "c" in axis_names else None
 
         scales = []
+        translations = []
         for ds in datasets:
             ct = ds.get("coordinateTransformations", [{}])
             scale_vec = None
+            translation_vec = None
             if ct and isinstance(ct, list):
                 for transform in ct:
-                    if isinstance(transform, dict) and transform.get("type", "scale") == "scale":
+                    if not isinstance(transform, dict):
+                        continue
+                    if transform.get("type", "scale") == "scale" and scale_vec is None:
                         scale_vec = transform.get("scale", None)
-                        break
+                    elif transform.get("type") == "translation" and translation_vec is None:
+                        translation_vec = transform.get("translation", None)
             if scale_vec is None:
                 scales.append(tuple([1.0] * len(spatial_idx)))
             else:
                 scales.append(tuple(float(scale_vec[i]) for i in spatial_idx))
+            if translation_vec is None:
+                translations.append(tuple([0.0] * len(spatial_idx)))
+            else:
+                translations.append(tuple(float(translation_vec[i]) for i in spatial_idx))
 
         units = tuple(
             axes_info[i].get("unit", None) if isinstance(axes_info[i], dict) else None
@@ -253,6 +327,7 @@ class ZarrManager(MicroscopeManager):
             "size": sizes,
             "chunksize": chunksize,
             "scales": scales,
+            "translations": translations,
             "units": units,
             "time_increment": time_increment,
             "time_increment_unit": time_increment_unit,
@@ -267,11 +342,31 @@ class ZarrManager(MicroscopeManager):
             "zarr_format": 3 if self.ngff_version == "0.5" else 2,
         }
 
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """Normalize the root image metadata from the zarr array headers, without dask arrays."""
+        multiscales_all = self._get_multiscales(self.root)
+        if not multiscales_all:
+            raise ValueError(f"Group '{self.root.name}' does not contain multiscales metadata.")
+        multiscales = multiscales_all[0]
+        datasets = multiscales.get("datasets", [])
+        return self._extract_metadata(
+            data_levels=[self.root[ds["path"]] for ds in datasets],
+            datasets=datasets,
+            multiscales=multiscales,
+            omero=self._get_omero(self.root),
+            data_type=_infer_data_type_from_group(self.root),
+        )
+
     def _read_multiscale_group(
         self,
         group: zarr.Group,
-    ) -> tuple[List[da.Array], List[Any], Dict[str, Any]]:
-        """Load one multiscale image group as dask arrays plus normalized metadata."""
+    ) -> tuple[List[da.Array], List[Any], Dict[str, Any], List[Dict[str, Any] | None] | None]:
+        """Load one multiscale image group as dask arrays plus normalized metadata.
+
+        The fourth return value holds the per-level occupancy index entries that
+        still match the on-disk arrays, or ``None`` if the group has no index.
+        Chunks flagged as empty by the index are not decoded unless they exist on disk.
+        """
         multiscales_all = self._get_multiscales(group)
         if not multiscales_all:
             raise ValueError(f"Group '{group.name}' does not contain multiscales metadata.")
@@ -283,16 +378,32 @@ class ZarrManager(MicroscopeManager):
 
         omero = self._get_omero(group)
 
+        stored_occupancy = get_occupancy_index(group)
+        occupancy = [] if stored_occupancy else None
+
         data_levels = []
         zarr_levels = []
 
-        for ds in datasets:
+        for level, ds in enumerate(datasets):
             path = ds["path"]
             zarr_array = group[path]
             zarr_levels.append(zarr_array)
 
-            if self.chunks is not None and len(self.chunks) == len(zarr_array.shape):
-                arr = da.from_zarr(zarr_array, chunks=self.chunks)
+            user_chunks = (
+                self.chunks
+                if self.chunks is not None and len(self.chunks) == len(zarr_array.shape)
+                else None
+            )
+            entry = occupancy_for_array(stored_occupancy, level, zarr_array)
+            if occupancy is not None:
+                occupancy.append(entry)
+
+            if entry is not None and not occupancy_mask(entry).all():
+                arr = masked_from_zarr(zarr_array, entry, chunks=user_chunks, use_mmap=self.use_mmap)
+            elif self.use_mmap and is_mmap_readable(zarr_array):
+                arr = mmap_from_zarr(zarr_array, chunks=user_chunks)
+            elif user_chunks is not None:
+                arr = da.from_zarr(zarr_array, chunks=user_chunks)
             else:
                 arr = da.from_zarr(zarr_array)
 
@@ -306,7 +417,7 @@ class ZarrManager(MicroscopeManager):
             data_type=_infer_data_type_from_group(group),
         )
 
-        return data_levels, zarr_levels, metadata
+        return data_levels, zarr_levels, metadata, occupancy
 
     def read(self) -> Tuple[List[da.Array], Dict[str, Any]]:
         """Read the root image plus discover additional image groups and labels.
@@ -315,7 +426,7 @@ class ZarrManager(MicroscopeManager):
         Additional multiscale subgroups are indexed in ``self.groups`` and label
         pyramids in ``self.labels``.
         """
-        data_levels, zarr_levels, metadata = self._read_multiscale_group(self.root)
+        data_levels, zarr_levels, metadata, occupancy = self._read_multiscale_group(self.root)
 
         self.raw = ZarrDataset(
             data=data_levels,
@@ -323,6 +434,7 @@ class ZarrManager(MicroscopeManager):
             metadata=metadata,
             name="raw",
             path="/",
+            occupancy=occupancy,
         )
 
         # Backward-compatible aliases
@@ -398,12 +510,64 @@ class ZarrManager(MicroscopeManager):
         corresponds one-to-one to the original on-disk Zarr arrays.
         """
         dataset.zarr_data = None
+        dataset.occupancy = None
+
+    def _find_dataset(self, group_name: str | None) -> ZarrDataset | None:
+        """Return the managed dataset stored at ``group_name`` (``None`` for the root)."""
+        target = (group_name or "").strip("/")
+        for _, dataset in self._iter_datasets():
+            if (dataset.path or "").strip("/") == target:
+                return dataset
+        return None
+
+    def _reload_dataset(self, group_name: str | None) -> None:
+        """Rebuild the lazy arrays of a dataset after its on-disk index changed.
+
+        Only datasets that still map one-to-one onto their zarr arrays are
+        reloaded; in-memory metadata edits are preserved.
+        """
+        dataset = self._find_dataset(group_name)
+        if dataset is None or dataset.zarr_data is None or dataset.occupancy is None:
+            return
+
+        group = self.root if dataset.path in (None, "", "/") else self.root[dataset.path]
+        arrays, zarr_arrays, _, occupancy = self._read_multiscale_group(group)
+        dataset.data = arrays
+        dataset.zarr_data = zarr_arrays
+        dataset.occupancy = occupancy
+        dataset._snapshot_source()
+        self._sync_raw_aliases()
+
+    def bounding_box(
+        self,
+        level: int = 0,
+        group: str | None = None,
+    ) -> Dict[str, Tuple[int, int]] | None:
+        """Return the voxel bounding box of the sample without scanning data.
+
+        Parameters
+        ----------
+        level : int
+            Pyramid level whose index coordinates are returned.
+        group : str | None
+            ``None`` for the root image, a subgroup name, or ``labels/<name>``.
+
+        Returns
+        -------
+        dict | None
+            Mapping of axis name to ``(start, stop)``, or ``None`` if the level
+            is entirely empty. See :meth:`ZarrDataset.bounding_box`.
+        """
+        dataset = self._find_dataset(group)
+        if dataset is None:
+            raise KeyError(f"Dataset {group!r} not found.")
+        return dataset.bounding_box(level)
 
     def _load_group(self, name):
         group = self.root[name]
 
         try:
-            arrays, zarr_arrays, metadata = self._read_multiscale_group(group)
+            arrays, zarr_arrays, metadata, occupancy = self._read_multiscale_group(group)
         except ValueError:
             return None
 
@@ -416,6 +580,7 @@ class ZarrManager(MicroscopeManager):
             metadata=metadata,
             name=name,
             path=name,
+            occupancy=occupancy,
         )
 
     def _load_labels(self):
@@ -428,7 +593,7 @@ class ZarrManager(MicroscopeManager):
 
         for label_name, label_grp in labels_grp.groups():
             try:
-                arrays, zarr_arrays, metadata = self._read_multiscale_group(label_grp)
+                arrays, zarr_arrays, metadata, occupancy = self._read_multiscale_group(label_grp)
             except ValueError:
                 continue
 
@@ -442,6 +607,7 @@ class ZarrManager(MicroscopeManager):
                 metadata=metadata,
                 name=label_name,
                 path=f"labels/{label_name}",
+                occupancy=occupancy,
             )
 
         return labels
@@ -516,7 +682,7 @@ class ZarrManager(MicroscopeManager):
 
         # Read the newly created group back into the in-memory ZarrDataset model.
         if is_label:
-            arrays, zarr_arrays, group_metadata = self._read_multiscale_group(grp)
+            arrays, zarr_arrays, group_metadata, occupancy = self._read_multiscale_group(grp)
 
             group_metadata = dict(group_metadata)
             group_metadata["is_label"] = True
@@ -528,6 +694,7 @@ class ZarrManager(MicroscopeManager):
                 metadata=group_metadata,
                 name=group_name,
                 path=f"labels/{group_name}",
+                occupancy=occupancy,
             )
 
             if not hasattr(self, "labels"):
@@ -536,7 +703,7 @@ class ZarrManager(MicroscopeManager):
             self.labels[group_name] = dataset
 
         else:
-            arrays, zarr_arrays, group_metadata = self._read_multiscale_group(grp)
+            arrays, zarr_arrays, group_metadata, occupancy = self._read_multiscale_group(grp)
 
             group_metadata = dict(group_metadata)
             group_metadata["is_label"] = False
@@ -548,6 +715,7 @@ class ZarrManager(MicroscopeManager):
                 metadata=group_metadata,
                 name=group_name,
                 path=group_name,
+                occupancy=occupancy,
             )
 
             if not hasattr(self, "groups"):
@@ -575,7 +743,7 @@ class ZarrManager(MicroscopeManager):
     ):
         """Write an image patch into a root or subgroup pyramid and refresh lower levels."""
         from .utils.write_image_region import write_image_region as _write_image_region
-        return _write_image_region(
+        result = _write_image_region(
             root=self.root,
             mode=self.mode,
             data=data,
@@ -588,6 +756,67 @@ class ZarrManager(MicroscopeManager):
             group_name=group,
             downscale_factor=downscale_factor,
         )
+        self._reload_dataset(group)
+        return result
+
+    def append(
+        self,
+        data,
+        axis: str = "t",
+        group: Optional[str] = None,
+        downscale_factor: int | Sequence[int] | None = None,
+    ) -> Tuple[int, int]:
+        """Append timepoints (or channels) to a root or subgroup pyramid in place.
+
+        Every level array is resized along ``axis`` and only the new slices are
+        written, with coarser levels derived from ``data``. With chunks of 1
+        along ``axis`` the rest of the dataset is neither read nor rewritten;
+        with larger chunks, the last partly filled chunk (or shard) of each
+        level is read and rewritten together with the new slices.
+
+        Parameters
+        ----------
+        data : array-like or list of array-like
+            Level-0 data with the dataset's shape except along ``axis``, or one
+            array per pyramid level.
+        axis : {"t", "c"}
+            Axis to append along.
+        group : str, optional
+            Image group to append to. Default: the root image.
+        downscale_factor : int or sequence of int, optional
+            Pyramid factor used to derive coarser levels. By default it is read
+            from the multiscales metadata.
+
+        Returns
+        -------
+        Tuple[int, int]
+            ``(start, stop)`` of the appended slices along ``axis``.
+        """
+        from .utils.append import append_to_group
+        result = append_to_group(
+            root=self.root,
+            mode=self.mode,
+            data=data,
+            axis=axis,
+            group_name=group,
+            downscale_factor=downscale_factor,
+        )
+
+        dataset = self._find_dataset(group)
+        if dataset is not None:
+            zarr_group = self.root if dataset.path in (None, "", "/") else self.root[dataset.path]
+            arrays, zarr_arrays, metadata, occupancy = self._read_multiscale_group(zarr_group)
+            dataset.data = arrays
+            dataset.zarr_data = zarr_arrays
+            dataset.occupancy = occupancy
+            dataset._snapshot_source()
+            dataset.metadata["size"] = metadata["size"]
+            dataset.metadata["chunksize"] = metadata["chunksize"]
+            if axis == "c":
+                dataset.metadata["channel_names"] = metadata["channel_names"]
+                dataset.metadata["channel_colors"] = metadata["channel_colors"]
+            self._sync_raw_aliases()
+        return result
 
     def write_label_region(
         self,
@@ -602,7 +831,7 @@ class ZarrManager(MicroscopeManager):
     ):
         """Write a label patch into a label pyramid and regenerate coarser levels."""
         from .utils.write_label_region import write_label_region as _write_label_region
-        return _write_label_region(
+        result = _write_label_region(
             root=self.root,
             mode=self.mode,
             data=data,
@@ -614,7 +843,9 @@ class ZarrManager(MicroscopeManager):
             group_name=group,
             downscale_factor=downscale_factor,
         )
-    
+        self._reload_dataset(group)
+        return result
+
     def subset_dataset(
         self,
         T=None,
@@ -926,6 +1157,16 @@ class ZarrManager(MicroscopeManager):
 
         print("Zarr metadata updated.")
 
+    @staticmethod
+    def _copy_sources(dataset: ZarrDataset) -> Dict[str, Any]:
+        """Return chunk-copy keyword arguments for :func:`write_multiscale_to_group`."""
+        if not dataset.is_zarr_backed():
+            return {}
+        return {
+            "source_arrays": dataset.zarr_data,
+            "source_occupancy": dataset.occupancy,
+        }
+
     def to_zarr(
         self,
         path: str | Path,
@@ -939,6 +1180,11 @@ class ZarrManager(MicroscopeManager):
         Raw data is written directly to the root group.
         Image groups are written as root-level subgroups.
         Labels are written under /labels.
+
+        Datasets that were not transformed since reading (see
+        :meth:`ZarrDataset.is_zarr_backed`) are copied chunk-by-chunk as
+        encoded bytes whenever the output codecs and chunking match the
+        source, skipping the dask decode/encode round-trip.
         """
         from .utils.to_zarr import write_multiscale_to_group
         from .utils.ngff import ZarrWriteConfig, _resolve_format
@@ -962,6 +1208,7 @@ class ZarrManager(MicroscopeManager):
             config=cfg,
             name=self.raw.name or "raw",
             is_label=False,
+            **self._copy_sources(self.raw),
         )
 
         # ------------------------------------------------------------
@@ -978,6 +1225,7 @@ class ZarrManager(MicroscopeManager):
                     config=cfg,
                     name=dataset.name or group_name,
                     is_label=False,
+                    **self._copy_sources(dataset),
                 )
 
         # ------------------------------------------------------------
@@ -1000,6 +1248,7 @@ class ZarrManager(MicroscopeManager):
                     config=cfg,
                     name=dataset.name or label_name,
                     is_label=True,
+                    **self._copy_sources(dataset),
                 )
 
             # Label discovery metadata for the active NGFF layout.
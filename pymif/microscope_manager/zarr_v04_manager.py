@@ -19,6 +19,7 @@ class ZarrV04Manager(ZarrManager):
         path,
         chunks: Tuple[int, ...] | None = None,
         metadata: dict[str, Any] | None = None,
+        probe: bool = False,
     ):
         super().__init__(
             path=path,
@@ -27,4 +28,5 @@ class ZarrV04Manager(ZarrManager):
             metadata=metadata,
             ngff_version="0.4",
             zarr_format=2,
+            probe=probe,
         )
@@ -1,11 +1,71 @@
+import copy
+import threading
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional, Union
 from .microscope_manager import MicroscopeManager
+from .utils.handle_pool import FileHandlePool, HandleLease
+from .utils.metadata_cache import cached_metadata
 # from bioio_czi.aicspylibczi_reader.reader import Reader as AicsPyLibCziReader
 # from bioio_czi.pylibczirw_reader.reader import Reader as PyLibCziReader
 from bioio import BioImage
+import dask.array as da
+from dask.base import tokenize
 import numpy as np
 
+
+def _open_czi_reader(path: str):
+    """Open a pylibCZIrw reader, closed by :class:`FileHandlePool`."""
+    from pylibCZIrw import czi as pyczi
+    return pyczi.CziReader(path)
+
+
+_czi_pool = FileHandlePool(_open_czi_reader)
+
+
+def _read_czi_level_block(*,
+                          path: str,
+                          scene: Optional[int],
+                          origin: Tuple[int, int],
+                          factor: int,
+                          plane_dims: str,
+                          block_dtype,
+                          block_info=None):
+    """
+    Read one TCZYX block of a CZI level, ``factor`` 1 being full resolution.
+
+    The block is mapped back to a full-resolution ROI and read with
+    ``zoom=1/factor``, so libCZI serves it from the stored pyramid subblocks.
+    Edge blocks request the full ROI (padded with background beyond the
+    scene) so the zoom is an exact integer stride, and are cropped afterwards.
+    The reader comes from a pool, so the subblock directory is parsed once
+    rather than once per block.
+    """
+    (t0, t1), (c0, c1), (z0, z1), (y0, y1), (x0, x1) = block_info[None]["array-location"]
+    shape = (t1 - t0, c1 - c0, z1 - z0, y1 - y0, x1 - x0)
+    roi = (
+        origin[0] + x0 * factor,
+        origin[1] + y0 * factor,
+        (x1 - x0) * factor,
+        (y1 - y0) * factor,
+    )
+
+    block = np.empty(shape, dtype=block_dtype)
+    with _czi_pool.checkout(path) as f:
+        for it, t in enumerate(range(t0, t1)):
+            for ic, c in enumerate(range(c0, c1)):
+                for iz, z in enumerate(range(z0, z1)):
+                    coords = {"T": t, "C": c, "Z": z}
+                    plane = f.read(roi=roi, plane={d: coords[d] for d in plane_dims}, scene=scene, zoom=1. / factor)[..., 0]
+                    # libCZI rounds the zoomed size; crop, or pad with background, to the block grid.
+                    plane = plane[:shape[3], :shape[4]]
+                    pad = ((0, shape[3] - plane.shape[0]), (0, shape[4] - plane.shape[1]))
+                    if any(p[1] for p in pad):
+                        plane = np.pad(plane, pad, mode="constant", constant_values=0)
+                    block[it, ic, iz] = plane
+    return block
+
+
 class ZeissManager(MicroscopeManager):
     """
     A manager class for reading and handling .czi datasets.
@@ -19,6 +79,8 @@ class ZeissManager(MicroscopeManager):
                  scene_index: int = 0,
                  scene_name: Optional[str] = "",
                  chunks: Tuple[int, ...] = None,
+                 probe: bool = False,
+                 cache_metadata: Union[bool, str] = False,
                  ):
         """
         Initialize the ZarrManager.
@@ -29,25 +91,61 @@ class ZeissManager(MicroscopeManager):
             Path to the folder containing the Zarr dataset.
         chunks : Tuple[int, ...], optional
             Desired chunk shape for the output Dask array. Default is `None`.
+        probe : bool, optional
+            Only parse the XML metadata and the subblock directory, without
+            building the BioImage reader; ``data`` stays empty.
+            See :meth:`MicroscopeManager.probe`.
+        cache_metadata : bool or str, optional
+            With ``probe=True``, keep the scene names and probed metadata in a
+            sidecar file, reused as long as the .czi file keeps its
+            modification time and size, so the file is not opened at all.
+            ``True`` writes ``.<file>.pymif-metadata.json`` next to the file,
+            a path writes the sidecar into that directory instead. Reading
+            pixel data always goes through BioImage.
         """
         
         super().__init__()
         self.path = path
+        self.cache_metadata = cache_metadata
         
-        czi = BioImage(path, reconstruct_mosaic=True, use_aicspylibczi=False)
-        self.scenes = czi.scenes
+        self._file_metadata: Optional[Dict[str, Any]] = None
+        self._czi_layout: Optional[Dict[str, Any]] = None
+        self._level_factors: List[int] = [1]
+        self._channel_names: List[str] = []
+        # Guards the scene of the BioImage shared with scene views, see `read`.
+        self._reader_lock = threading.Lock()
+        if probe:
+            self._czi = None
+            self._xml = None  # parsed by `_open_layout`, unless everything comes from the cache
+            self.scenes = tuple(cached_metadata(
+                cache_metadata, path, f"{type(self).__name__}/scenes", [path], self._probe_scene_names
+            ))
+        else:
+            # One reader per manager: the subblock directory and XML metadata are parsed once
+            # and reused by `read` and `_parse_metadata`, including across scene switches.
+            self._czi = BioImage(path, reconstruct_mosaic=True, use_aicspylibczi=False)
+            self._xml = self._czi.metadata
+            self.scenes = self._czi.scenes
+        scenes = self.scenes
         if scene_name == "":
             self.scene_index = scene_index
-            assert scene_index<len(czi.scenes), ValueError(f"Invalid scene index {scene_index}, only {len(czi.scenes)} scenes available: {czi.scenes}")
-            self.scene_name = czi.scenes[scene_index]
+            assert scene_index<len(scenes), ValueError(f"Invalid scene index {scene_index}, only {len(scenes)} scenes available: {scenes}")
+            self.scene_name = scenes[scene_index]
         else:
-            assert scene_name in czi.scenes, ValueError(f"Invalid scene {scene_name}: scene not found in available scenes: {czi.scenes}")
+            assert scene_name in scenes, ValueError(f"Invalid scene {scene_name}: scene not found in available scenes: {scenes}")
             self.scene_name = scene_name
-            self.scene_index = czi.scenes.index(scene_name)
+            self.scene_index = scenes.index(scene_name)
             
-        print(f"Scenes: {czi.scenes}, loading {czi.scenes[self.scene_index]}. Rerun `read(scene_index)` to load another scene.")
-
+        self._user_chunks = chunks
         self.chunks = chunks
+        if probe:
+            self.data = []
+            self.metadata = cached_metadata(
+                cache_metadata, path, f"{type(self).__name__}/scene-{self.scene_index}", [path], self._probe_metadata
+            )
+            return
+
+        print(f"Scenes: {scenes}, loading {scenes[self.scene_index]}. Rerun `read(scene_index)` to load another scene.")
         self.read( scene_index = self.scene_index )
         
     def read(self,
@@ -55,6 +153,14 @@ class ZeissManager(MicroscopeManager):
         """
         Read the Zeiss dataset and populate self.data and self.metadata.
 
+        Blocks are read with a pooled pylibCZIrw reader, so the subblock
+        directory is parsed once rather than once per plane; layouts the
+        reader cannot map onto the BioImage array (e.g. BGR pixels) are read
+        through BioImage. If the file stores a native pyramid (slide
+        scanners), its downsampled layers are exposed as additional levels of
+        ``self.data``, read directly from the pyramid subblocks instead of
+        from full resolution.
+
         Returns
         -------
         Tuple[List[da.Array], Dict[str, Any]]
@@ -63,55 +169,323 @@ class ZeissManager(MicroscopeManager):
             - A metadata dictionary with pixel sizes, units, axes, etc.
         """
                 
-        czi = BioImage(self.path, reconstruct_mosaic=True, use_aicspylibczi=False)
+        czi = self._czi
 
         assert scene_index<len(czi.scenes), ValueError(f"Invalid scene index {scene_index}, only {len(czi.scenes)} scenes available: {czi.scenes}")
         self.scene_index = scene_index
         self.scene_name = czi.scenes[scene_index]
             
-        czi.set_scene(self.scene_index)
+        # The BioImage is shared with the views of `scene`: switch it only while
+        # taking the scene's dask graph (which freezes the scene) and channel
+        # names, then switch it back, so no other manager sees the change.
+        with self._reader_lock:
+            previous = czi.current_scene_index
+            czi.set_scene(self.scene_index)
+            try:
+                data = czi.get_image_dask_data("TCZYX")
+                self._channel_names = [str(n) for n in czi.channel_names]
+            finally:
+                czi.set_scene(previous)
         if self.chunks is None:
-            self.chunks = czi.get_image_dask_data("TCZYX").chunksize
-        self.data = [ czi.get_image_dask_data("TCZYX").rechunk(self.chunks) ]
+            self.chunks = data.chunksize
+        self._level_factors = [1]
+        self.data = [ self._full_resolution(data) ] + self._native_levels(data)
         self.metadata = self._parse_metadata()
         
         return
+
+    def scene(self, scene_index: int) -> "ZeissManager":
+        """
+        Return a manager for another scene, sharing this manager's parsed file.
+
+        Unlike `read`, this leaves the current manager untouched, so several
+        scenes can be held (and written) at the same time: the shared reader
+        is only switched to the view's scene while its graph is built.
+
+        Parameters
+        ----------
+        scene_index : int
+            Index of the scene in `self.scenes`.
+
+        Returns
+        -------
+        ZeissManager
+            A manager whose `data` and `metadata` describe `scene_index`.
+        """
         
-    def _parse_metadata(self) -> Dict[str, Any]:
+        view = copy.copy(self)
+        view._open_files = []
+        view.chunks = self._user_chunks
+        view.read(scene_index=scene_index)
+        return view
+
+    def scenes_to_zarr(self,
+                       path: str,
+                       scene_indices: Optional[List[int]] = None,
+                       layout: str = "stores",
+                       prepare=None,
+                       max_workers: Optional[int] = None,
+                       memory_budget_mb: Optional[float] = None,
+                       **kwargs) -> List[str]:
+        """
+        Write all (or selected) scenes of the .czi file in one pass.
+
+        The file is parsed once; scenes are written concurrently while sharing
+        a memory budget. See `pymif.microscope_manager.utils.scenes.write_scenes`.
+
+        Parameters
+        ----------
+        path : str
+            Output folder (``layout="stores"``, one ``<scene>.zarr`` per scene) or
+            output store (``layout="groups"``, first scene at the root and the
+            other scenes as image subgroups).
+        scene_indices : List[int], optional
+            Scenes to write. Default: all scenes.
+        layout : {"stores", "groups"}
+            Output layout.
+        prepare : callable, optional
+            Applied to every scene manager before writing, e.g. to build its pyramid.
+        max_workers : int, optional
+            Maximum number of scenes written concurrently.
+        memory_budget_mb : float, optional
+            Memory shared by the scenes being written.
+        **kwargs
+            Forwarded to `ZarrWriteConfig`.
+
+        Returns
+        -------
+        List[str]
+            Path of the store or group holding each scene.
+        """
+        
+        from .utils.scenes import write_scenes
+        return write_scenes(
+            self,
+            path,
+            scene_indices=scene_indices,
+            layout=layout,
+            prepare=prepare,
+            max_workers=max_workers,
+            memory_budget_mb=memory_budget_mb,
+            **kwargs,
+        )
+
+    def _open_layout(self) -> Dict[str, Any]:
         """
-        Parse metadata from the .czi dataset.
+        Read the subblock layout (and raw XML) of the file with pylibCZIrw, once per manager.
 
         Returns
         -------
         Dict[str, Any]
-            A dictionary containing dataset shape, voxel sizes, channel info, and other metadata.
+            Scene rectangles, total bounding box and pixel types, without pyramid layers.
+        """
+        
+        if self._czi_layout is None:
+            from pylibCZIrw import czi as pyczi
+            with pyczi.open_czi(str(self.path)) as f:
+                self._czi_layout = {
+                    "rects": f.scenes_bounding_rectangle_no_pyramid,
+                    "bbox": f.total_bounding_box_no_pyramid,
+                    "pixel_types": f.pixel_types,
+                    "xml": f.raw_metadata,
+                }
+        if self._xml is None:
+            self._xml = ET.fromstring(self._czi_layout["xml"])
+        return self._czi_layout
+
+    def _scene_rect(self, layout: Dict[str, Any]) -> Tuple[Optional[int], Tuple[int, int, int, int]]:
+        """Return the CZI scene index and its ``(x, y, w, h)`` rectangle for the current scene."""
+        if len(layout["rects"]) == 0:
+            (x, w), (y, h) = layout["bbox"]["X"], layout["bbox"]["Y"]
+            return None, (x, y, w, h)
+        scene = sorted(layout["rects"])[self.scene_index]
+        rect = layout["rects"][scene]
+        return scene, (rect.x, rect.y, rect.w, rect.h)
+
+    def _probe_scene_names(self) -> Tuple[str, ...]:
+        """Scene names as BioImage reports them: ``Name[-ShapeName]`` of each CZI scene."""
+        rects = self._open_layout()["rects"]
+        if len(rects) == 0:
+            return ("Image:0",)
+        names = []
+        for index in sorted(rects):
+            info = self._xml.find(f".//Dimensions/S/Scenes/Scene[@Index='{index}']")
+            name = str(index) if info is None else info.get("Name", str(index))
+            shape = None if info is None else info.find("Shape")
+            if shape is not None and shape.get("Name") is not None:
+                name = f"{name}-{shape.get('Name')}"
+            names.append(name)
+        return tuple(names)
+
+    def _probe_metadata(self) -> Dict[str, Any]:
+        """
+        Build the metadata of the current scene from the XML and subblock directory only.
+
+        Native pyramid layers are not listed.
+        """
+        
+        layout = self._open_layout()
+        file_metadata = self._parse_file_metadata()
+        _, (_, _, w, h) = self._scene_rect(layout)
+        size_t, size_c, size_z = (layout["bbox"].get(d, (0, 1))[1] for d in "TCZ")
+        
+        channels = self._xml.findall(".//Image/Dimensions/Channels/Channel")
+        channel_names = [
+            channels[i].get("Name") or channels[i].get("Id") if i < len(channels) else f"Channel:0:{i}"
+            for i in range(size_c)
+        ]
+        
+        return {
+            "size": [(size_t, size_c, size_z, h, w)],
+            "scales": [file_metadata["scales"]],
+            "units": file_metadata["units"],
+            "time_increment": file_metadata["time_increment"],
+            "time_increment_unit": file_metadata["time_increment_unit"],
+            "channel_names": channel_names,
+            "channel_colors": list(file_metadata["channel_colors"]),
+            "dtype": file_metadata["dtype"],
+            "plane_files": Path(self.path).stem,
+            "axes": "tczyx"
+        }
+
+    def _native_pyramid_factors(self, czi_scene: Optional[int]) -> List[int]:
+        """
+        Return the cumulative downscale factor of each stored pyramid layer.
+
+        Zeiss writes the pyramid layout of every scene as
+        ``Scene/PyramidInfo/{PyramidLayersCount, MinificationFactor}``.
+        """
+        
+        meta = self._xml
+        info = meta.find(f".//Dimensions/S/Scenes/Scene[@Index='{czi_scene}']/PyramidInfo")
+        if info is None:
+            info = meta.find(".//PyramidInfo")
+        if info is None:
+            return []
+        n_layers = int(info.findtext("PyramidLayersCount") or 0)
+        minification = int(info.findtext("MinificationFactor") or 2)
+        if minification < 2:
+            return []
+        return [minification**i for i in range(1, n_layers + 1)]
+
+    def _czi_level(self, layout: Dict[str, Any], factor: int, shape: Tuple[int, ...], dtype) -> da.Array:
+        """Build the lazy TCZYX array of the current scene read at ``1/factor`` zoom."""
+        scene, (origin_x, origin_y, _, _) = self._scene_rect(layout)
+        chunks = da.core.normalize_chunks(
+            tuple(min(c, n) for c, n in zip(self.chunks, shape)), shape=shape, dtype=dtype
+        )
+        return da.map_blocks(
+            _read_czi_level_block,
+            chunks=chunks,
+            meta=np.empty((0,) * 5, dtype=dtype),
+            name=f"czi-{tokenize(str(self.path), scene, factor, chunks)}",
+            path=str(self.path),
+            scene=scene,
+            origin=(origin_x, origin_y),
+            factor=factor,
+            plane_dims="".join(d for d in "TCZ" if d in layout["bbox"]),
+            block_dtype=dtype,
+        )
+
+    def _lease_reader(self) -> None:
+        """Release the pooled reader of the file when the manager is closed."""
+        if not any(isinstance(f, HandleLease) and f.pool is _czi_pool for f in self._open_files):
+            self._open_files.append(HandleLease(_czi_pool, [str(self.path)]))
+
+    def _full_resolution(self, data: da.Array) -> da.Array:
+        """
+        Return the full-resolution array of the current scene, read with the pooled reader.
+
+        Parameters
+        ----------
+        data : da.Array
+            BioImage's TCZYX array of the current scene, used as a fallback
+            when the subblock layout does not match it.
+        """
+
+        layout = self._open_layout()
+        if max(1, len(layout["rects"])) != len(self.scenes):
+            return data.rechunk(self.chunks)
+        _, (_, _, w, h) = self._scene_rect(layout)
+        shape = tuple(layout["bbox"].get(d, (0, 1))[1] for d in "TCZ") + (h, w)
+        if shape != tuple(data.shape) or any("Bgr" in str(p) for p in layout["pixel_types"].values()):
+            return data.rechunk(self.chunks)
+        self._lease_reader()
+        return self._czi_level(layout, 1, shape, data.dtype)
+
+    def _native_levels(self, data: da.Array) -> List[da.Array]:
+        """
+        Build lazy dask arrays for the native pyramid layers of the current scene.
+
+        Parameters
+        ----------
+        data : da.Array
+            Full-resolution TCZYX array of the current scene.
+
+        Returns
+        -------
+        List[da.Array]
+            One array per stored pyramid layer, empty if the file has no pyramid.
+        """
+        
+        if self._xml.find(".//PyramidInfo") is None:
+            return []
+
+        layout = self._open_layout()
+
+        if any("Bgr" in str(p) for p in layout["pixel_types"].values()):
+            return []
+
+        scene, _ = self._scene_rect(layout)
+        self._lease_reader()
+
+        levels = []
+        shape = tuple(data.shape)
+        prev_factor = 1
+        for factor in self._native_pyramid_factors(scene):
+            # Same rounding as `build_pyramid` (ceil), so `reuse_levels` recognises these levels.
+            step = factor // prev_factor
+            shape = shape[:3] + (-(-shape[3] // step), -(-shape[4] // step))
+            prev_factor = factor
+            self._level_factors.append(factor)
+            levels.append(self._czi_level(layout, factor, shape, data.dtype))
+        return levels
+
+    def _parse_file_metadata(self) -> Dict[str, Any]:
+        """
+        Parse the scene-independent part of the .czi metadata once per manager.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Voxel sizes, units, time increment, channel colors and dtype.
         """
         
-        czi = BioImage(self.path, reconstruct_mosaic=True, use_aicspylibczi=False)
-        czi.set_scene(self.scene_index)
+        if self._file_metadata is not None:
+            return self._file_metadata
         
-        size = czi.get_image_dask_data("TCZYX").shape
+        xml = self._xml
         
         # The values are stored in units of meters always in .czi. Convert to microns.
         try:
-            pxl_z = float(czi.metadata.findall(f"./Metadata/Scaling/Items/Distance[@Id='Z']")[0].find("./Value").text)/1e-6
+            pxl_z = float(xml.findall(f"./Metadata/Scaling/Items/Distance[@Id='Z']")[0].find("./Value").text)/1e-6
         except:
             pxl_z  =1.
         scales = tuple([
             pxl_z,
-            float(czi.metadata.findall(f"./Metadata/Scaling/Items/Distance[@Id='Y']")[0].find("./Value").text)/1e-6,
-            float(czi.metadata.findall(f"./Metadata/Scaling/Items/Distance[@Id='X']")[0].find("./Value").text)/1e-6,
+            float(xml.findall(f"./Metadata/Scaling/Items/Distance[@Id='Y']")[0].find("./Value").text)/1e-6,
+            float(xml.findall(f"./Metadata/Scaling/Items/Distance[@Id='X']")[0].find("./Value").text)/1e-6,
         ])
         
         units = ["micrometer"] * 3
         
-        time_increment = np.clip( float(czi.metadata.findtext(".//TimeSeriesSetup/Interval/TimeSpan/Value") or 1.0), 1.0, None )
-        time_unit = czi.metadata.findtext(".//TimeSeriesSetup/Interval/TimeSpan/DefaultUnitFormat") or "s"
+        time_increment = np.clip( float(xml.findtext(".//TimeSeriesSetup/Interval/TimeSpan/Value") or 1.0), 1.0, None )
+        time_unit = xml.findtext(".//TimeSeriesSetup/Interval/TimeSpan/DefaultUnitFormat") or "s"
 
         # Channels
         colors = []
         default_colors = ["#FFFFFF", "#FF0000", "#0000FF", "#00FF00"]
-        for i, ch in enumerate( czi.metadata.findall(".//DisplaySetting/Channels/Channel") ):
+        for i, ch in enumerate( xml.findall(".//DisplaySetting/Channels/Channel") ):
             color = ch.findtext("Color") or default_colors[i%len(default_colors)]
             color = str(color)
             if (len(color) == 9) and (color[0] == "#"):
@@ -119,7 +493,7 @@ class ZeissManager(MicroscopeManager):
                 color = "#"+color[3:]
             colors.append(color)
         
-        bit_depth = int(czi.metadata.findtext(".//BitsPerPixel") or 16)
+        bit_depth = int(xml.findtext(".//BitsPerPixel") or 16)
         if bit_depth==8:
             dtype = "uint8"
         elif bit_depth==16:
@@ -127,15 +501,41 @@ class ZeissManager(MicroscopeManager):
         else:
             dtype = "Unknown"
         
-        return {
-            "size": [size],
-            "scales": [scales],
+        self._file_metadata = {
+            "scales": scales,
             "units": tuple(units),
             "time_increment": time_increment,
             "time_increment_unit": time_unit,
-            "channel_names": [str(n) for n in czi.channel_names],
-            "channel_colors": colors,  # Example, map from name if needed
+            "channel_colors": colors,
             "dtype": dtype,
+        }
+        return self._file_metadata
+        
+    def _parse_metadata(self) -> Dict[str, Any]:
+        """
+        Parse metadata of the current scene from the cached .czi reader.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary containing dataset shape, voxel sizes, channel info, and other metadata.
+        """
+        
+        file_metadata = self._parse_file_metadata()
+        
+        # Native pyramid layers are downsampled in YX only.
+        pxl_z, pxl_y, pxl_x = file_metadata["scales"]
+        scales = [(pxl_z, pxl_y * f, pxl_x * f) for f in self._level_factors]
+        
+        return {
+            "size": [tuple(level.shape) for level in self.data],
+            "scales": scales,
+            "units": file_metadata["units"],
+            "time_increment": file_metadata["time_increment"],
+            "time_increment_unit": file_metadata["time_increment_unit"],
+            "channel_names": list(self._channel_names),
+            "channel_colors": list(file_metadata["channel_colors"]),  # Example, map from name if needed
+            "dtype": file_metadata["dtype"],
             "plane_files": Path(self.path).stem,
             "axes": "tczyx"
         }
@@ -129,9 +129,9 @@ def _scale_for_axes(dataset, requested_axes):
     return tuple(scale_map.get(ax, 1) for ax in requested_axes if ax in axes)
 
 
-def _chunk_shape_for_dataset(dataset, chunk_z=16, chunk_y=512, chunk_x=512):
-    """Map widget Z/Y/X chunk values onto whatever axes the dataset has."""
-    chunk_map = {"t": 1, "c": 1, "z": chunk_z, "y": chunk_y, "x": chunk_x}
+def _chunk_shape_for_dataset(dataset, chunk_z=16, chunk_y=512, chunk_x=512, chunk_t=1):
+    """Map widget T/Z/Y/X chunk values onto whatever axes the dataset has."""
+    chunk_map = {"t": chunk_t, "c": 1, "z": chunk_z, "y": chunk_y, "x": chunk_x}
     axes = _dataset_axes(dataset)
     return tuple(int(max(1, min(_axis_size(dataset, ax), chunk_map[ax]))) for ax in axes)
 
@@ -182,6 +182,27 @@ def get_chunk_size(dataset_size, max_size_mb=100, axes="tczyx"):
     return tuple(int(max(1, min(size_map.get(ax, 1), chunk_map[ax]))) for ax in axes)
 
 
+def plan_chunk_layout(dataset, access_pattern="napari-2D", storage="local", zarr_format=3):
+    """Plan chunk and shard shapes of a loaded dataset with the storage-aware chunk planner.
+
+    The widget writes one channel per chunk, so the channel chunk is fixed
+    to 1. See :func:`pymif.microscope_manager.utils.chunk_plan.plan_chunks`.
+    """
+    from pymif.microscope_manager.utils.chunk_plan import plan_chunks
+
+    return plan_chunks(
+        dataset.metadata["size"][0],
+        _dataset_axes(dataset),
+        dataset.metadata.get("dtype", "uint16"),
+        source_chunks=dataset.data[0].chunksize,
+        scales=dataset.metadata["scales"][0] if dataset.metadata.get("scales") else None,
+        access=access_pattern,
+        storage=storage,
+        zarr_format=int(zarr_format),
+        fixed_chunks={"c": 1},
+    )
+
+
 def get_n_levels(dataset_size, axes="tczyx"):
     """Estimate a default number of pyramid levels from present spatial axes."""
     axes = str(axes).lower()
@@ -212,6 +233,8 @@ BATCH_CSV_COLUMNS = [
     "channel_colors",
     "channel_names",
     "num_levels",
+    "access_pattern",
+    "storage",
 ]
 
 
@@ -296,6 +319,7 @@ def _run_conversion(
     output_path,
     file_format,
     zarr_format,
+    shards=None,
     ):
     """Run the conversion pipeline used by the napari worker thread."""
     print("Starting conversion in background thread...")
@@ -342,6 +366,7 @@ def _run_conversion(
         chunk_z=chunks[2] if len(chunks) > 2 else 1,
         chunk_y=chunks[3] if len(chunks) > 3 else 512,
         chunk_x=chunks[4] if len(chunks) > 4 else 512,
+        chunk_t=chunks[0] if chunks else 1,
     )
 
     print("Requested input chunks:", chunks)
@@ -358,7 +383,14 @@ def _run_conversion(
     print("Chunks after pyramid:", [arr.chunksize for arr in dataset.data])
 
     ngff_version = "0.4" if zarr_format == 2 else "0.5"
-    dataset.to_zarr(output_path, zarr_format=zarr_format, ngff_version=ngff_version)    
+    if shards is not None:
+        print("Shards:", shards)
+    dataset.to_zarr(
+        output_path,
+        zarr_format=zarr_format,
+        ngff_version=ngff_version,
+        shards=shards if zarr_format == 3 else None,
+    )
 
     return output_path
 
@@ -621,7 +653,7 @@ def convert_widget():
         finally:
             _syncing["z"] = False
 
-    _state = {"dataset": None}
+    _state = {"dataset": None, "shards": None, "planned_chunks": None}
     _syncing = {"roi": False, "z": False}
 
     def enable_drag_and_drop(file_edit: FileEdit):
@@ -709,6 +741,9 @@ def convert_widget():
     @magicgui(
         call_button="Convert to zarr",
 
+        access_pattern={"label": "Access pattern", "choices": ["napari-2D", "3D-analysis", "time-series"], "value": "napari-2D"},
+        storage={"label": "Storage", "choices": ["local", "network", "object"], "value": "local"},
+        chunk_t={"label": "Chunk T", "min": 1, "max": 2**16, "step": 1, "value": 1},
         chunk_z={"label": "Chunk Z", "min": 1, "max": 2**16, "step": 1, "value": 16},
         chunk_y={"label": "Chunk Y", "min": 8, "max": 2**16, "step": 1, "value": 512},
         chunk_x={"label": "Chunk X", "min": 8, "max": 2**16, "step": 1, "value": 512},
@@ -743,6 +778,9 @@ def convert_widget():
         y_range=(0,1000),
         x_range=(0,1000),
         channels=(),
+        access_pattern="napari-2D",
+        storage="local",
+        chunk_t=1,
         chunk_x=512,
         chunk_y=512,
         chunk_z=16,
@@ -759,9 +797,12 @@ def convert_widget():
         scene_index = make_visualize_widget.scene_index.value
         file_format = make_visualize_widget.file_format.value
 
-        chunks = (1, 1, chunk_z, chunk_y, chunk_x)
+        chunks = (chunk_t, 1, chunk_z, chunk_y, chunk_x)
         downscale_factor = (downscale_z, downscale_y, downscale_x)
 
+        # Shards only follow the planner while the chunks are the planned ones.
+        shards = _state["shards"] if _state["planned_chunks"] == chunks else None
+
         worker = convert_worker(
                 reader=reader,
                 path=path,
@@ -777,6 +818,7 @@ def convert_widget():
                 output_path=output_path,
                 file_format=file_format,
                 zarr_format=zarr_format,
+                shards=shards,
             )
         
         make_convert_widget.enabled = False
@@ -822,11 +864,17 @@ def convert_widget():
         )
 
         selected_colors = _channel_colors_from_metadata(dataset, selected_channel_names)
+        chunks = (
+            make_convert_widget.chunk_t.value, 1, make_convert_widget.chunk_z.value,
+            make_convert_widget.chunk_y.value, make_convert_widget.chunk_x.value,
+        )
+        # Planned rows are re-planned by batch2zarr after subsetting, shards included.
+        planned = _state["planned_chunks"] == chunks
         row = {
             "input": str(Path(make_visualize_widget.input_path.value).resolve()),
             "microscope": str(make_visualize_widget.file_format.value),
             "output": str(Path(make_convert_widget.output_path.value)),
-            "chunk_size": " ".join(str(v) for v in (1, 1, make_convert_widget.chunk_z.value, make_convert_widget.chunk_y.value, make_convert_widget.chunk_x.value)),
+            "chunk_size": "" if planned else " ".join(str(v) for v in chunks),
             "max_size(MB)": "",
             "scene_index": str(make_visualize_widget.scene_index.value),
             "zarr_format": str(make_convert_widget.zarr_format.value),
@@ -835,6 +883,8 @@ def convert_widget():
             "channel_colors": " ".join(selected_colors),
             "channel_names": " ".join(normalized_channel_names),
             "num_levels": str(make_convert_widget.n_levels.value),
+            "access_pattern": str(make_convert_widget.access_pattern.value) if planned else "",
+            "storage": str(make_convert_widget.storage.value) if planned else "",
         }
         _append_batch_csv(csv_path, row)
         print(f"Appended batch row to {csv_path.resolve()}")
@@ -894,21 +944,13 @@ def convert_widget():
         make_convert_widget.enabled = True
 
         axes = _dataset_axes(dataset)
-        chunk_size = get_chunk_size(dataset.metadata["size"][0], max_size_mb=100, axes=axes)
-        chunk_map = dict(zip(axes, chunk_size))
         num_levels = get_n_levels(dataset.metadata["size"][0], axes=axes)
 
-        make_convert_widget.chunk_x.max = _axis_size(dataset, "x") + 1
-        make_convert_widget.chunk_x.value = chunk_map.get("x", 1)
-        make_convert_widget.chunk_x.enabled = "x" in axes
-
-        make_convert_widget.chunk_y.max = _axis_size(dataset, "y") + 1
-        make_convert_widget.chunk_y.value = chunk_map.get("y", 1)
-        make_convert_widget.chunk_y.enabled = "y" in axes
-
-        make_convert_widget.chunk_z.max = _axis_size(dataset, "z") + 1
-        make_convert_widget.chunk_z.value = chunk_map.get("z", 1)
-        make_convert_widget.chunk_z.enabled = "z" in axes
+        for ax in "tzyx":
+            chunk_widget = getattr(make_convert_widget, f"chunk_{ax}")
+            chunk_widget.max = _axis_size(dataset, ax) + 1
+            chunk_widget.enabled = ax in axes
+        _apply_chunk_plan()
 
         make_convert_widget.n_levels.value = num_levels
         make_convert_widget.downscale_z.enabled = "z" in axes
@@ -935,6 +977,31 @@ def convert_widget():
 
         viewer.layers.clear()
 
+    def _apply_chunk_plan(*_):
+        """Fill the chunk widgets from the chunk planner for the selected access pattern and storage."""
+        dataset = _state.get("dataset")
+        if dataset is None:
+            return
+        layout = plan_chunk_layout(
+            dataset,
+            access_pattern=make_convert_widget.access_pattern.value,
+            storage=make_convert_widget.storage.value,
+            zarr_format=make_convert_widget.zarr_format.value,
+        )
+        chunk_map = dict(zip(_dataset_axes(dataset), layout.chunks))
+        for ax in "tzyx":
+            getattr(make_convert_widget, f"chunk_{ax}").value = chunk_map.get(ax, 1)
+        _state["planned_chunks"] = tuple(chunk_map.get(ax, 1) for ax in "tczyx")
+        _state["shards"] = layout.shards
+        print(
+            f"Chunk plan ({layout.access}, {layout.storage}): chunks {layout.chunks}, shards {layout.shards}, "
+            f"{layout.n_files} files at full resolution, source read amplification {layout.read_amplification:.2f}x."
+        )
+
+    make_convert_widget.access_pattern.changed.connect(_apply_chunk_plan)
+    make_convert_widget.storage.changed.connect(_apply_chunk_plan)
+    make_convert_widget.zarr_format.changed.connect(_apply_chunk_plan)
+
     make_visualize_widget.scene_index.enabled = False
     make_convert_widget.enabled = False
     viewer.dims.events.ndisplay.connect(lock_roi_in_3d)
@@ -1011,6 +1078,7 @@ def convert_widget():
     advanced_btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
 
     advanced_widgets = [
+        make_convert_widget.chunk_t.native.parent(),
         make_convert_widget.chunk_x.native.parent(),
         make_convert_widget.chunk_y.native.parent(),
         make_convert_widget.chunk_z.native.parent(),
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from multiprocessing import resource_tracker, shared_memory
+
+import dask
+import dask.array
+import numpy as np
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.shared_buffers import PAGE_SIZE, page_aligned_chunks
+
+
+def _blocks(arr):
+    """Compute every block of ``arr`` on its own, as a worker would."""
+    graph = dict(arr.__dask_graph__())
+    return [dask.get(graph, key) for key in dask.core.flatten(arr.__dask_keys__())]
+
+
+def _single_level(metadata):
+    single = {k: v for k, v in metadata.items() if k not in ("size", "chunksize")}
+    single["scales"] = metadata["scales"][:1]
+    return single
+
+
+def test_memmap_blocks_are_page_aligned_views(tmp_path, metadata):
+    shape = (2, 2, 4, 64, 128)
+    source = np.arange(np.prod(shape), dtype=np.uint16).reshape(shape)
+    path = tmp_path / "stack.raw"
+    source.tofile(path)
+    mapped = np.memmap(path, dtype=np.uint16, mode="r", shape=shape)
+
+    m = mm.ArrayManager(mapped, _single_level(metadata), chunks=(1, 1, 4, 30, 128))
+    arr = m.data[0]
+
+    # A 128-pixel uint16 row is 256 bytes: Y chunks are rounded down to 16 rows per page.
+    assert arr.chunks[3] == (16, 16, 16, 16)
+    for block in _blocks(arr):
+        assert np.shares_memory(block, mapped)
+        assert block.ctypes.data % PAGE_SIZE == 0
+    np.testing.assert_array_equal(arr.compute(), source)
+
+
+def test_page_aligned_chunks_follow_fortran_layout():
+    arr = np.zeros((4096, 8, 8), dtype=np.uint8, order="F")
+    # X and Y strides span whole pages; the contiguous first axis is split in pages.
+    assert page_aligned_chunks(arr, (3000, 1, 1)) == ((PAGE_SIZE,) * (4096 // PAGE_SIZE), (1,) * 8, (1,) * 8)
+
+
+def test_page_alignment_never_grows_blocks_unbounded():
+    # Odd Y/X sizes need thousands of planes or rows between page boundaries.
+    shape = (100, 2, 300, 2001, 2001)
+    strides = tuple(int(np.prod(shape[i + 1:])) * 2 for i in range(5))
+    arr = np.lib.stride_tricks.as_strided(np.zeros(1, dtype=np.uint16), shape, strides)
+
+    chunks = page_aligned_chunks(arr, (1, 1, 8, 1024, 1024))
+    block = [c[0] for c in chunks]
+    assert block[0] == 1 and block[2] == 8
+    assert np.prod(block) <= 2 * 8 * 1024 * 1024
+    assert np.prod([len(c) for c in chunks]) >= 100 * 2 * 300 // 8
+
+
+def test_from_shared_memory_attaches_by_name(metadata, capsys):
+    shape = (2, 2, 4, 16, 16)
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 2)
+    try:
+        producer = np.ndarray(shape, dtype=np.uint16, buffer=shm.buf)
+        producer[:] = np.arange(np.prod(shape), dtype=np.uint16).reshape(shape)
+
+        m = mm.ArrayManager.from_shared_memory(shm.name, shape, np.uint16, _single_level(metadata), chunks=(1, 1, 4, 16, 16))
+        # Attaching in the creating process dropped the tracker entry that unlink() removes.
+        resource_tracker.register(shm._name, "shared_memory")
+        for block in _blocks(m.data[0]):
+            assert block.base is not None and not block.flags.owndata
+        producer[0, 0, 0, 0, 0] = 999
+        assert int(m.data[0][0, 0, 0, 0, 0].compute()) == 999
+        np.testing.assert_array_equal(m.data[0][1].compute(), producer[1])
+
+        m.close()
+        assert m.data == [] and m._open_files == []
+        assert "failed to close" not in capsys.readouterr().out
+        del producer
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_array_manager_probe_returns_normalized_metadata():
+    meta = mm.ArrayManager.probe(np.zeros((3, 8, 8), dtype=np.uint8), {"axes": "zyx", "scales": [(2.0, 0.5, 0.5)]})
+    assert meta["size"] == [(3, 8, 8)] and meta["dtype"] == "uint8" and meta["axes"] == "zyx"
+    assert mm.ArrayManager(np.zeros((3, 8, 8)), {"axes": "zyx"}, probe=True).data == []
+
+
+def test_managers_without_probe_override_fall_back_to_read():
+    from pymif.microscope_manager.microscope_manager import MicroscopeManager
+
+    class PlainManager(MicroscopeManager):
+        def __init__(self, probe=False):
+            super().__init__()
+            self._load(probe)
+
+        def read(self):
+            self.data = [dask.array.zeros((2, 4, 4), dtype=np.uint16)]
+            self.metadata = {"axes": "zyx", "size": [(2, 4, 4)]}
+
+    assert len(PlainManager().data) == 1
+    assert PlainManager.probe() == {"axes": "zyx", "size": [(2, 4, 4)]}
+    assert PlainManager(probe=True).data == []
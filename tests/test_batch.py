@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import csv
+
+import numpy as np
+import pytest
+import tifffile
+
+import pymif.microscope_manager as mm
+from pymif.cli.batch import BatchJob, assign_shares
+from pymif.cli.pymif import convert_batch
+
+
+def test_shares_follow_dataset_size():
+    jobs = [
+        BatchJob(row=0, kwargs={}, size_mb=300.0, chunk_mb=10.0),
+        BatchJob(row=1, kwargs={}, size_mb=100.0, chunk_mb=10.0),
+        BatchJob(row=2, kwargs={}),
+    ]
+    assign_shares(jobs, cpus=16, workers=4, memory_budget_mb=100.0)
+
+    assert [job.threads for job in jobs] == [6, 2, 4]
+    assert [job.memory_mb for job in jobs] == [100.0, 40.0, 0.0]
+
+
+def test_batch_runs_rows_concurrently_past_failures(tmp_path):
+    rows = []
+    for i, shape in enumerate([(4, 32, 32), (2, 16, 16)]):
+        path = tmp_path / f"stack_{i}.tif"
+        tifffile.imwrite(path, np.full(shape, i + 1, dtype=np.uint16), imagej=True, metadata={"axes": "ZYX"})
+        rows.append({"input": str(path), "microscope": "tiff", "output": str(tmp_path / f"out_{i}.zarr")})
+    rows.insert(1, {"input": str(tmp_path / "missing.tif"), "microscope": "tiff", "output": str(tmp_path / "bad.zarr")})
+
+    batch = tmp_path / "batch.csv"
+    with open(batch, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["input", "microscope", "output", "num_levels"])
+        writer.writeheader()
+        writer.writerows({**row, "num_levels": 1} for row in rows)
+
+    args = argparse.Namespace(input_file=str(batch), workers=2, memory_budget=None, log_dir=None)
+    with pytest.raises(SystemExit, match="1 of 3 conversions failed"):
+        convert_batch(args)
+
+    np.testing.assert_array_equal(mm.ZarrManager(str(tmp_path / "out_0.zarr")).data[0].compute(), 1)
+    np.testing.assert_array_equal(mm.ZarrManager(str(tmp_path / "out_1.zarr")).data[0].compute(), 2)
+
+    with open(tmp_path / "batch_logs" / "status.csv") as f:
+        status = list(csv.DictReader(f))
+    assert [row["status"] for row in status] == ["done", "failed", "done"]
+    assert "FileNotFoundError" in status[1]["error"]
+    assert "Traceback" in open(status[1]["log"]).read()
+    assert "--->Writing to zarr" in open(status[0]["log"]).read()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import csv
+
+import numpy as np
+
+from pymif.cli.bench import synthetic_array
+from pymif.cli.pymif import bench
+
+
+def test_synthetic_array_is_lazy_noise():
+    data = synthetic_array((2, 20, 30), dtype="uint16", chunks=(1, 16, 16))
+    assert data.chunksize == (1, 16, 16) and data.dtype == np.uint16
+
+    values = data.compute()
+    assert values.max() < 4096
+    # Every chunk is shifted by its index, so no two chunks are identical.
+    assert not np.array_equal(values[0, :16, :16], values[1, :16, :16])
+    assert synthetic_array((8, 8), dtype="float32").compute().max() < 1
+
+
+def test_bench_times_every_step(tmp_path, capsys):
+    report = tmp_path / "bench.csv"
+    bench(argparse.Namespace(
+        output_dir=str(tmp_path / "storage"), shape=[2, 8, 64, 64], axes="czyx", dtype="uint16",
+        chunk_size=[1, 4, 32, 32], max_size=100, num_levels=2, zarr_formats=[2, 3], compressors=["none", "blosc"],
+        region_size=[2, 16, 16], repeats=2, seed=0, report=str(report), keep=False,
+    ))
+
+    with open(report) as f:
+        rows = list(csv.DictReader(f))
+    steps = [(r["step"], r["zarr_format"], r["compressor"], r["level"]) for r in rows]
+    assert steps[:2] == [("generate", "", "", "0"), ("build_pyramid", "", "", "")]
+    assert steps.count(("to_zarr", "3", "blosc", "")) == 1
+    assert ("write_region", "2", "none", "1") in steps and ("read_level", "3", "blosc", "0") in steps
+    assert len(rows) == 2 + 2 * 2 * (2 + 2 * 3)
+
+    to_zarr = [r for r in rows if r["step"] == "to_zarr"]
+    assert all(float(r["mb_s"]) > 0 and float(r["stored_mb"]) > 0 for r in to_zarr)
+    assert float(to_zarr[1]["stored_mb"]) < float(to_zarr[0]["stored_mb"])
+    assert all(r["peak_rss_mb"] for r in rows)
+
+    # The stores are removed, and the store trees are not printed.
+    assert list((tmp_path / "storage").iterdir()) == []
+    out = capsys.readouterr().out
+    assert "read_region" in out and "NGFF_VERSION" not in out
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import tifffile
+import zarr
+
+import pymif.microscope_manager as mm
+from pymif.cli.pymif import zarr_convert
+from pymif.microscope_manager.utils.chunk_plan import plan_chunks
+from pymif.microscope_manager.utils.occupancy import get_occupancy_index, occupancy_mask
+
+
+def test_access_patterns_shape_the_chunks():
+    shape = (50, 2, 64, 2048, 2048)
+
+    napari = plan_chunks(shape, "tczyx", "uint16", access="napari-2D", storage="local")
+    assert napari.chunks == (1, 1, 1, 1024, 2048)
+
+    # Anisotropic voxels: 4 um Z steps get 8x fewer planes than 0.5 um pixels.
+    analysis = plan_chunks(shape, "tczyx", "uint16", scales=(4.0, 0.5, 0.5), access="3D-analysis", storage="local")
+    assert analysis.chunks == (1, 1, 32, 256, 512)
+
+    series = plan_chunks(shape, "tczyx", "uint16", access="time-series", storage="local")
+    assert series.chunks[0] == 50 and series.chunk_mb <= 8
+
+
+def test_chunks_follow_source_blocks():
+    plan = plan_chunks(
+        (1, 1, 60, 512, 512), "tczyx", "uint16",
+        source_chunks=(1, 1, 6, 128, 128), access="3D-analysis", storage="local",
+    )
+    # Z steps through the divisors and multiples of the 6-plane source blocks.
+    assert plan.chunks == (1, 1, 60, 256, 256)
+    assert plan.read_amplification == 1.0
+
+    with pytest.warns(UserWarning, match="read 4.0x the source data"):
+        unaligned = plan_chunks((1, 1, 60, 512, 512), "tczyx", "uint16", source_chunks=(1, 1, 7, 128, 128), max_chunk_mb=0.1)
+    assert 7 % unaligned.chunks[2] == 0 or unaligned.chunks[2] % 7 == 0
+
+
+@pytest.mark.parametrize("access", ["napari-2D", "3D-analysis", "time-series"])
+def test_plane_tiled_sources_are_read_once(access):
+    # TIFF pages and Luxendo planes: every source block is a whole YX plane.
+    plan = plan_chunks((100, 2, 300, 2048, 2048), "tczyx", "uint16", source_chunks=(1, 1, 1, 2048, 2048),
+                       access=access, storage="local")
+    assert plan.read_amplification == 1.0
+    assert plan.chunks[3:] == (2048, 2048) and plan.chunk_mb <= 8
+
+
+def test_fixed_chunks_are_neither_grown_nor_split():
+    # The napari widget always writes one channel per chunk.
+    free = plan_chunks((2, 3, 4, 64, 64), "tczyx", "uint16", access="napari-2D", storage="object")
+    assert free.chunks == (2, 3, 4, 64, 64)
+
+    plan = plan_chunks((2, 3, 4, 64, 64), "tczyx", "uint16", access="napari-2D", storage="object",
+                       fixed_chunks={"c": 1})
+    assert plan.chunks == (2, 1, 4, 64, 64)
+    assert plan.shards == (2, 3, 4, 64, 64)
+
+
+def test_small_chunks_are_sharded_on_object_storage():
+    plan = plan_chunks((1, 1, 64, 4096, 4096), "tczyx", "uint16", access="napari-2D", storage="object", max_chunk_mb=1)
+    assert plan.chunks == (1, 1, 1, 512, 1024)
+    assert plan.shards is not None and plan.shard_mb <= 1024
+    assert all(s % c == 0 for s, c in zip(plan.shards, plan.chunks))
+    assert plan.n_files < 64 * 8 * 4
+
+    assert plan_chunks((1, 1, 64, 4096, 4096), "tczyx", "uint16", access="napari-2D", storage="object",
+                       max_chunk_mb=1, zarr_format=2).shards is None
+    with pytest.raises(ValueError, match="Unknown access pattern"):
+        plan_chunks((4, 4), "yx", "uint8", access="2D")
+
+
+def test_sharded_write_keeps_per_chunk_occupancy(tmp_path, metadata):
+    data = np.zeros((2, 2, 4, 16, 16), dtype=np.uint16)
+    data[0, 1, 1:3, 9:12, 2:5] = 5
+    single = {k: v for k, v in metadata.items() if k not in ("size", "chunksize")}
+    single["scales"] = metadata["scales"][:1]
+    m = mm.ArrayManager(data, single, chunks=(1, 1, 2, 4, 4))
+    m.to_zarr(str(tmp_path / "sharded.zarr"), shards=(1, 2, 4, 8, 8))
+
+    z = zarr.open_group(str(tmp_path / "sharded.zarr"), mode="r")["0"]
+    assert z.chunks == (1, 1, 2, 4, 4) and z.shards == (1, 2, 4, 8, 8)
+    np.testing.assert_array_equal(z[:], data)
+
+    mask = occupancy_mask(get_occupancy_index(zarr.open_group(str(tmp_path / "sharded.zarr"), mode="r"))[0])
+    assert mask.shape == (2, 2, 2, 4, 4)
+    assert sorted(zip(*np.nonzero(mask))) == [(0, 1, 0, 2, 0), (0, 1, 0, 2, 1), (0, 1, 1, 2, 0), (0, 1, 1, 2, 1)]
+
+    with pytest.raises(ValueError, match="Sharding requires zarr v3"):
+        m.to_zarr(str(tmp_path / "v2.zarr"), zarr_format=2, ngff_version="0.4", shards=(1, 2, 4, 8, 8))
+
+
+def test_cli_access_pattern_writes_planned_layout(tmp_path):
+    data = np.random.default_rng(0).integers(0, 4096, (12, 64, 64), dtype=np.uint16)
+    tifffile.imwrite(tmp_path / "stack.tif", data, imagej=True, metadata={"axes": "ZYX"})
+
+    out = tmp_path / "out.zarr"
+    with pytest.warns(UserWarning, match="exceed the 0.002 MB chunk budget"):
+        zarr_convert(str(tmp_path / "stack.tif"), str(out), microscope="tiff", num_levels=1,
+                     access_pattern="napari-2D", storage="object", max_size=0.002)
+
+    z = zarr.open_group(str(out), mode="r")["0"]
+    assert z.chunks == (1, 1, 1, 32, 32)
+    assert z.shards is not None and z.shards[2] > 1
+    np.testing.assert_array_equal(z[0, 0], data)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import pickle
+
+import dask
+import h5py
+import numpy as np
+import pytest
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.h5_pool import H5HandlePool, get_h5_pool
+
+SIZE_T, SIZE_C, SHAPE = 3, 2, (8, 32, 32)
+
+XML = """<?xml version="1.0" encoding="UTF-8"?>
+<SpimData>
+  <SequenceDescription>
+    <ViewSetups>
+      <ViewSetup><id>0</id><size>32 32 8</size><voxelSize><size>0.5 0.5 2.0</size></voxelSize></ViewSetup>
+      <Attributes name="channel">
+        <Channel><id>0</id><name>gfp</name></Channel>
+        <Channel><id>1</id><name>rfp</name></Channel>
+      </Attributes>
+    </ViewSetups>
+    <Timepoints><first>0</first><last>2</last></Timepoints>
+  </SequenceDescription>
+</SpimData>
+"""
+
+
+def _stack(t, c):
+    return (np.arange(np.prod(SHAPE), dtype=np.uint16).reshape(SHAPE) + 1000 * t + 100 * c).astype(np.uint16)
+
+
+@pytest.fixture
+def luxendo_dir(tmp_path):
+    root = tmp_path / "luxendo"
+    root.mkdir()
+    (root / "dataset.xml").write_text(XML)
+    for t in range(SIZE_T):
+        for c in range(SIZE_C):
+            with h5py.File(root / f"stack_0_tp-{t}_ch-{c}.lux.h5", "w") as f:
+                data = _stack(t, c)
+                f.create_dataset("Data", data=data, chunks=(4, 16, 16))
+                f.create_dataset("Data_2_2_2", data=data[::2, ::2, ::2], chunks=(4, 16, 16))
+    return root
+
+
+def test_luxendo_reads_through_bounded_pool(luxendo_dir):
+    pool = get_h5_pool()
+    pool.close()
+    previous = pool.max_open
+    pool.resize(2)
+    try:
+        d = mm.LuxendoManager(str(luxendo_dir), chunks=(1, 1, 4, 16, 16))
+        assert len(pool) == 0
+
+        expected = np.stack([np.stack([_stack(t, c) for c in range(SIZE_C)]) for t in range(SIZE_T)])
+        np.testing.assert_array_equal(d.data[0].compute(), expected)
+        np.testing.assert_array_equal(d.data[1].compute(), expected[:, :, ::2, ::2, ::2])
+        assert len(pool) <= 2
+
+        d.close()
+        assert len(pool) == 0
+    finally:
+        pool.resize(previous)
+
+
+def test_closing_one_manager_keeps_handles_of_another(luxendo_dir):
+    pool = get_h5_pool()
+    pool.close()
+    first = mm.LuxendoManager(str(luxendo_dir), chunks=(1, 1, 8, 32, 32))
+    second = mm.LuxendoManager(str(luxendo_dir), chunks=(1, 1, 8, 32, 32))
+    second.data[0][0, 0].compute()
+    n_open = len(pool)
+    assert n_open > 0
+
+    first.close()
+    first.close()
+    assert len(pool) == n_open
+    second.close()
+    assert len(pool) == 0
+
+
+def test_luxendo_graph_runs_under_processes(luxendo_dir):
+    d = mm.LuxendoManager(str(luxendo_dir), chunks=(1, 1, 8, 32, 32))
+    assert all(len(level.dask.layers) == 1 for level in d.data)
+    region = pickle.loads(pickle.dumps(d.data[0][1:, :, 2:4]))
+
+    with dask.config.set(scheduler="processes", num_workers=2):
+        result = region.compute()
+    np.testing.assert_array_equal(result[0, 1], _stack(1, 1)[2:4])
+
+
+def test_pool_pickles_empty(luxendo_dir):
+    pool = H5HandlePool(max_open=3)
+    pool.read(luxendo_dir / "stack_0_tp-0_ch-0.lux.h5", "Data", (slice(0, 1),))
+    assert len(pool) == 1
+
+    clone = pickle.loads(pickle.dumps(pool))
+    assert clone.max_open == 3 and len(clone) == 0
+    pool.close()
+
+
+def test_luxendo_chunks_align_to_storage(luxendo_dir):
+    d = mm.LuxendoManager(str(luxendo_dir))
+
+    assert d.h5_layouts["Data"]["chunks"] == (4, 16, 16)
+    assert d.data[0].chunksize == (1, 1, 8, 32, 32)
+    for level in d.data:
+        for dim, stored in zip(level.chunks[2:], d.h5_layouts["Data"]["chunks"]):
+            assert all(c % stored == 0 for c in dim[:-1])
+
+
+def test_storage_alignment_stays_within_memory_budget():
+    from pymif.microscope_manager.utils.chunk_align import align_to_storage, read_amplification
+
+    shape, stored = (512, 4096, 4096), (64, 256, 256)
+    assert align_to_storage((8, 4096, 4096), shape, stored) == (64, 4096, 4096)
+
+    # Rounding Z up to the 64-plane HDF5 chunk would give 2 GB uint16 blocks.
+    block = align_to_storage((8, 4096, 4096), shape, stored, itemsize=2)
+    assert block == (8, 4096, 4096)
+    assert read_amplification([(8,) * 64, (4096,), (4096,)], stored) == 8.0
+    assert align_to_storage((100, 4096, 4096), shape, stored, itemsize=2, max_block_mb=4096) == (128, 4096, 4096)
+    assert align_to_storage((100, 4096, 4096), shape, stored, itemsize=2) == (64, 4096, 4096)
+
+
+def test_misaligned_chunks_report_read_amplification(luxendo_dir):
+    with pytest.warns(UserWarning, match="decoded 2.00x"):
+        mm.LuxendoManager(str(luxendo_dir), chunks=(1, 1, 2, 32, 32))
+
+
+def test_process_pool_decoding(luxendo_dir, tmp_path):
+    from pymif.microscope_manager.utils.h5_process import shutdown_process_pool
+
+    try:
+        d = mm.LuxendoManager(str(luxendo_dir), chunks=(2, 2, 4, 16, 16), read_processes=2)
+        block = d.data[0].blocks[0, 0, 0, 0, 0].compute(scheduler="sync")
+        np.testing.assert_array_equal(block[1, 1], _stack(1, 1)[:4, :16, :16])
+
+        out = tmp_path / "converted.zarr"
+        d.to_zarr(str(out))
+        reread = mm.ZarrManager(str(out), mode="r")
+        np.testing.assert_array_equal(reread.data[0][2, 0].compute(), _stack(2, 0))
+    finally:
+        shutdown_process_pool()
+
+
+def test_process_pools_of_other_sizes_stay_usable():
+    from pymif.microscope_manager.utils.h5_process import get_process_pool, shutdown_process_pool
+
+    try:
+        small = get_process_pool(1)
+        assert get_process_pool(2) is not small and get_process_pool(1) is small
+        # Asking for another size must not shut down a pool that is in use.
+        assert small.submit(abs, -3).result() == 3
+    finally:
+        shutdown_process_pool()
+
+
+def test_luxendo_probe_reads_xml_only(luxendo_dir, monkeypatch):
+    monkeypatch.setattr(h5py, "File", lambda *a, **k: pytest.fail("probe opened an HDF5 file"))
+
+    meta = mm.LuxendoManager.probe(str(luxendo_dir))
+
+    assert meta["size"] == [(SIZE_T, SIZE_C) + SHAPE]
+    assert meta["scales"] == [(2.0, 0.5, 0.5)]
+    assert meta["channel_names"] == ["gfp", "rfp"]
+
+
+def test_luxendo_reads_single_timepoint(luxendo_dir):
+    (luxendo_dir / f"stack_0_tp-{SIZE_T}_ch-0.lux.h5").touch()  # channel 1 not written yet
+    d = mm.LuxendoManager(str(luxendo_dir), probe=True)
+
+    assert sorted(d.timepoint_files()) == list(range(SIZE_T))
+    block = d.read_timepoint(1)
+    assert block.shape == (1, SIZE_C) + SHAPE
+    np.testing.assert_array_equal(block[0, 1], _stack(1, 1))
+
+
+def test_luxendo_metadata_cache(luxendo_dir, tmp_path, monkeypatch):
+    first = mm.LuxendoManager(str(luxendo_dir), cache_metadata=True)
+    assert (luxendo_dir / ".pymif-metadata.json").exists()
+
+    real_file = h5py.File
+    opened = []
+    monkeypatch.setattr(h5py, "File", lambda path, *a, **k: opened.append(path) or real_file(path, *a, **k))
+    cached = mm.LuxendoManager(str(luxendo_dir), cache_metadata=True)
+    assert opened == []
+    assert cached.metadata == first.metadata
+    assert cached.h5_layouts == first.h5_layouts
+    np.testing.assert_array_equal(cached.data[1][2, 1].compute(), _stack(2, 1)[::2, ::2, ::2])
+
+    # A rewritten file invalidates the entry.
+    with real_file(luxendo_dir / "stack_0_tp-0_ch-0.lux.h5", "a") as f:
+        f.attrs["note"] = "x" * 1000
+    opened.clear()
+    mm.LuxendoManager(str(luxendo_dir), cache_metadata=True)
+    assert opened
+
+    # A directory keeps the sidecar out of read-only acquisition folders.
+    mm.LuxendoManager(str(luxendo_dir), cache_metadata=str(tmp_path / "cache"))
+    assert len(list((tmp_path / "cache").glob("luxendo-*.json"))) == 1
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import csv
+
+import numpy as np
+import tifffile
+
+from pymif.cli.pymif import convert_batch, zarr_convert
+from pymif.microscope_manager.utils.plan import _sample_block_indices
+
+
+def _write_stack(path, shape, value=None):
+    data = np.full(shape, value, dtype=np.uint16) if value is not None else (
+        np.random.default_rng(0).integers(0, 4096, shape, dtype=np.uint16)
+    )
+    tifffile.imwrite(path, data, imagej=True, metadata={"axes": "ZYX"})
+    return data
+
+
+def test_sampled_blocks_span_the_chunk_grid():
+    assert _sample_block_indices((1, 1, 4, 2, 2), 4) == [(0, 0, 0, 0, 0), (0, 0, 1, 0, 1), (0, 0, 2, 1, 0), (0, 0, 3, 1, 1)]
+    assert _sample_block_indices((1, 2), 10) == [(0, 0), (0, 1)]
+
+
+def test_plan_estimates_without_writing(tmp_path):
+    _write_stack(tmp_path / "noise.tif", (8, 64, 64))
+    _write_stack(tmp_path / "flat.tif", (8, 64, 64), value=7)
+
+    out = tmp_path / "out" / "noise.zarr"
+    noise = zarr_convert(str(tmp_path / "noise.tif"), str(out), microscope="tiff", chunk_size=[1, 1, 4, 32, 32],
+                         num_levels=2, plan=True)
+    flat = zarr_convert(str(tmp_path / "flat.tif"), str(out), microscope="tiff", chunk_size=[1, 1, 4, 32, 32],
+                        num_levels=2, zarr_format=2, plan=True)
+
+    assert not (tmp_path / "out").exists()
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".pymif-plan-")]
+
+    assert noise.chunks == (1, 1, 4, 32, 32)
+    assert noise.shapes == [(1, 1, 8, 64, 64), (1, 1, 4, 32, 32)]
+    assert noise.n_chunks == [8, 1]
+    assert noise.raw_mb == 9 * 4 * 32 * 32 * 2 / 1024 / 1024
+    # The CLI writes uncompressed chunks; blosc is reported for reference.
+    assert noise.stored_mb == noise.raw_mb
+    assert flat.blosc_mb < flat.raw_mb / 10
+    assert noise.sampled_chunks == 4 and noise.read_mb_s > 0 and noise.write_mb_s > 0
+    assert noise.peak_memory_mb == 2 * 4 * 32 * 32 * 2 * noise.threads / 1024 / 1024
+    assert 0 < noise.runtime_s <= noise.runtime_serial_s
+
+
+def test_batch_plan_writes_plan_csv(tmp_path, capsys):
+    _write_stack(tmp_path / "stack.tif", (4, 32, 32))
+    batch = tmp_path / "batch.csv"
+    with open(batch, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["input", "microscope", "output", "num_levels", "chunk_size"])
+        writer.writeheader()
+        writer.writerow({"input": str(tmp_path / "stack.tif"), "microscope": "tiff", "output": str(tmp_path / "a.zarr"), "num_levels": 1,
+                         "chunk_size": "1 1 4 32 32"})
+        writer.writerow({"input": str(tmp_path / "missing.tif"), "microscope": "tiff", "output": str(tmp_path / "b.zarr"), "num_levels": 1})
+
+    convert_batch(argparse.Namespace(input_file=str(batch), workers=None, memory_budget=None, log_dir=None, plan=True))
+
+    assert not (tmp_path / "a.zarr").exists()
+    with open(tmp_path / "batch_logs" / "plan.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["chunks"] == "1 1 4 32 32" and rows[0]["n_chunks"] == "1" and not rows[0]["error"]
+    assert "FileNotFoundError" in rows[1]["error"]
+    assert "1 datasets planned, 1 failed." in capsys.readouterr().out
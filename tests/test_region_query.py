@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.region import select_level
+
+
+@pytest.fixture
+def manager(image_pyramid, metadata):
+    return mm.ArrayManager(image_pyramid, metadata)
+
+
+def test_select_level_picks_coarsest_satisfying_level():
+    scales = [(1.0, 0.5, 0.5), (1.0, 1.0, 1.0), (2.0, 2.0, 2.0)]
+
+    assert select_level(scales, "tczyx", None) == 0
+    assert select_level(scales, "tczyx", 1.0) == 1
+    assert select_level(scales, "tczyx", {"y": 4.0, "x": 4.0}) == 2
+    assert select_level(scales, "tczyx", 0.1) == 0
+
+
+def test_get_region_reads_from_selected_level(manager, image_pyramid, metadata):
+    region = manager.get_region({"y": (2.0, 6.0), "x": (0.0, 3.0)}, target_resolution={"y": 1.0, "x": 1.0})
+
+    assert region.shape == (2, 2, 2, 4, 3)
+    np.testing.assert_array_equal(region.compute(), image_pyramid[1][:, :, :, 2:6, 0:3].compute())
+    assert manager.get_region({"x": (0.0, 3.0)}, target_resolution=2.0).shape[-1] == 6
+
+
+def test_get_region_only_touches_intersecting_chunks(manager, image_pyramid):
+    region = manager.get_region({"t": 0, "c": (1, 2), "z": (0.0, 2.0), "y": (0.0, 2.0), "x": (0.0, 2.0)})
+
+    np.testing.assert_array_equal(region.compute(), image_pyramid[0][0:1, 1:2, 0:1, 0:4, 0:4].compute())
+    assert region.npartitions == 1
+
+
+def test_get_region_accepts_numpy_indices_and_reports_level(manager, image_pyramid):
+    region, level, scale = manager.get_region(
+        {"t": np.int64(1), "c": np.int32(0), "x": (0.0, 3.0)}, target_resolution={"y": 1.0, "x": 1.0}, return_level=True
+    )
+
+    assert level == 1 and scale == tuple(manager.metadata["scales"][1])
+    np.testing.assert_array_equal(region.compute(), image_pyramid[1][1:2, 0:1, :, :, 0:3].compute())
+
+
+def test_get_region_applies_ngff_translation(tmp_path, image_pyramid, metadata):
+    import zarr
+
+    path = tmp_path / "translated.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(path), zarr_format=2, ngff_version="0.4")
+    group = zarr.open_group(str(path), mode="a")
+    multiscales = group.attrs["multiscales"]
+    for ds in multiscales[0]["datasets"]:
+        ds["coordinateTransformations"].append({"type": "translation", "translation": [0.0, 0.0, 0.0, 10.0, 20.0]})
+    group.attrs["multiscales"] = multiscales
+
+    d = mm.ZarrManager(str(path))
+    assert d.metadata["translations"][0] == (0.0, 10.0, 20.0)
+    region = d.get_region({"y": (12.0, 14.0), "x": (20.0, 21.0)})
+    scale_y, scale_x = d.metadata["scales"][0][1:]
+    expected = image_pyramid[0][:, :, :, int(2 / scale_y):int(4 / scale_y), 0:int(np.ceil(1 / scale_x))]
+    np.testing.assert_array_equal(region.compute(), expected.compute())
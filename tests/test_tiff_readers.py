@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import dask
+import numpy as np
+import pytest
+import tifffile
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager import viventis_manager
+
+SIZE_T, SIZE_C, SHAPE = 2, 2, (6, 16, 20)
+
+
+def _stack(t, c):
+    return (np.arange(np.prod(SHAPE), dtype=np.uint16).reshape(SHAPE) + 1000 * t + 100 * c).astype(np.uint16)
+
+
+@pytest.fixture(params=[None, "zlib"], ids=["raw", "zlib"])
+def viventis_dir(tmp_path, request):
+    root = tmp_path / "viventis"
+    root.mkdir()
+    tiffdata = []
+    for t in range(SIZE_T):
+        for c in range(SIZE_C):
+            name = f"t{t:04d}_c{c}.tif"
+            tifffile.imwrite(root / name, _stack(t, c), compression=request.param)
+            tiffdata.append(
+                f'<TiffData FirstT="{t}" FirstC="{c}" FirstZ="0" IFD="0" PlaneCount="{SHAPE[0]}">'
+                f'<UUID FileName="{name}">urn:uuid:{t}-{c}</UUID></TiffData>'
+            )
+    (root / "Position_1.ome").write_text(
+        '<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2016-06"><Image ID="Image:0">'
+        f'<Pixels DimensionOrder="XYZCT" Type="uint16" SizeT="{SIZE_T}" SizeC="{SIZE_C}" '
+        f'SizeZ="{SHAPE[0]}" SizeY="{SHAPE[1]}" SizeX="{SHAPE[2]}" '
+        'PhysicalSizeZ="2.0" PhysicalSizeY="0.5" PhysicalSizeX="0.5" '
+        'PhysicalSizeZUnit="µm" PhysicalSizeYUnit="µm" PhysicalSizeXUnit="µm" TimeIncrement="60">'
+        '<Channel ID="Channel:0" Name="gfp" Color="65535"/><Channel ID="Channel:1" Name="rfp" Color="-16776961"/>'
+        + "".join(tiffdata)
+        + "</Pixels></Image></OME>"
+    )
+    return root
+
+
+def test_viventis_blocks_read_only_their_planes(viventis_dir, monkeypatch):
+    reads = []
+    original = viventis_manager.read_tiff_pages
+
+    def spy(path, pages, **kwargs):
+        reads.append(list(pages))
+        return original(path, pages, **kwargs)
+
+    monkeypatch.setattr(viventis_manager, "read_tiff_pages", spy)
+    d = mm.ViventisManager(str(viventis_dir), chunks=(1, 1, 2, 16, 20))
+
+    block = d.data[0][1, 0, 2:4].compute(scheduler="sync")
+    np.testing.assert_array_equal(block, _stack(1, 0)[2:4])
+    assert reads == [[2, 3]]
+
+    expected = np.stack([np.stack([_stack(t, c) for c in range(SIZE_C)]) for t in range(SIZE_T)])
+    np.testing.assert_array_equal(d.data[0].compute(), expected)
+
+
+def test_viventis_metadata_cache(viventis_dir, monkeypatch):
+    first = mm.ViventisManager(str(viventis_dir), cache_metadata=True)
+    monkeypatch.setattr(
+        viventis_manager.ViventisManager, "_parse_companion_file", lambda self: pytest.fail("companion re-parsed")
+    )
+    cached = mm.ViventisManager(str(viventis_dir), cache_metadata=True)
+
+    assert cached.metadata == first.metadata
+    assert cached._plane_map == first._plane_map
+    np.testing.assert_array_equal(cached.data[0].compute(), first.data[0].compute())
+
+
+def test_viventis_graph_does_not_grow_with_timepoints(tmp_path):
+    size_t, size_c = 2000, 3
+    tiffdata = "".join(
+        f'<TiffData FirstT="{t}" FirstC="{c}" FirstZ="0" IFD="0" PlaneCount="{SHAPE[0]}">'
+        f'<UUID FileName="t{t:04d}_c{c}.tif">urn:uuid:{t}-{c}</UUID></TiffData>'
+        for t in range(size_t)
+        for c in range(size_c)
+    )
+    (tmp_path / "Position_1.ome").write_text(
+        '<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2016-06"><Image ID="Image:0">'
+        f'<Pixels DimensionOrder="XYZCT" Type="uint16" SizeT="{size_t}" SizeC="{size_c}" '
+        f'SizeZ="{SHAPE[0]}" SizeY="{SHAPE[1]}" SizeX="{SHAPE[2]}" '
+        'PhysicalSizeZ="2.0" PhysicalSizeY="0.5" PhysicalSizeX="0.5" '
+        'PhysicalSizeZUnit="µm" PhysicalSizeYUnit="µm" PhysicalSizeXUnit="µm">'
+        + tiffdata
+        + "</Pixels></Image></OME>"
+    )
+    tifffile.imwrite(tmp_path / "t1500_c2.tif", _stack(1, 1))
+
+    d = mm.ViventisManager(str(tmp_path), chunks=(1, 1, 2, 16, 20))
+    layers = d.data[0].dask.layers
+    assert len(layers) == 1
+    assert not any(layer.is_materialized() for layer in layers.values())
+
+    block = d.data[0][1500, 2, 2:4]
+    (optimized,) = dask.optimize(block)
+    assert len(optimized.__dask_graph__()) <= 2
+    np.testing.assert_array_equal(block.compute(), _stack(1, 1)[2:4])
+
+
+XLIF = """<?xml version="1.0" encoding="utf-8"?>
+<LMSDataContainerHeader><Element Name="scan"><Data><Image><ImageDescription>
+<Channels><ChannelDescription LUTName="Green"/><ChannelDescription LUTName="Red"/></Channels>
+<Dimensions>
+<DimensionDescription DimID="1" NumberOfElements="20" Length="1e-05" Unit="m"/>
+<DimensionDescription DimID="2" NumberOfElements="16" Length="8e-06" Unit="m"/>
+<DimensionDescription DimID="3" NumberOfElements="6" Length="1.2e-05" Unit="m"/>
+<DimensionDescription DimID="4" NumberOfElements="2" Length="2" Unit="s"/>
+</Dimensions></ImageDescription></Image></Data></Element></LMSDataContainerHeader>
+"""
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"], ids=["raw", "zlib"])
+def test_scape_reads_chunks_lazily(tmp_path, compression):
+    tczyx = np.stack([np.stack([_stack(t, c) for c in range(SIZE_C)]) for t in range(SIZE_T)])
+    path = tmp_path / "scan.ome.tif"
+    tifffile.imwrite(path, tczyx.transpose(0, 2, 1, 3, 4), ome=True, metadata={"axes": "TZCYX"}, compression=compression)
+    (tmp_path / "Metadata").mkdir()
+    (tmp_path / "Metadata" / "scan.xlif").write_text(XLIF)
+
+    d = mm.ScapeManager(str(path), chunks=(1, 1, 2, 8, 8))
+
+    assert d.data[0].shape == tczyx.shape
+    assert d.data[0].numblocks == (2, 2, 3, 2, 3)
+    np.testing.assert_array_equal(d.data[0][1, 1, 2:4, 8:16].compute(), tczyx[1, 1, 2:4, 8:16])
+    np.testing.assert_array_equal(d.data[0].compute(), tczyx)
+
+
+def test_tiff_blocks_reuse_pooled_handles(tmp_path, monkeypatch):
+    from pymif.microscope_manager.utils import tiff_planes
+
+    tczyx = np.stack([np.stack([_stack(t, c) for c in range(SIZE_C)]) for t in range(SIZE_T)])
+    path = tmp_path / "scan.ome.tif"
+    tifffile.imwrite(path, tczyx, ome=True, metadata={"axes": "TCZYX"}, compression="zlib")
+
+    opened = []
+    monkeypatch.setattr(tiff_planes.get_tiff_pool(), "opener", lambda p: opened.append(p) or tifffile.TiffFile(p))
+    arr = tiff_planes.tiff_series_to_tczyx(path, (1, 1, 2, 8, 8))
+    np.testing.assert_array_equal(arr.compute(scheduler="synchronous"), tczyx)
+    assert arr.numblocks == (2, 2, 3, 2, 3) and opened == [str(path)]
+
+    n_open = len(tiff_planes.get_tiff_pool())
+    tiff_planes.get_tiff_pool().evict([path])
+    assert len(tiff_planes.get_tiff_pool()) == n_open - 1
+
+
+@pytest.fixture
+def opera_tiff(tmp_path):
+    base = np.random.default_rng(0).integers(0, 1000, (2, 3, 256, 256), dtype=np.uint16)
+    native = (base[..., ::2, ::2] // 2).astype(np.uint16)
+    path = tmp_path / "plate.ome.tif"
+    options = dict(tile=(64, 64), compression="zlib")
+    with tifffile.TiffWriter(path) as tw:
+        tw.write(base, subifds=1, metadata={"axes": "CZYX", "PhysicalSizeX": 0.5, "PhysicalSizeY": 0.5, "PhysicalSizeZ": 2.0}, **options)
+        tw.write(native, subfiletype=1, **options)
+    return path, base, native
+
+
+def test_opera_chunks_follow_tiles_and_reuse_native_levels(opera_tiff):
+    path, base, native = opera_tiff
+    d = mm.OperaManager(str(path))
+
+    assert len(d.data) == 2
+    assert d.data[0].chunksize == (1, 1, 3, 256, 256)
+    np.testing.assert_array_equal(d.data[0][0].compute(), base)
+
+    d.build_pyramid(num_levels=3, downscale_factor=(1, 2, 2), reuse_levels=True)
+    np.testing.assert_array_equal(d.data[1][0].compute(), native)
+    np.testing.assert_array_equal(d.data[2][0].compute(), native[..., ::2, ::2])
+
+    d.close()
+    assert d._open_files == []
+
+
+def test_opera_misaligned_chunks_warn(opera_tiff):
+    path, _, _ = opera_tiff
+    with pytest.warns(UserWarning, match="not aligned to the TIFF tiles"):
+        mm.OperaManager(str(path), chunks=(1, 1, 1, 96, 96))
+
+
+def test_tiff_manager_memmaps_uncompressed_ome_stack(tmp_path):
+    czyx = np.stack([_stack(0, c) for c in range(SIZE_C)])
+    path = tmp_path / "stack.ome.tif"
+    tifffile.imwrite(
+        path, czyx, ome=True,
+        metadata={"axes": "CZYX", "PhysicalSizeZ": 2.0, "PhysicalSizeX": 0.5, "PhysicalSizeY": 0.5, "Channel": {"Name": ["gfp", "rfp"]}},
+    )
+
+    d = mm.TiffManager(str(path), chunks=(1, 1, 2, 8, 20))
+
+    assert d.metadata["size"] == [(1, SIZE_C) + SHAPE]
+    assert d.metadata["scales"] == [(2.0, 0.5, 0.5)]
+    assert d.metadata["units"] == ("micrometer",) * 3
+    assert d.metadata["channel_names"] == ["gfp", "rfp"]
+    assert d.data[0].numblocks == (1, 2, 3, 2, 1)
+    np.testing.assert_array_equal(d.data[0][0, 1, 2:4, 8:].compute(), czyx[1, 2:4, 8:])
+
+
+def test_tiff_manager_reads_compressed_tiles_through_zarr(tmp_path):
+    zyx = np.random.default_rng(0).integers(0, 1000, (4, 128, 128), dtype=np.uint16)
+    path = tmp_path / "tiled.tif"
+    tifffile.imwrite(path, zyx, tile=(64, 64), compression="zlib", photometric="minisblack")
+
+    with pytest.warns(UserWarning, match="interpreted as 'ZYX'"):
+        d = mm.TiffManager(str(path))
+    assert d.data[0].chunksize == (1, 1, 4, 128, 128)
+    np.testing.assert_array_equal(d.data[0][0, 0].compute(), zyx)
+
+    d.close()
+    assert d._open_files == []
+
+
+def test_tiff_manager_concatenates_glob_sequence(tmp_path):
+    for t in range(3):
+        tifffile.imwrite(
+            tmp_path / f"frame_t{t}.tif", _stack(t, 0), imagej=True,
+            resolution=(2.0, 2.0), metadata={"axes": "ZYX", "spacing": 3.0, "unit": "um", "finterval": 30.0},
+        )
+
+    d = mm.TiffManager(str(tmp_path / "frame_t*.tif"), chunks=(1, 1, 6, 16, 20))
+
+    assert d.data[0].shape == (3, 1) + SHAPE
+    assert d.metadata["scales"] == [(3.0, 0.5, 0.5)]
+    assert d.metadata["units"] == ("micrometer",) * 3
+    assert d.metadata["time_increment"] == 30.0
+    np.testing.assert_array_equal(d.data[0][2, 0].compute(), _stack(2, 0))
+
+
+def test_tiff_manager_bounds_open_compressed_files(tmp_path, monkeypatch):
+    from pymif.microscope_manager.utils import tiff_planes
+
+    live, peak = [], []
+
+    class CountedTiff(tiff_planes._TiledTiff):
+        def __init__(self, path):
+            super().__init__(path)
+            live.append(self)
+            peak.append(len(live))
+
+        def close(self):
+            live.remove(self)
+            super().close()
+
+    pool = tiff_planes.get_tiled_tiff_pool()
+    monkeypatch.setattr(pool, "opener", CountedTiff)
+    monkeypatch.setattr(pool, "max_open", 2)
+    for t in range(5):
+        tifffile.imwrite(tmp_path / f"frame_t{t}.tif", _stack(t, 0), compression="zlib", metadata={"axes": "ZYX"})
+
+    d = mm.TiffManager(str(tmp_path / "frame_t*.tif"), axes="ZYX")
+    expected = np.stack([_stack(t, 0) for t in range(5)])[:, None]
+    with dask.config.set(scheduler="threads", num_workers=4):
+        np.testing.assert_array_equal(d.data[0].compute(), expected)
+    assert max(peak) <= 2
+
+    d.close()
+    assert live == []
+
+
+def test_handle_leases_are_counted_per_file(tmp_path):
+    from pymif.microscope_manager.utils.handle_pool import FileHandlePool, HandleLease
+
+    path = tmp_path / "stack.tif"
+    tifffile.imwrite(path, _stack(0, 0))
+    pool = FileHandlePool(tifffile.TiffFile, max_open=1)
+    first, second = HandleLease(pool, [path]), HandleLease(pool, [path])
+    with pool.checkout(path) as tif:
+        assert tif.series[0].shape == SHAPE
+    first.close()
+    first.close()
+    assert len(pool) == 1
+    second.close()
+    assert len(pool) == 0
+
+
+def test_probe_parses_metadata_without_data(viventis_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(viventis_manager, "read_tiff_pages", lambda *a, **k: pytest.fail("probe read pixels"))
+    d = mm.ViventisManager(str(viventis_dir), probe=True)
+    assert d.data == []
+    assert d.metadata["size"] == [(SIZE_T, SIZE_C) + SHAPE]
+    assert d.metadata["channel_names"] == ["gfp", "rfp"]
+
+    for t in range(3):
+        tifffile.imwrite(tmp_path / f"frame_t{t}.tif", _stack(t, 0), imagej=True, metadata={"axes": "ZYX"})
+    meta = mm.TiffManager.probe(str(tmp_path / "frame_t*.tif"))
+    assert meta["size"] == [(3, 1) + SHAPE]
+    assert meta["dtype"] == "uint16"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+import tifffile
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.watch import watch_to_zarr
+
+SIZE_T, SIZE_C, SHAPE = 3, 2, (4, 16, 20)
+
+
+def _stack(t, c):
+    return (np.arange(np.prod(SHAPE), dtype=np.uint16).reshape(SHAPE) + 1000 * t + 100 * c).astype(np.uint16)
+
+
+def _companion(root, size_t=SIZE_T):
+    tiffdata = "".join(
+        f'<TiffData FirstT="{t}" FirstC="{c}" FirstZ="0" IFD="0" PlaneCount="{SHAPE[0]}">'
+        f'<UUID FileName="t{t:04d}_c{c}.tif">urn:uuid:{t}-{c}</UUID></TiffData>'
+        for t in range(size_t)
+        for c in range(SIZE_C)
+    )
+    (root / "Position_1.ome").write_text(
+        '<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2016-06"><Image ID="Image:0">'
+        f'<Pixels DimensionOrder="XYZCT" Type="uint16" SizeT="{size_t}" SizeC="{SIZE_C}" '
+        f'SizeZ="{SHAPE[0]}" SizeY="{SHAPE[1]}" SizeX="{SHAPE[2]}" '
+        'PhysicalSizeZ="2.0" PhysicalSizeY="0.5" PhysicalSizeX="0.5" '
+        'PhysicalSizeZUnit="µm" PhysicalSizeYUnit="µm" PhysicalSizeXUnit="µm">'
+        '<Channel ID="Channel:0" Name="gfp"/><Channel ID="Channel:1" Name="rfp"/>'
+        + tiffdata
+        + "</Pixels></Image></OME>"
+    )
+
+
+def _acquire(root, t):
+    for c in range(SIZE_C):
+        tifffile.imwrite(root / f"t{t:04d}_c{c}.tif", _stack(t, c), photometric="minisblack")
+
+
+def test_watch_appends_timepoints_as_they_are_acquired(tmp_path):
+    root = tmp_path / "acquisition"
+    root.mkdir()
+    _companion(root)
+    _acquire(root, 0)
+    out = tmp_path / "live.zarr"
+
+    def acquire_next(t):
+        if t + 1 < SIZE_T:
+            _acquire(root, t + 1)
+
+    written = watch_to_zarr(
+        mm.ViventisManager, str(root), str(out),
+        chunks=(1, 1, 2, 8, 8), num_levels=2, downscale_factor=(1, 2, 2),
+        poll_interval=0, settle_seconds=0, idle_timeout=5, on_timepoint=acquire_next,
+    )
+
+    assert written == [0, 1, 2]
+    z = mm.ZarrManager(str(out))
+    assert z.metadata["size"] == [(SIZE_T, SIZE_C) + SHAPE, (SIZE_T, SIZE_C, 4, 8, 10)]
+    expected = np.stack([np.stack([_stack(t, c) for c in range(SIZE_C)]) for t in range(SIZE_T)])
+    np.testing.assert_array_equal(z.data[0].compute(), expected)
+    np.testing.assert_array_equal(z.data[1].compute(), expected[..., ::2, ::2])
+
+
+def test_watch_resumes_interrupted_ingestion(tmp_path):
+    root = tmp_path / "acquisition"
+    root.mkdir()
+    _companion(root)
+    _acquire(root, 0)
+    out = tmp_path / "live.zarr"
+    kwargs = dict(num_levels=1, poll_interval=0, settle_seconds=0, idle_timeout=0)
+
+    assert watch_to_zarr(mm.ViventisManager, str(root), str(out), **kwargs) == [0]
+
+    _acquire(root, 1)
+    _acquire(root, 2)
+    assert watch_to_zarr(mm.ViventisManager, str(root), str(out), **kwargs) == [1, 2]
+    np.testing.assert_array_equal(mm.ZarrManager(str(out)).data[0][2, 1].compute(), _stack(2, 1))
+
+
+def test_watch_grows_store_past_planned_timepoints(tmp_path):
+    root = tmp_path / "acquisition"
+    root.mkdir()
+    _companion(root, size_t=2)
+    _acquire(root, 0)
+    _acquire(root, 1)
+    out = tmp_path / "live.zarr"
+    kwargs = dict(num_levels=2, downscale_factor=(1, 2, 2), poll_interval=0, settle_seconds=0, idle_timeout=0)
+    assert watch_to_zarr(mm.ViventisManager, str(root), str(out), **kwargs) == [0, 1]
+
+    # The acquisition was extended by one timepoint.
+    _companion(root, size_t=3)
+    _acquire(root, 2)
+    assert watch_to_zarr(mm.ViventisManager, str(root), str(out), **kwargs) == [2]
+
+    z = mm.ZarrManager(str(out))
+    assert z.metadata["size"] == [(3, SIZE_C) + SHAPE, (3, SIZE_C, 4, 8, 10)]
+    np.testing.assert_array_equal(z.data[1][2, 0].compute(), _stack(2, 0)[:, ::2, ::2])
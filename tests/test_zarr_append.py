@@ -0,0 +1,63 @@
+# tests/test_zarr_append.py
+from __future__ import annotations
+
+import dask.array as da
+import numpy as np
+import pytest
+
+import pymif.microscope_manager as mm
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_append_timepoints_in_place(tmp_path, image_level0, image_pyramid, metadata, zarr_format):
+    path = tmp_path / "append.zarr"
+    ngff_version = "0.4" if zarr_format == 2 else "0.5"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(path), ngff_version=ngff_version, zarr_format=zarr_format)
+    old_chunks = {p: p.stat().st_mtime_ns for p in path.rglob("*") if p.is_file() and p.name[0].isdigit()}
+
+    new = np.full((1, 2, 4, 16, 16), 7, dtype=np.uint16)
+    d = mm.ZarrManager(str(path), mode="r+")
+    assert d.append(new) == (2, 3)
+
+    assert d.metadata["size"] == [(3, 2, 4, 16, 16), (3, 2, 2, 8, 8), (3, 2, 1, 4, 4)]
+    assert d.bounding_box(0)["t"] == (0, 3)
+    assert all(p.stat().st_mtime_ns == mtime for p, mtime in old_chunks.items())
+
+    reread = mm.ZarrManager(str(path))
+    assert reread.metadata["size"] == d.metadata["size"]
+    np.testing.assert_array_equal(reread.data[0][:2].compute(), image_level0)
+    np.testing.assert_array_equal(reread.data[0][2].compute(), new[0])
+    np.testing.assert_array_equal(reread.data[2][2].compute(), new[0, :, ::4, ::4, ::4])
+
+
+def test_append_rewrites_only_the_partial_last_chunk(tmp_path, image_level0, metadata):
+    path = tmp_path / "append_t2.zarr"
+    level0 = np.concatenate([image_level0, image_level0[:1] + 1])
+    pyramid = [da.from_array(level0[:, :, ::f, ::f, ::f], chunks=(2, 1, 4, 16, 16)) for f in (1, 2, 4)]
+    meta = {**metadata, "size": [p.shape for p in pyramid], "chunksize": [p.chunksize for p in pyramid]}
+    mm.ArrayManager(pyramid, meta).to_zarr(str(path), zarr_format=2, ngff_version="0.4")
+    old_chunks = {p: p.stat().st_mtime_ns for p in path.rglob("*") if p.is_file() and p.name[0].isdigit()}
+
+    new = np.full((1, 2, 4, 16, 16), 7, dtype=np.uint16)
+    d = mm.ZarrManager(str(path), mode="r+")
+    assert d.append(new) == (3, 4)
+
+    # T chunks of 2: chunks of timepoints 0-1 are kept, those of 2-3 are rewritten with timepoint 2 preserved.
+    kept = {p for p in old_chunks if p.relative_to(path).parts[1] == "0"}
+    assert kept and all(p.stat().st_mtime_ns == old_chunks[p] for p in kept)
+    np.testing.assert_array_equal(d.data[0][:3].compute(), level0)
+    np.testing.assert_array_equal(d.data[0][3].compute(), new[0])
+
+
+def test_append_channels_extends_omero(tmp_path, image_pyramid, metadata):
+    path = tmp_path / "append_c.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(path))
+
+    d = mm.ZarrManager(str(path), mode="a")
+    d.append(np.ones((2, 1, 4, 16, 16), dtype=np.uint16), axis="c")
+
+    assert d.metadata["channel_names"] == ["A", "B", "channel_2"]
+    with pytest.raises(ValueError, match="must have shape"):
+        d.append(np.ones((1, 3, 4, 8, 8), dtype=np.uint16))
+    with pytest.raises(ValueError, match="Can only append"):
+        d.append(np.ones((2, 3, 1, 16, 16), dtype=np.uint16), axis="z")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils import ngff
+
+
+@pytest.fixture
+def copy_calls(monkeypatch):
+    calls = []
+    original = ngff.copy_chunks
+
+    def spy(source, target, **kwargs):
+        calls.append((source.path, target.path))
+        return original(source, target, **kwargs)
+
+    monkeypatch.setattr(ngff, "copy_chunks", spy)
+    return calls
+
+
+@pytest.fixture
+def source_zarr(tmp_path, image_pyramid, metadata):
+    path = tmp_path / "source.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(path), compressor="blosc", compressor_level=1)
+    return path
+
+
+def test_resave_copies_encoded_chunks(tmp_path, source_zarr, image_pyramid, copy_calls):
+    d = mm.ZarrManager(str(source_zarr), mode="r")
+    d.update_metadata({"channel_names": ["X", "Y"]})
+
+    out = tmp_path / "copy.zarr"
+    d.to_zarr(str(out), compressor="blosc", compressor_level=1)
+
+    assert len(copy_calls) == 3
+    reread = mm.ZarrManager(str(out), mode="r")
+    assert reread.metadata["channel_names"] == ["X", "Y"]
+    for level, expected in zip(reread.data, image_pyramid):
+        np.testing.assert_array_equal(level.compute(), expected.compute())
+    assert reread.raw.occupancy is not None
+
+
+def test_codec_change_reencodes(tmp_path, source_zarr, copy_calls):
+    d = mm.ZarrManager(str(source_zarr), mode="r")
+
+    d.to_zarr(str(tmp_path / "other_level.zarr"), compressor="blosc", compressor_level=5)
+    d = mm.ZarrManager(str(source_zarr), mode="r")
+    d.to_zarr(str(tmp_path / "v2.zarr"), zarr_format=2, compressor="blosc", compressor_level=1)
+
+    assert copy_calls == []
+
+
+def test_transformed_dataset_is_not_copied(tmp_path, source_zarr, image_level0, copy_calls):
+    d = mm.ZarrManager(str(source_zarr), mode="r")
+    d.subset_dataset(Z=[0, 1], rebuild_pyramid=True)
+    assert not d.raw.is_zarr_backed()
+
+    out = tmp_path / "subset.zarr"
+    d.to_zarr(str(out), compressor="blosc", compressor_level=1)
+
+    assert copy_calls == []
+    reread = mm.ZarrManager(str(out), mode="r")
+    np.testing.assert_array_equal(reread.data[0].compute(), image_level0[:, :, 0:2])
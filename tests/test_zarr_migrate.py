@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+import zarr
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils import migrate as migrate_module
+from pymif.microscope_manager.utils.migrate import JOURNAL_NAME, migrate_to_v05
+
+
+@pytest.fixture
+def v04_zarr(tmp_path, image_pyramid, metadata):
+    path = tmp_path / "source_v04.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(
+        str(path), zarr_format=2, ngff_version="0.4", compressor="blosc", compressor_level=1
+    )
+    return path
+
+
+def _assert_same_data(path, image_pyramid):
+    reread = mm.ZarrManager(str(path), mode="r")
+    assert reread.metadata["ngff_version"] == "0.5"
+    assert reread.metadata["zarr_format"] == 3
+    for level, expected in zip(reread.data, image_pyramid):
+        np.testing.assert_array_equal(level.compute(), expected.compute())
+    return reread
+
+
+def test_migrate_rekeys_compatible_chunks(tmp_path, v04_zarr, image_pyramid, metadata):
+    out = tmp_path / "migrated.zarr"
+    migrate_to_v05(v04_zarr, out)
+
+    reread = _assert_same_data(out, image_pyramid)
+    assert reread.metadata["channel_names"] == metadata["channel_names"]
+
+    root = zarr.open_group(str(out), mode="r")
+    assert root["0"].metadata.dimension_names == ("t", "c", "z", "y", "x")
+    assert isinstance(root["0"].compressors[0], zarr.codecs.BloscCodec)
+    assert not (out / JOURNAL_NAME).exists()
+
+
+def test_migrate_recompresses_into_shards(tmp_path, v04_zarr, image_pyramid):
+    out = tmp_path / "sharded.zarr"
+    migrate_to_v05(v04_zarr, out, compressor="gzip", shard_shape=(1, 1, 4, 16, 16))
+
+    _assert_same_data(out, image_pyramid)
+    root = zarr.open_group(str(out), mode="r")
+    assert root["0"].shards is not None
+    assert isinstance(root["0"].compressors[0], zarr.codecs.GzipCodec)
+
+
+def test_migrate_resumes_from_journal(tmp_path, v04_zarr, image_pyramid, monkeypatch):
+    original = migrate_module._run_unit
+    calls = []
+
+    def counting(plan, unit, move):
+        calls.append(unit)
+        original(plan, unit, move)
+
+    monkeypatch.setattr(migrate_module, "_run_unit", counting)
+    migrate_to_v05(v04_zarr, tmp_path / "full.zarr", max_workers=1)
+    total = len(calls)
+
+    def failing(plan, unit, move):
+        if len(calls) == total + 5:
+            raise RuntimeError("interrupted")
+        counting(plan, unit, move)
+
+    out = tmp_path / "resumed.zarr"
+    monkeypatch.setattr(migrate_module, "_run_unit", failing)
+    with pytest.raises(RuntimeError):
+        migrate_to_v05(v04_zarr, out, max_workers=1)
+    journal = json.loads((out / JOURNAL_NAME).read_text())
+    assert journal["source"] == str(v04_zarr.resolve())
+
+    calls.clear()
+    monkeypatch.setattr(migrate_module, "_run_unit", counting)
+    migrate_to_v05(v04_zarr, out, max_workers=1)
+
+    assert 0 < len(calls) < total
+    _assert_same_data(out, image_pyramid)
+    assert not (out / JOURNAL_NAME).exists()
+
+
+def test_migrate_resume_restarts_arrays_with_other_codecs(tmp_path, v04_zarr, image_pyramid, monkeypatch):
+    original = migrate_module._run_unit
+    calls = []
+
+    def failing(plan, unit, move):
+        if len(calls) == 5:
+            raise RuntimeError("interrupted")
+        calls.append(unit)
+        original(plan, unit, move)
+
+    out = tmp_path / "resumed.zarr"
+    monkeypatch.setattr(migrate_module, "_run_unit", failing)
+    with pytest.raises(RuntimeError):
+        migrate_to_v05(v04_zarr, out, compressor="gzip", max_workers=1)
+
+    monkeypatch.setattr(migrate_module, "_run_unit", original)
+    migrate_to_v05(v04_zarr, out, compressor="blosc", max_workers=1)
+
+    _assert_same_data(out, image_pyramid)
+    root = zarr.open_group(str(out), mode="r")
+    for name, array in root.arrays():
+        assert isinstance(array.compressors[0], zarr.codecs.BloscCodec), name
+        assert not (out / name / "c" / "0" / "0" / "0" / "0" / "0").read_bytes().startswith(b"\x1f\x8b")
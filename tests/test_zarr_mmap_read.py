@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import zarr
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.mmap_zarr import is_mmap_readable, mmap_from_zarr
+
+
+@pytest.mark.parametrize("zarr_format,ngff_version", [(2, "0.4"), (3, "0.5")])
+def test_uncompressed_levels_are_memory_mapped(tmp_path, image_pyramid, metadata, zarr_format, ngff_version):
+    out = tmp_path / f"mmap_v{zarr_format}.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(
+        str(out),
+        ngff_version=ngff_version,
+        zarr_format=zarr_format,
+        compressor=None,
+    )
+
+    d = mm.ZarrManager(str(out), mode="r")
+
+    for level, zarr_level in zip(d.data, d.zarr_data):
+        assert is_mmap_readable(zarr_level)
+        assert level.name.startswith("mmap-zarr-")
+        np.testing.assert_array_equal(level.compute(), zarr_level[...])
+
+
+def test_compressed_levels_use_zarr_codecs(tmp_path, image_pyramid, metadata):
+    out = tmp_path / "compressed.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(out), compressor="blosc")
+
+    d = mm.ZarrManager(str(out), mode="r")
+
+    assert not is_mmap_readable(d.zarr_data[0])
+    assert not d.data[0].name.startswith("mmap-zarr-")
+    np.testing.assert_array_equal(d.data[0].compute(), d.zarr_data[0][...])
+
+
+def test_mmap_fills_missing_chunks_and_handles_edges(tmp_path):
+    root = zarr.open_group(str(tmp_path / "edges.zarr"), mode="w", zarr_format=3)
+    z = root.create_array("0", shape=(5, 7), chunks=(2, 3), dtype="uint16", compressors=None, fill_value=9)
+    z[0:2, 0:3] = np.arange(6, dtype=np.uint16).reshape(2, 3)
+    z[4:5, 6:7] = 42
+
+    arr = mmap_from_zarr(z)
+
+    assert arr.chunks == ((2, 2, 1), (3, 3, 1))
+    np.testing.assert_array_equal(arr.compute(), z[...])
+    np.testing.assert_array_equal(mmap_from_zarr(z, chunks=(5, 7)).compute(), z[...])
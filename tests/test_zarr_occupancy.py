@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import dask.array as da
+import numpy as np
+import pytest
+import zarr
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager.utils.occupancy import get_occupancy_index, occupancy_mask
+
+
+@pytest.fixture
+def sparse_pyramid():
+    lvl0 = np.zeros((1, 1, 8, 32, 32), dtype=np.uint16)
+    lvl0[0, 0, 2:5, 9:14, 20:23] = 3
+    lvl1 = lvl0[:, :, ::2, ::2, ::2]
+    return [
+        da.from_array(lvl0, chunks=(1, 1, 4, 8, 8)),
+        da.from_array(lvl1, chunks=(1, 1, 4, 8, 8)),
+    ]
+
+
+@pytest.fixture
+def sparse_metadata():
+    return {
+        "scales": [(1.0, 1.0, 1.0), (2.0, 2.0, 2.0)],
+        "units": ("micrometer", "micrometer", "micrometer"),
+        "time_increment": 1.0,
+        "time_increment_unit": "second",
+        "channel_names": ["A"],
+        "channel_colors": ["FFFFFF"],
+        "dtype": "uint16",
+        "axes": "tczyx",
+    }
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_occupancy_index_written_at_export(tmp_path, sparse_pyramid, sparse_metadata, zarr_format):
+    out = tmp_path / "sparse.zarr"
+    mm.ArrayManager(sparse_pyramid, sparse_metadata).to_zarr(str(out), zarr_format=zarr_format)
+
+    levels = get_occupancy_index(zarr.open_group(str(out), mode="r"))
+    assert len(levels) == 2
+
+    mask = occupancy_mask(levels[0])
+    assert mask.shape == (1, 1, 2, 4, 4)
+    assert mask.sum() == 2
+    assert mask[0, 0, 0, 1, 2] and mask[0, 0, 1, 1, 2]
+    assert levels[0]["bounding_box"] == [[0, 1], [0, 1], [2, 5], [9, 14], [20, 23]]
+
+
+def test_bounding_box_and_masked_reads(tmp_path, sparse_pyramid, sparse_metadata):
+    out = tmp_path / "sparse.zarr"
+    mm.ArrayManager(sparse_pyramid, sparse_metadata).to_zarr(str(out))
+
+    d = mm.ZarrManager(str(out), mode="r")
+
+    assert d.bounding_box() == {"t": (0, 1), "c": (0, 1), "z": (2, 5), "y": (9, 14), "x": (20, 23)}
+    assert d.data[0].name.startswith("occupancy-zarr-")
+    np.testing.assert_array_equal(d.data[0].compute(), sparse_pyramid[0].compute())
+    np.testing.assert_array_equal(d.data[1].compute(), sparse_pyramid[1].compute())
+
+
+def test_region_writes_keep_or_drop_the_index(tmp_path, sparse_pyramid, sparse_metadata):
+    out = tmp_path / "sparse.zarr"
+    mm.ArrayManager(sparse_pyramid, sparse_metadata).to_zarr(str(out))
+
+    d = mm.ZarrManager(str(out), mode="a")
+    inside = np.full((1, 1, 1, 2, 2), 5, dtype=np.uint16)
+    d.write_image_region(inside, t=slice(0, 1), c=slice(0, 1), z=slice(2, 3), y=slice(10, 12), x=slice(20, 22))
+    assert d.bounding_box()["x"] == (20, 23)
+
+    # Writing into chunks flagged empty removes the index rather than merging into it.
+    patch = np.full((1, 1, 2, 4, 4), 7, dtype=np.uint16)
+    d.write_image_region(patch, t=slice(0, 1), c=slice(0, 1), z=slice(6, 8), y=slice(28, 32), x=slice(0, 4))
+
+    assert get_occupancy_index(zarr.open_group(str(out), mode="r")) is None
+    with pytest.raises(ValueError):
+        d.bounding_box()
+    np.testing.assert_array_equal(d.data[0][0, 0, 6:8, 28:32, 0:4].compute(), 7)
+
+
+def test_bounding_box_requires_index(tmp_path, sparse_pyramid, sparse_metadata):
+    out = tmp_path / "no_index.zarr"
+    mm.ArrayManager(sparse_pyramid, sparse_metadata).to_zarr(str(out), occupancy_index=False)
+
+    d = mm.ZarrManager(str(out), mode="r")
+
+    assert get_occupancy_index(d.root) is None
+    with pytest.raises(ValueError):
+        d.bounding_box()
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_chunks_written_by_other_tools_are_read(tmp_path, sparse_pyramid, sparse_metadata, zarr_format):
+    out = tmp_path / "sparse.zarr"
+    mm.ArrayManager(sparse_pyramid, sparse_metadata).to_zarr(str(out), zarr_format=zarr_format)
+
+    # Another tool writes into chunks the index flags as empty.
+    zarr.open_group(str(out), mode="a")["0"][0, 0, 6:8, 0:4, 0:4] = 9
+
+    d = mm.ZarrManager(str(out), mode="r")
+    assert d.data[0].name.startswith("occupancy-zarr-")
+    np.testing.assert_array_equal(d.data[0][0, 0, 6:8, 0:4, 0:4].compute(), 9)
+    np.testing.assert_array_equal(d.data[0][0, 0, :6].compute(), sparse_pyramid[0][0, 0, :6].compute())
+
+
+def test_export_with_index_reads_each_block_once(tmp_path, sparse_pyramid, sparse_metadata):
+    calls = []
+
+    def count(block):
+        calls.append(block.shape)
+        return block
+
+    levels = [level.map_blocks(count, dtype=level.dtype) for level in sparse_pyramid]
+    calls.clear()
+    mm.ArrayManager(levels, sparse_metadata).to_zarr(str(tmp_path / "sparse.zarr"))
+
+    assert len(calls) == sum(level.npartitions for level in levels)
@@ -102,4 +102,16 @@ def test_round_trip_metadata_v05(tmp_path, image_pyramid, metadata):
     )
 
     reread = mm.ZarrManager(str(out), mode="r")
-    _assert_metadata_equal_basic(metadata, reread.metadata)
\ No newline at end of file
+    _assert_metadata_equal_basic(metadata, reread.metadata)
+
+def test_probe_matches_full_read(tmp_path, image_pyramid, metadata):
+    out = tmp_path / "probe.zarr"
+    mm.ArrayManager(image_pyramid, metadata).to_zarr(str(out), ngff_version="0.5", zarr_format=3)
+
+    probed = mm.ZarrManager.probe(str(out))
+    full = mm.ZarrManager(str(out)).metadata
+
+    _assert_metadata_equal_basic(full, probed)
+    assert probed["size"] == full["size"]
+    assert probed["chunksize"] == full["chunksize"]
+    assert probed["scales"] == full["scales"]
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+import dask.array as da
+import numpy as np
+import pytest
+
+import pymif.microscope_manager as mm
+from pymif.microscope_manager import zeiss_manager
+
+CZI_XML = """<ImageDocument><Metadata>
+<Scaling><Items>
+<Distance Id="X"><Value>5e-07</Value></Distance>
+<Distance Id="Y"><Value>5e-07</Value></Distance>
+<Distance Id="Z"><Value>2e-06</Value></Distance>
+</Items></Scaling>
+<Information><Image><PixelType>Gray16</PixelType><BitsPerPixel>16</BitsPerPixel></Image></Information>
+<DisplaySetting><Channels><Channel><Color>#FF00FF00</Color></Channel></Channels></DisplaySetting>
+</Metadata></ImageDocument>"""
+
+
+class FakeBioImage:
+    """Stand-in for ``bioio.BioImage`` that counts how often the file is opened and read."""
+
+    opened = 0
+    dask_reads = 0
+    shapes = {"S0": (1, 1, 4, 32, 32), "S1": (2, 1, 3, 16, 16)}
+    xml = CZI_XML
+
+    def __init__(self, path, **kwargs):
+        type(self).opened += 1
+        self.scenes = tuple(self.shapes)
+        self.metadata = ET.fromstring(self.xml)
+        self._scene = 0
+
+    @property
+    def current_scene_index(self):
+        return self._scene
+
+    @property
+    def channel_names(self):
+        return [f"gfp-{self.scenes[self._scene]}"]
+
+    def set_scene(self, index):
+        self._scene = index
+
+    def get_image_dask_data(self, order):
+        type(self).dask_reads += 1
+        return da.zeros(self.shapes[self.scenes[self._scene]], dtype=np.uint16, chunks=(1, 1, 1, 16, 16))
+
+
+@pytest.fixture
+def fake_czi(monkeypatch):
+    monkeypatch.setattr(FakeBioImage, "opened", 0)
+    monkeypatch.setattr(FakeBioImage, "dask_reads", 0)
+    monkeypatch.setattr(zeiss_manager, "BioImage", FakeBioImage)
+    return FakeBioImage
+
+
+@pytest.fixture
+def sample_czi(tmp_path):
+    """Small CZI file whose layout does not match the fake BioImage, so BioImage's arrays are used."""
+    pyczi = pytest.importorskip("pylibCZIrw.czi")
+    path = tmp_path / "sample.czi"
+    with pyczi.create_czi(str(path), exist_ok=True) as w:
+        w.write(np.zeros((8, 8), np.uint16), plane={"T": 0, "C": 0, "Z": 0}, location=(0, 0))
+    return str(path)
+
+
+def test_zeiss_opens_file_once_across_scenes(fake_czi, sample_czi):
+    d = zeiss_manager.ZeissManager(sample_czi)
+    assert d.metadata["size"] == [(1, 1, 4, 32, 32)]
+    assert d.metadata["scales"] == [(2.0, 0.5, 0.5)]
+    assert d.metadata["channel_colors"] == ["#00FF00"]
+
+    d.read(scene_index=1)
+    assert d.scene_name == "S1"
+    assert d.metadata["size"] == [(2, 1, 3, 16, 16)]
+
+    assert fake_czi.opened == 1
+    assert fake_czi.dask_reads == 2
+
+
+def test_zeiss_scene_view_leaves_parent_scene(fake_czi, sample_czi):
+    d = zeiss_manager.ZeissManager(sample_czi)
+    view = d.scene(1)
+    assert view.metadata["size"] == [(2, 1, 3, 16, 16)]
+    assert view.metadata["channel_names"] == ["gfp-S1"]
+
+    assert d.scene_name == "S0" and d._czi.current_scene_index == 0
+    assert d._parse_metadata()["channel_names"] == ["gfp-S0"]
+    assert d._parse_metadata()["size"] == [(1, 1, 4, 32, 32)]
+    assert fake_czi.opened == 1
+
+
+def test_zeiss_exposes_native_pyramid_levels(fake_czi, tmp_path, monkeypatch):
+    pyczi = pytest.importorskip("pylibCZIrw.czi")
+    base = np.random.default_rng(0).integers(0, 1000, (2, 61, 80), dtype=np.uint16)
+    path = tmp_path / "slide.czi"
+    with pyczi.create_czi(str(path), exist_ok=True) as w:
+        for c in range(2):
+            w.write(base[c], plane={"T": 0, "C": c, "Z": 0}, location=(0, 0))
+
+    pyramid = "<Dimensions><S><Scenes><Scene Index='0'><PyramidInfo><PyramidLayersCount>2</PyramidLayersCount><MinificationFactor>2</MinificationFactor></PyramidInfo></Scene></Scenes></S></Dimensions>"
+    monkeypatch.setattr(fake_czi, "shapes", {"S0": (1, 2, 1, 61, 80)})
+    monkeypatch.setattr(fake_czi, "xml", CZI_XML.replace("<Information><Image>", "<Information><Image>" + pyramid))
+
+    d = zeiss_manager.ZeissManager(str(path), chunks=(1, 1, 1, 16, 16))
+    assert d.metadata["size"] == [(1, 2, 1, 61, 80), (1, 2, 1, 31, 40), (1, 2, 1, 16, 20)]
+    assert d.metadata["scales"] == [(2.0, 0.5, 0.5), (2.0, 1.0, 1.0), (2.0, 2.0, 2.0)]
+    opened = []
+    opener = zeiss_manager._czi_pool.opener
+    monkeypatch.setattr(zeiss_manager._czi_pool, "opener", lambda p: opened.append(p) or opener(p))
+    np.testing.assert_array_equal(d.data[0][0, :, 0].compute(scheduler="synchronous"), base)
+    np.testing.assert_array_equal(d.data[1][0, :, 0].compute(scheduler="synchronous"), base[:, ::2, ::2])
+    np.testing.assert_array_equal(d.data[2][0, :, 0].compute(scheduler="synchronous"), base[:, ::4, ::4])
+    # One reader serves every block of every level, full resolution included, and is closed with the manager.
+    assert opened == [str(path)]
+    assert fake_czi.dask_reads == 1
+    d.close()
+    assert len(zeiss_manager._czi_pool) == 0
+
+    d.build_pyramid(num_levels=3, downscale_factor=(1, 2, 2), reuse_levels=True)
+    assert d.data[0].name.startswith("czi-")
+    assert any(str(k[0]).startswith("czi-") for k in d.data[1].dask.keys() if isinstance(k, tuple))
+
+
+def test_zeiss_full_resolution_reads_scenes_with_pooled_reader(fake_czi, tmp_path, monkeypatch):
+    pyczi = pytest.importorskip("pylibCZIrw.czi")
+    rng = np.random.default_rng(0)
+    planes = {0: rng.integers(1, 1000, (2, 30, 40), dtype=np.uint16), 1: rng.integers(1, 1000, (2, 10, 20), dtype=np.uint16)}
+    path = tmp_path / "scenes.czi"
+    with pyczi.create_czi(str(path), exist_ok=True) as w:
+        for c in range(2):
+            w.write(planes[0][c], plane={"T": 0, "C": c, "Z": 0}, location=(5, 7), scene=0)
+            w.write(planes[1][c], plane={"T": 0, "C": c, "Z": 0}, location=(100, 100), scene=1)
+    monkeypatch.setattr(fake_czi, "shapes", {"S0": (1, 2, 1, 30, 40), "S1": (1, 2, 1, 10, 20)})
+
+    d = zeiss_manager.ZeissManager(str(path), scene_index=1, chunks=(1, 1, 1, 8, 8))
+    assert d.data[0].name.startswith("czi-")
+    np.testing.assert_array_equal(d.data[0][0, :, 0].compute(), planes[1])
+    np.testing.assert_array_equal(d.scene(0).data[0][0, :, 0].compute(), planes[0])
+    d.close()
+
+
+def test_zeiss_level_blocks_pad_with_background(monkeypatch):
+    class ShortReader:
+        def read(self, roi, plane, scene, zoom):
+            # libCZI may round the zoomed size down by a pixel.
+            return np.full((roi[3] // 2 - 1, roi[2] // 2 - 1, 1), 5, dtype=np.uint16)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(zeiss_manager._czi_pool, "opener", lambda p: ShortReader())
+    block = zeiss_manager._read_czi_level_block(
+        path="padded.czi", scene=None, origin=(0, 0), factor=2, plane_dims="TCZ", block_dtype=np.uint16,
+        block_info={None: {"array-location": [(0, 1), (0, 1), (0, 1), (0, 8), (0, 8)]}},
+    )
+    zeiss_manager._czi_pool.evict(["padded.czi"])
+
+    assert (block[..., :7, :7] == 5).all()
+    assert (block[..., 7, :] == 0).all() and (block[..., :, 7] == 0).all()
+
+
+@pytest.mark.parametrize("layout", ["stores", "groups"])
+def test_zeiss_writes_all_scenes_from_one_reader(fake_czi, sample_czi, tmp_path, layout):
+    d = zeiss_manager.ZeissManager(sample_czi)
+    out = tmp_path / "scenes"
+    paths = d.scenes_to_zarr(str(out), layout=layout, max_workers=2, memory_budget_mb=1, zarr_format=3, ngff_version="0.5")
+
+    assert fake_czi.opened == 1
+    assert d.scene_name == "S0"
+    if layout == "stores":
+        assert paths == [str(out / "S0.zarr"), str(out / "S1.zarr")]
+        assert mm.ZarrManager(paths[1]).metadata["size"] == [(2, 1, 3, 16, 16)]
+    else:
+        reread = mm.ZarrManager(str(out))
+        assert reread.metadata["size"] == [(1, 1, 4, 32, 32)]
+        assert reread.groups["S1"].metadata["size"] == [(2, 1, 3, 16, 16)]
+
+
+def test_zeiss_probe_skips_bioimage(fake_czi, tmp_path, monkeypatch):
+    pyczi = pytest.importorskip("pylibCZIrw.czi")
+    path = tmp_path / "slide.czi"
+    with pyczi.create_czi(str(path), exist_ok=True) as w:
+        for c in range(2):
+            w.write(np.zeros((30, 40), np.uint16), plane={"T": 0, "C": c, "Z": 0}, location=(5, 7), scene=0)
+            w.write(np.zeros((10, 20), np.uint16), plane={"T": 0, "C": c, "Z": 0}, location=(100, 100), scene=1)
+        w.write_metadata(scale_x=5e-07, scale_y=5e-07, scale_z=2e-06)
+
+    d = zeiss_manager.ZeissManager(str(path), scene_index=1, probe=True)
+
+    assert fake_czi.opened == 0
+    assert d.data == []
+    assert d.scenes == ("0", "1")
+    assert d.metadata["size"] == [(1, 2, 1, 10, 20)]
+    assert d.metadata["scales"] == [(2.0, 0.5, 0.5)]
+
+    cached = zeiss_manager.ZeissManager(str(path), scene_index=1, probe=True, cache_metadata=True)
+    assert (tmp_path / ".slide.czi.pymif-metadata.json").exists()
+    monkeypatch.setattr(
+        zeiss_manager.ZeissManager, "_open_layout", lambda self: pytest.fail("cached probe opened the file")
+    )
+    again = zeiss_manager.ZeissManager(str(path), scene_name="1", probe=True, cache_metadata=True)
+    assert again.scenes == cached.scenes == d.scenes
+    assert again.metadata == cached.metadata == d.metadata